@@ -0,0 +1,103 @@
+"""compare the receive path of the reader and session before and after single-pass decoding
+
+run with `python benchmarks/bench_decode.py`, install orjson to include it
+"""
+
+import json
+import time
+
+from mcp import types
+
+from easymcp.client import decoding
+from easymcp.client.decoding import decode_message
+
+ROUNDS = 20_000
+
+
+def make_messages() -> list[str]:
+    """a mix of progress notifications, sampling requests and tool results"""
+
+    progress = {
+        "jsonrpc": "2.0",
+        "method": "notifications/progress",
+        "params": {"progressToken": "token", "progress": 3, "total": 10},
+    }
+    sampling = {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "method": "sampling/createMessage",
+        "params": {
+            "messages": [
+                {"role": "user", "content": {"type": "text", "text": "hello " * 20}}
+            ],
+            "maxTokens": 100,
+        },
+    }
+    result = {
+        "jsonrpc": "2.0",
+        "id": "request",
+        "result": {
+            "content": [{"type": "text", "text": "result " * 50}] * 4,
+            "isError": False,
+        },
+    }
+
+    return [json.dumps(message) for message in (progress, sampling, result)]
+
+
+def before(data: str):
+    """previous path: envelope, dump and re-validate as a union, then the result"""
+
+    message = types.JSONRPCMessage.model_validate_json(data)
+    root = message.root
+
+    if isinstance(root, types.JSONRPCNotification):
+        types.ServerNotification.model_validate(
+            root.model_dump(by_alias=True, exclude_none=True)
+        )
+    elif isinstance(root, types.JSONRPCRequest):
+        types.ServerRequest.model_validate(
+            root.model_dump(by_alias=True, exclude_none=True)
+        )
+    elif isinstance(root, types.JSONRPCResponse):
+        types.CallToolResult.model_validate(root.result)
+
+
+def after(data: str):
+    """single pass: requests and notifications come out typed, the result once"""
+
+    message = decode_message(data)
+    if isinstance(message.root, types.JSONRPCResponse):
+        types.CallToolResult.model_validate(message.root.result)
+
+
+def measure(label: str, decode, messages: list[str]) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for data in messages:
+            decode(data)
+    elapsed = time.perf_counter() - start
+
+    rate = ROUNDS * len(messages) / elapsed
+    print(f"{label:<22} {rate:>12,.0f} msg/s")
+    return rate
+
+
+def main():
+    messages = make_messages()
+
+    slow = measure("before", before, messages)
+
+    loads = decoding.loads
+    decoding.loads = json.loads
+    fast = measure("after (json)", after, messages)
+    decoding.loads = loads
+
+    if decoding.orjson is not None:
+        fast = measure("after (orjson)", after, messages)
+
+    print(f"\nspeedup: {fast / slow:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
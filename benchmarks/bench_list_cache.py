@@ -0,0 +1,85 @@
+"""compare deep-copy list caching against immutable snapshots
+
+run with `python benchmarks/bench_list_cache.py`
+"""
+
+import asyncio
+import time
+
+from mcp import types
+
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.snapshots import ListToolsSnapshot
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+TOOLS = 300
+ROUNDS = 50
+
+
+def make_payload() -> dict:
+    """a tools/list result with large JSON schemas"""
+
+    properties = {
+        f"field_{i}": {
+            "type": "object",
+            "description": "a nested parameter " * 4,
+            "properties": {
+                "value": {"type": "string", "enum": [f"option-{j}" for j in range(10)]},
+                "weight": {"type": "number", "minimum": 0, "maximum": 1},
+            },
+        }
+        for i in range(20)
+    }
+
+    return {
+        "tools": [
+            {
+                "name": f"tool_{n}",
+                "description": "does something useful " * 8,
+                "inputSchema": {"type": "object", "properties": properties},
+            }
+            for n in range(TOOLS)
+        ]
+    }
+
+
+def report(label: str, elapsed: float):
+    print(f"{label:<22} {elapsed / ROUNDS * 1e6:>12.1f} us/op")
+
+
+async def main():
+    payload = make_payload()
+
+    # previous behaviour: deep copy when storing and on every cache hit
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = types.ListToolsResult.model_validate(payload)
+        cached = result.model_copy(deep=True)
+    report("deep copy store", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        cached.model_copy(deep=True)
+    before = time.perf_counter() - start
+    report("deep copy hit", before)
+
+    # snapshots: validated once, every hit returns the shared snapshot
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        snapshot = ListToolsSnapshot.model_validate(payload)
+    report("snapshot store", time.perf_counter() - start)
+
+    session = MCPClientSession(StdioTransport(StdioServerParameters(command="true")))
+    session._tools = snapshot
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await session.list_tools()
+    after = time.perf_counter() - start
+    report("snapshot hit", after)
+
+    print(f"\n{TOOLS} tools, cache hit speedup: {before / after:,.0f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
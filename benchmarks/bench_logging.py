@@ -0,0 +1,68 @@
+"""compare eager f-string debug logging of large payloads against log_payload
+
+run with `python benchmarks/bench_logging.py`
+"""
+
+import time
+
+from loguru import logger
+from mcp import types
+
+from easymcp.client.debuglog import log_payload
+
+ROUNDS = 200
+
+# the same call site as written before and after, the last variant is compiled
+# with optimize=1 like `python -O` would
+SOURCE = """
+def eager(message):
+    logger.debug(f"Resolving request: {message}")
+
+def lazy(message):
+    if __debug__:
+        log_payload("Resolving request: {}", message)
+"""
+
+
+def make_message() -> types.JSONRPCResponse:
+    """a tool result of about one megabyte"""
+
+    text = "x" * 1024
+    result = {"content": [{"type": "text", "text": text}] * 1024, "isError": False}
+    return types.JSONRPCResponse(jsonrpc="2.0", id=1, result=result)
+
+
+def build(optimize: int) -> dict:
+    namespace = {"logger": logger, "log_payload": log_payload}
+    exec(compile(SOURCE, "<bench>", "exec", optimize=optimize), namespace)
+    return namespace
+
+
+def measure(label: str, log, message: types.JSONRPCResponse):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        log(message)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed / ROUNDS * 1e6:>12.1f} us/msg")
+
+
+def main():
+    message = make_message()
+    debug, optimized = build(0), build(1)
+
+    logger.remove()
+    sink = logger.add(lambda record: None, level="INFO")
+    print("debug disabled")
+    measure("eager f-string", debug["eager"], message)
+    measure("log_payload", debug["lazy"], message)
+    measure("log_payload, python -O", optimized["lazy"], message)
+
+    logger.remove(sink)
+    logger.add(lambda record: None, level="DEBUG")
+    print("\ndebug enabled")
+    measure("eager f-string", debug["eager"], message)
+    measure("log_payload, truncated", debug["lazy"], message)
+
+
+if __name__ == "__main__":
+    main()
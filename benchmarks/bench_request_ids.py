@@ -0,0 +1,89 @@
+"""compare the per-call overhead of building and correlating tool call requests
+
+run with `python benchmarks/bench_request_ids.py`
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+from loguru import logger
+from mcp import types
+
+from easymcp.client.requestmap import RequestMap
+from easymcp.client.utils import CreateJsonRPCRequest, create_request
+
+ROUNDS = 20_000
+ARGS = {"text": "hello"}
+
+
+def before(request_map: RequestMap) -> types.JSONRPCRequest:
+    """previous path: typed ClientRequest dumped into a request with a uuid4 id"""
+
+    request = types.ClientRequest(
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="echo", arguments=ARGS),
+        )
+    )
+    return CreateJsonRPCRequest(request)
+
+
+def after(request_map: RequestMap) -> types.JSONRPCRequest:
+    """direct builder with an integer id from the session"""
+    return create_request(
+        request_map.next_id(), "tools/call", {"name": "echo", "arguments": ARGS}
+    )
+
+
+async def round_trip(build: Callable[[RequestMap], types.JSONRPCRequest]) -> float:
+    """build, send and resolve requests against an instant in-process responder"""
+
+    queue: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+    request_map = RequestMap(queue)
+    result = {"content": [], "isError": False}
+
+    async def respond():
+        while True:
+            request = (await queue.get()).root
+            response = types.JSONRPCResponse(jsonrpc="2.0", id=request.id, result=result)  # type: ignore[union-attr]
+            request_map.resolve_request(response)
+
+    responder = asyncio.create_task(respond())
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await request_map.send_request(build(request_map))
+    elapsed = time.perf_counter() - start
+
+    responder.cancel()
+    return elapsed
+
+
+def report(label: str, elapsed: float):
+    print(f"{label:<22} {elapsed / ROUNDS * 1e6:>12.1f} us/call")
+
+
+async def main():
+    # keep debug output out of the measurement
+    logger.remove()
+
+    request_map = RequestMap(asyncio.Queue())
+
+    for label, build in (("build before", before), ("build after", after)):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            build(request_map)
+        report(label, time.perf_counter() - start)
+
+    slow = await round_trip(before)
+    report("round trip before", slow)
+
+    fast = await round_trip(after)
+    report("round trip after", fast)
+
+    print(f"\nper-call overhead saved: {(slow - fast) / ROUNDS * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,22 +1,53 @@
+import asyncio
 from inspect import iscoroutinefunction
-from typing import Awaitable, Callable
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Literal,
+    Sequence,
+    overload,
+)
 
+from loguru import logger
 from mcp import types
 from pydantic import AnyUrl
 
+from easymcp.client import metrics
 from easymcp.client.SessionMaker import make_transport, transportTypes
+from easymcp.client.blobs import SpooledBlob, spool_resource
+from easymcp.client.catalog import ToolCatalog
+from easymcp.client.errors import TransportClosedError
+from easymcp.client.metrics import MetricsCollector, Sample
 from easymcp.client.sessions.GenericSession import (
     BaseSessionProtocol,
+    BatchCompatible,
+    HealthCompatible,
+    IterPromptsCompatible,
+    IterResourcesCompatible,
+    InvalidatingCompatible,
+    IterToolsCompatible,
     LifeSpanProtocol,
+    ProgressCallback,
     PromptsCompatible,
+    PushingHealthCompatible,
     PushingPromptsCompatible,
     PushingResourcesCompatible,
     PushingRootsCompatible,
     PushingSamplingCompatible,
     PushingToolsCompatible,
     ResourcesCompatible,
+    SubscribableResourcesCompatible,
     ToolsCompatible,
 )
+from easymcp.client.sessions.pool.main import PooledSession
+from easymcp.client.resourcecache import ResourceCache
+from easymcp.client.resultcache import ToolResultCache
+from easymcp.client.results import PartialResult, StartupReport
+from easymcp.client.supervisor import SupervisorParameters, SupervisorStats
 from easymcp.client.utils import format_server_name
 
 
@@ -35,51 +66,163 @@ class ClientManager:
     default_list_prompts_changed_callback: Callable[[], Awaitable[None]] | None = None
     default_list_resources_changed_callback: Callable[[], Awaitable[None]] | None = None
 
+    default_request_timeout: float | None = None
+
+    result_cache: ToolResultCache | None = None
+    """cache tool results, None calls the server every time"""
+
+    resource_cache: ResourceCache | None = None
+    """cache subscribed resources until the server reports an update, None reads every time"""
+
+    supervisor: SupervisorParameters | None = None
+    """respawn servers whose transport died, None leaves them dead"""
+
+    batching: bool = False
+    """negotiate json-rpc batches with servers started from now on, used by `call_tools`"""
+
+    startup_timeout: float | None = None
+    """seconds a server may take to start, restarts included, None waits forever"""
+
     sessions: dict[str, BaseSessionProtocol] = dict()
 
+    server_parameters: dict[str, transportTypes]
+    supervisor_stats: dict[str, SupervisorStats]
+
+    tool_catalog: ToolCatalog
+
+    _respawn_tasks: dict[str, asyncio.Task[None]]
+    _subscriptions: dict[str, set[str]]
+
     def __init__(self):
-        pass
+        self.sessions = dict()
+        self.server_parameters = dict()
+        self.supervisor_stats = dict()
+        self.tool_catalog = ToolCatalog()
+        self._respawn_tasks = dict()
+        self._subscriptions = dict()
 
-    async def init(self, servers: dict[str, transportTypes]):
-        """initialize the client manager"""
+        metrics.registry.add_collector(self)
 
+    async def init(
+        self,
+        servers: dict[str, transportTypes],
+        parallel: bool = False,
+        max_concurrency: int = 8,
+        startup_timeout: float | None = None,
+    ) -> StartupReport:
+        """initialize the client manager
+
+        by default servers are started one after another and the first failure is
+        raised. with `parallel=True` up to `max_concurrency` servers are started at
+        once and failures are collected in the returned report instead.
+        `startup_timeout` is kept for restarts by the supervisor.
+        """
+
+        if startup_timeout is not None:
+            self.startup_timeout = startup_timeout
+        startup_timeout = self.startup_timeout
+
+        names: dict[str, transportTypes] = dict()
         for server_name, server in servers.items():
             server_name = format_server_name(server_name)
 
-            if server_name in self.sessions:
+            if server_name in self.sessions or server_name in names:
                 raise ValueError(f"Server name {server_name} already exists")
 
+            names[server_name] = server
+
+        if parallel:
+            return await self._start_parallel(names, max_concurrency, startup_timeout)
+
+        report = StartupReport()
+
+        for server_name, server in names.items():
             session = make_transport(server)
+
+            try:
+                await asyncio.wait_for(
+                    self._start_session(server_name, session), startup_timeout
+                )
+            except Exception:
+                await self._discard_session(session)
+                raise
+
             self.sessions[server_name] = session
+            self.server_parameters[server_name] = server
+            report.started.append(server_name)
 
-            await session.init()
+        return report
 
-            if self.default_list_roots_callback is not None:
-                if isinstance(session, PushingRootsCompatible):
-                    await session.register_roots_callback(
-                        self.default_list_roots_callback
+    async def _start_parallel(
+        self,
+        servers: dict[str, transportTypes],
+        max_concurrency: int,
+        startup_timeout: float | None,
+    ) -> StartupReport:
+        """start servers concurrently, collecting failures"""
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _start(name: str, server: transportTypes) -> BaseSessionProtocol:
+            async with semaphore:
+                session = make_transport(server)
+                try:
+                    await asyncio.wait_for(
+                        self._start_session(name, session), startup_timeout
                     )
+                except Exception:
+                    await self._discard_session(session)
+                    raise
+                return session
+
+        results = await asyncio.gather(
+            *(_start(name, server) for name, server in servers.items()),
+            return_exceptions=True,
+        )
 
-            if self.default_sampling_callback is not None:
-                if isinstance(session, PushingSamplingCompatible):
-                    await session.register_sampling_callback(
-                        self.default_sampling_callback
-                    )
+        report = StartupReport()
 
-            if isinstance(session, LifeSpanProtocol):
-                await session.start()
+        for server_name, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to start server {server_name}: {result!r}")
+                report.failed[server_name] = result
+                continue
 
-    async def add_server(self, name: str, transport: transportTypes):
-        """add a server to the manager"""
+            self.sessions[server_name] = result
+            self.server_parameters[server_name] = servers[server_name]
+            report.started.append(server_name)
 
-        name = format_server_name(name)
+        return report
 
-        if name in self.sessions:
-            raise ValueError(f"Session {name} already exists")
+    async def _start_session(self, name: str, session: BaseSessionProtocol):
+        """init a session, register the default callbacks and start it"""
+
+        if isinstance(session, BatchCompatible):
+            session.batching = self.batching
 
-        session = make_transport(transport)
         await session.init()
 
+        if isinstance(session, InvalidatingCompatible):
+            session.add_invalidation_hook(self._make_invalidation_hook(name))
+            if self.default_list_tools_changed_callback is not None:
+                if isinstance(session, PushingToolsCompatible):
+                    await session.register_tools_changed_callback(
+                        self.default_list_tools_changed_callback
+                    )
+        else:
+            # without inline hooks the caches are dropped from the callbacks
+            if isinstance(session, PushingToolsCompatible):
+                await session.register_tools_changed_callback(
+                    self._make_tools_changed_callback(name)
+                )
+            if isinstance(session, SubscribableResourcesCompatible):
+                await session.register_resource_updated_callback(
+                    self._make_resource_updated_callback(name)
+                )
+
         if self.default_list_roots_callback is not None:
             if isinstance(session, PushingRootsCompatible):
                 await session.register_roots_callback(self.default_list_roots_callback)
@@ -88,10 +231,179 @@ class ClientManager:
             if isinstance(session, PushingSamplingCompatible):
                 await session.register_sampling_callback(self.default_sampling_callback)
 
+        if self.default_list_prompts_changed_callback is not None:
+            if isinstance(session, PushingPromptsCompatible):
+                await session.register_prompts_changed_callback(
+                    self.default_list_prompts_changed_callback
+                )
+
+        if self.default_list_resources_changed_callback is not None:
+            if isinstance(session, PushingResourcesCompatible):
+                await session.register_resources_changed_callback(
+                    self.default_list_resources_changed_callback
+                )
+
+        if isinstance(session, PushingHealthCompatible):
+            await session.register_transport_closed_callback(
+                self._make_transport_closed_callback(name, session)
+            )
+
         if isinstance(session, LifeSpanProtocol):
-            await session.start()
+            with metrics.registry.timed("easymcp_handshake", server=name):
+                await session.start()
+
+    def _make_transport_closed_callback(
+        self, name: str, session: BaseSessionProtocol
+    ) -> Callable[[BaseException], Awaitable[None]]:
+        """forget the tools of a server whose transport died, respawn it if supervised"""
+
+        async def _transport_closed(error: BaseException):
+            logger.error(f"Server {name} transport closed: {error!r}")
+            metrics.registry.increment("easymcp_transport_closed_total", server=name)
+            self.tool_catalog.invalidate(name)
+            if self.result_cache is not None:
+                self.result_cache.invalidate(name)
+            self._forget_resources(name)
+
+            if self.supervisor is None or self.sessions.get(name) is not session:
+                return
+
+            if name not in self._respawn_tasks:
+                self._respawn_tasks[name] = asyncio.create_task(
+                    self._respawn(name, session, error)
+                )
+
+        return _transport_closed
+
+    async def _respawn(
+        self, name: str, dead: BaseSessionProtocol, error: BaseException
+    ) -> None:
+        """replace a dead session with a fresh one, backing off between attempts"""
+
+        stats = self.supervisor_stats.setdefault(name, SupervisorStats())
+        stats.last_error = repr(error)
+
+        await self._discard_session(dead)
+
+        attempt = 0
+        try:
+            while self.supervisor is not None and self.sessions.get(name) is dead:
+                policy = self.supervisor
+
+                if policy.max_attempts is not None and attempt >= policy.max_attempts:
+                    logger.error(f"Giving up on server {name} after {attempt} attempts")
+                    stats.gave_up = True
+                    return
+
+                await asyncio.sleep(policy.delay(attempt))
+                attempt += 1
+
+                session = make_transport(self.server_parameters[name])
+                try:
+                    await asyncio.wait_for(
+                        self._start_session(name, session), self.startup_timeout
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to restart server {name}: {e!r}")
+                    await self._discard_session(session)
+                    stats.failed_attempts += 1
+                    metrics.registry.increment(
+                        "easymcp_restart_failures_total", server=name
+                    )
+                    stats.consecutive_failures += 1
+                    stats.last_error = repr(e)
+                    continue
+
+                # the server may have been removed while it was restarting
+                if self.sessions.get(name) is not dead:
+                    await self._discard_session(session)
+                    return
+
+                self.sessions[name] = session
+                self.tool_catalog.invalidate(name)
+                stats.restarts += 1
+                metrics.registry.increment("easymcp_restarts_total", server=name)
+                stats.consecutive_failures = 0
+                stats.gave_up = False
+                logger.info(f"Restarted server {name}")
+                return
+        finally:
+            self._respawn_tasks.pop(name, None)
+
+    def _make_resource_updated_callback(
+        self, name: str
+    ) -> Callable[[str], Awaitable[None]]:
+        """drop the cached contents of a resource the server reported as updated"""
+
+        async def _resource_updated(uri: str):
+            if self.resource_cache is not None:
+                self.resource_cache.updated(name, uri)
+
+        return _resource_updated
+
+    def _forget_resources(self, name: str):
+        """drop cached resources and subscriptions of a server"""
+
+        self._subscriptions.pop(name, None)
+        if self.resource_cache is not None:
+            self.resource_cache.remove(name)
+
+    def _tools_changed(self, name: str):
+        """invalidate the catalog entries and cached results of a single server"""
+
+        self.tool_catalog.invalidate(name)
+        if self.result_cache is not None:
+            self.result_cache.invalidate(name)
+
+    def _make_invalidation_hook(
+        self, name: str
+    ) -> Callable[[types.ServerNotification], None]:
+        """drop the cached state of a server inline, as its notifications arrive"""
+
+        def _invalidate(notification: types.ServerNotification):
+            if isinstance(notification.root, types.ToolListChangedNotification):
+                self._tools_changed(name)
+            elif isinstance(notification.root, types.ResourceUpdatedNotification):
+                if self.resource_cache is not None:
+                    self.resource_cache.updated(name, str(notification.root.params.uri))
+
+        return _invalidate
+
+    def _make_tools_changed_callback(self, name: str) -> Callable[[], Awaitable[None]]:
+        """invalidate the catalog entries of a single server, then notify the user"""
+
+        async def _tools_changed():
+            self._tools_changed(name)
+            if self.default_list_tools_changed_callback is not None:
+                await self.default_list_tools_changed_callback()
+
+        return _tools_changed
+
+    @staticmethod
+    async def _discard_session(session: BaseSessionProtocol):
+        """best effort cleanup of a session that failed to start"""
+
+        if not isinstance(session, LifeSpanProtocol):
+            return
+
+        try:
+            await session.stop()
+        except Exception as e:
+            logger.debug(f"Error while discarding session: {e!r}")
+
+    async def add_server(self, name: str, transport: transportTypes):
+        """add a server to the manager"""
+
+        name = format_server_name(name)
+
+        if name in self.sessions:
+            raise ValueError(f"Session {name} already exists")
+
+        session = make_transport(transport)
+        await self._start_session(name, session)
 
         self.sessions[name] = session
+        self.server_parameters[name] = transport
 
         return True
 
@@ -103,10 +415,24 @@ class ClientManager:
         if name not in self.sessions:
             raise ValueError(f"Session {name} does not exist")
 
+        respawn = self._respawn_tasks.pop(name, None)
+        if respawn is not None:
+            respawn.cancel()
+            try:
+                await respawn
+            except asyncio.CancelledError:
+                pass
+
         session = self.sessions[name]
         if isinstance(session, LifeSpanProtocol):
             await session.stop()
         del self.sessions[name]
+        self.server_parameters.pop(name, None)
+        self.supervisor_stats.pop(name, None)
+        self.tool_catalog.remove(name)
+        if self.result_cache is not None:
+            self.result_cache.invalidate(name)
+        self._forget_resources(name)
 
         return True
 
@@ -115,26 +441,199 @@ class ClientManager:
 
         return list(self.sessions.keys())
 
-    async def list_tools(self, force: bool = False) -> list[types.Tool]:
-        """list tools on all servers"""
+    async def resize_pool(self, name: str, size: int):
+        """change the number of replicas of a pooled server"""
+
+        name = format_server_name(name)
+        session = self.sessions.get(name)
+
+        if session is None:
+            raise ValueError(f"Session {name} does not exist")
+
+        if not isinstance(session, PooledSession):
+            raise ValueError(f"Server {name} is not a pool")
+
+        await session.resize(size)
+
+        parameters = self.server_parameters.get(name)
+        if parameters is not None:
+            self.server_parameters[name] = parameters.model_copy(update={"size": size})
+
+    def server_health(self) -> dict[str, bool]:
+        """liveness of every server, sessions that cannot report it count as healthy"""
+
+        return {
+            name: not isinstance(session, HealthCompatible) or session.healthy
+            for name, session in self.sessions.items()
+        }
+
+    def unhealthy_servers(self) -> list[str]:
+        """names of servers whose transport died"""
+
+        return [name for name, healthy in self.server_health().items() if not healthy]
+
+    def collect_metrics(self) -> Iterable[Sample]:
+        """liveness of every server and the metrics its session reports
+
+        called by `metrics.registry` when a snapshot is taken, samples are
+        labelled with the server name.
+        """
+
+        for name, healthy in self.server_health().items():
+            yield Sample(
+                name="easymcp_server_up", labels={"server": name}, value=healthy
+            )
+
+        for name, session in list(self.sessions.items()):
+            if isinstance(session, MetricsCollector):
+                for sample in session.collect_metrics():
+                    sample.labels["server"] = name
+                    yield sample
+
+    @staticmethod
+    def _check_health(name: str, session: BaseSessionProtocol):
+        """fail fast instead of waiting on a dead transport"""
+
+        if isinstance(session, HealthCompatible) and not session.healthy:
+            raise TransportClosedError(f"Server {name} is not healthy")
+
+    async def _fan_out[R](
+        self,
+        operation: str,
+        capability: type,
+        call: Callable[[Any], Awaitable[R]],
+        timeout: float | None = None,
+        names: Collection[str] | None = None,
+    ) -> tuple[dict[str, R], dict[str, BaseException]]:
+        """run `call` concurrently on every session implementing `capability`
+
+        `names` restricts the call to a subset of servers. returns the results of
+        the sessions that answered within `timeout` and the errors of those that
+        did not, both keyed by server name in server order. every call is timed
+        as `easymcp_<operation>`.
+        """
+
+        sessions = [
+            (name, session)
+            for name, session in self.sessions.items()
+            if isinstance(session, capability) and (names is None or name in names)
+        ]
+
+        async def _call(name: str, session: Any) -> R:
+            with metrics.registry.timed(f"easymcp_{operation}", server=name):
+                return await asyncio.wait_for(call(session), timeout)
+
+        outcomes = await asyncio.gather(
+            *(_call(name, session) for name, session in sessions),
+            return_exceptions=True,
+        )
+
+        results: dict[str, R] = dict()
+        errors: dict[str, BaseException] = dict()
+
+        for (name, _), outcome in zip(sessions, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Server {name} failed to answer: {outcome!r}")
+                errors[name] = outcome
+            else:
+                results[name] = outcome
+
+        return results, errors
+
+    @overload
+    async def list_tools(
+        self,
+        force: bool = False,
+        timeout: float | None = None,
+        partial: Literal[False] = False,
+    ) -> list[types.Tool]: ...
+
+    @overload
+    async def list_tools(
+        self,
+        force: bool = False,
+        timeout: float | None = None,
+        *,
+        partial: Literal[True],
+    ) -> PartialResult[types.Tool]: ...
+
+    async def list_tools(
+        self, force: bool = False, timeout: float | None = None, partial: bool = False
+    ) -> list[types.Tool] | PartialResult[types.Tool]:
+        """list tools on all servers
+
+        servers are queried concurrently, each bounded by `timeout`. with
+        `partial=True` the tools of the servers that answered are returned along
+        with the errors of those that did not, otherwise the first error is raised.
+
+        tools come from `tool_catalog`, only servers whose entries are stale (or
+        that cannot push change notifications) are queried. the returned tools are
+        shared with the catalog and must not be mutated.
+        """
+
+        servers = [
+            name
+            for name, session in self.sessions.items()
+            if isinstance(session, ToolsCompatible)
+        ]
+
+        refresh = [
+            name
+            for name in servers
+            if force
+            or not self.tool_catalog.is_fresh(name)
+            or not isinstance(self.sessions[name], PushingToolsCompatible)
+        ]
+        generations = {name: self.tool_catalog.generation(name) for name in refresh}
+
+        # the catalog decides what is stale, a session cache may predate the change
+        responses, errors = await self._fan_out(
+            "list_tools",
+            ToolsCompatible,
+            lambda session: session.list_tools(force=True),
+            timeout,
+            names=refresh,
+        )
+
+        for name, tools in responses.items():
+            self.tool_catalog.update(
+                name, tools.tools if tools is not None else [], generations[name]
+            )
+
+        for name in errors:
+            self.tool_catalog.invalidate(name)
+
+        if errors and not partial:
+            raise next(iter(errors.values()))
 
         result: list[types.Tool] = []
 
-        for name, session in self.sessions.items():
-            if not isinstance(session, ToolsCompatible):
+        for name in servers:
+            if name in errors:
                 continue
+            result.extend(self.tool_catalog.tools(name))
 
-            tools = await session.list_tools(force=force)
-            if tools is None:
-                continue
-            for tool in tools.tools:
-                tool.name = f"{name}.{tool.name}"
-                result.append(tool)
+        if partial:
+            return PartialResult[types.Tool](items=result, errors=errors)
 
         return result
 
-    async def call_tool(self, name: str, args: dict):
-        """call a tool"""
+    async def call_tool(
+        self,
+        name: str,
+        args: dict,
+        timeout: float | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ):
+        """call a tool
+
+        raises TimeoutError after `timeout` seconds, or `default_request_timeout`
+        if not given. the server is asked to cancel the call. raises
+        TransportClosedError if the server's transport died.
+
+        `progress_callback` receives the progress notifications of the call in
+        order. calls with a progress callback bypass `result_cache`.
+        """
 
         if "." not in name:
             raise ValueError("Tool name must be in the format <server>.<tool>")
@@ -148,34 +647,199 @@ class ClientManager:
         if not isinstance(session, ToolsCompatible):
             raise ValueError(f"Server {server_name} does not support tools")
 
-        return await session.call_tool(tool_name, args)
+        with metrics.registry.timed(
+            "easymcp_call_tool", server=server_name, tool=tool_name
+        ):
+            self._check_health(server_name, session)
+
+            if (
+                self.tool_catalog.is_fresh(server_name)
+                and name not in self.tool_catalog
+            ):
+                raise ValueError(f"Tool {name} not found")
+
+            if progress_callback is not None:
+                return await asyncio.wait_for(
+                    session.call_tool(
+                        tool_name, args, progress_callback=progress_callback
+                    ),
+                    self._timeout(timeout),
+                )
+
+            async def _call() -> types.CallToolResult:
+                return await asyncio.wait_for(
+                    session.call_tool(tool_name, args), self._timeout(timeout)
+                )
+
+            if self.result_cache is None:
+                return await _call()
+
+            return await self.result_cache.get_or_call(
+                server_name, tool_name, args, _call
+            )
+
+    async def call_tools(
+        self,
+        calls: Sequence[tuple[str, dict]],
+        max_concurrency_per_server: int = 4,
+        timeout: float | None = None,
+    ) -> list[types.CallToolResult | BaseException]:
+        """call many tools at once
+
+        calls are `(name, args)` pairs, see `call_tool`. calls run concurrently
+        with at most `max_concurrency_per_server` in flight per server. results
+        are returned in the order of `calls`, a failed call is returned as the
+        exception it raised and does not abort the others.
+
+        servers that negotiated json-rpc batches (see `batching`) get their calls
+        in batches of `max_concurrency_per_server`, one batch at a time. batched
+        calls bypass `result_cache`.
+        """
+
+        if max_concurrency_per_server < 1:
+            raise ValueError("max_concurrency_per_server must be at least 1")
+
+        semaphores: dict[str, asyncio.Semaphore] = dict()
+        batches: dict[str, list[int]] = dict()
+        singles: list[int] = []
+
+        for index, (name, _) in enumerate(calls):
+            server_name, _, tool_name = name.partition(".")
+            session = self.sessions.get(server_name)
+
+            if tool_name and isinstance(session, BatchCompatible):
+                if session.supports_batches:
+                    batches.setdefault(server_name, []).append(index)
+                    continue
+
+            singles.append(index)
+            if server_name not in semaphores:
+                semaphores[server_name] = asyncio.Semaphore(max_concurrency_per_server)
+
+        results: list[types.CallToolResult | BaseException] = [
+            RuntimeError("Call was not made")
+        ] * len(calls)
+
+        async def _call(index: int) -> types.CallToolResult:
+            name, args = calls[index]
+            async with semaphores[name.split(".", 1)[0]]:
+                return await self.call_tool(name, args, timeout)
+
+        async def _call_batches(server_name: str, indices: list[int]):
+            for start in range(0, len(indices), max_concurrency_per_server):
+                chunk = indices[start : start + max_concurrency_per_server]
+                responses = await self._call_batch(server_name, chunk, calls, timeout)
+                for index, result in zip(chunk, responses):
+                    results[index] = result
+
+        single_results: list[types.CallToolResult | BaseException]
+        single_results, _ = await asyncio.gather(
+            asyncio.gather(
+                *(_call(index) for index in singles), return_exceptions=True
+            ),
+            asyncio.gather(
+                *(_call_batches(name, indices) for name, indices in batches.items())
+            ),
+        )
 
-    async def list_resources(self) -> list[types.Resource]:
-        """list resources on all servers"""
+        for index, result in zip(singles, single_results):
+            results[index] = result
 
-        result: list[types.Resource] = []
+        return results
 
-        for name, session in self.sessions.items():
-            if not isinstance(session, ResourcesCompatible):
+    async def _call_batch(
+        self,
+        server_name: str,
+        indices: list[int],
+        calls: Sequence[tuple[str, dict]],
+        timeout: float | None,
+    ) -> list[types.CallToolResult | BaseException]:
+        """send the calls at `indices` to one server as a single batch"""
+
+        session = self.sessions.get(server_name)
+        if not isinstance(session, BatchCompatible):
+            return [ValueError(f"Server {server_name} not found")] * len(indices)
+
+        try:
+            self._check_health(server_name, session)
+        except TransportClosedError as e:
+            return [e] * len(indices)
+
+        results: list[types.CallToolResult | BaseException | None] = []
+        batch: list[tuple[str, dict]] = []
+
+        for index in indices:
+            name, args = calls[index]
+            if (
+                self.tool_catalog.is_fresh(server_name)
+                and name not in self.tool_catalog
+            ):
+                results.append(ValueError(f"Tool {name} not found"))
                 continue
 
-            resources = await session.list_resources()
+            results.append(None)
+            batch.append((name.split(".", 1)[1], args))
+
+        with metrics.registry.timed("easymcp_call_batch", server=server_name):
+            responses = iter(await session.call_tools(batch, self._timeout(timeout)))
+        return [next(responses) if result is None else result for result in results]
+
+    @overload
+    async def list_resources(
+        self,
+        force: bool = False,
+        timeout: float | None = None,
+        partial: Literal[False] = False,
+    ) -> list[types.Resource]: ...
+
+    @overload
+    async def list_resources(
+        self,
+        force: bool = False,
+        timeout: float | None = None,
+        *,
+        partial: Literal[True],
+    ) -> PartialResult[types.Resource]: ...
+
+    async def list_resources(
+        self, force: bool = False, timeout: float | None = None, partial: bool = False
+    ) -> list[types.Resource] | PartialResult[types.Resource]:
+        """list resources on all servers
+
+        see `list_tools` for the meaning of `timeout` and `partial`.
+        """
+
+        responses, errors = await self._fan_out(
+            "list_resources",
+            ResourcesCompatible,
+            lambda session: session.list_resources(force=force),
+            timeout,
+        )
+
+        if errors and not partial:
+            raise next(iter(errors.values()))
+
+        result: list[types.Resource] = []
+
+        for name, resources in responses.items():
             if resources is None:
                 continue
             for resource in resources.resources:
-                # do not map known schemes to mcp
-                if resource.uri.scheme not in (
-                    "http",
-                    "https",
-                ):
-                    resource.uri = AnyUrl(f"mcp-{name}+{resource.uri}")
+                result.append(self._namespace_resource(name, resource))
 
-                result.append(resource)
+        if partial:
+            return PartialResult[types.Resource](items=result, errors=errors)
 
         return result
 
-    async def read_resource(self, uri: AnyUrl | str):
-        """read a resource"""
+    async def read_resource(
+        self, uri: AnyUrl | str, timeout: float | None = None, cache: bool = True
+    ):
+        """read a resource
+
+        see `call_tool` for the meaning of `timeout`. `cache=False` bypasses
+        `resource_cache`.
+        """
 
         if not isinstance(uri, AnyUrl):
             uri = AnyUrl(uri)
@@ -193,29 +857,196 @@ class ClientManager:
         if not isinstance(session, ResourcesCompatible):
             raise ValueError(f"Server {server_name} does not support resources")
 
-        # new_uri = str(URL(str(uri)).with_scheme(resource_scheme))
-        new_uri = str(uri).removeprefix(f"mcp-{server_name}+")
+        with metrics.registry.timed("easymcp_read_resource", server=server_name):
+            self._check_health(server_name, session)
 
-        return await session.read_resource(new_uri)
+            # new_uri = str(URL(str(uri)).with_scheme(resource_scheme))
+            new_uri = str(uri).removeprefix(f"mcp-{server_name}+")
 
-    async def list_prompts(self) -> list[types.Prompt]:
-        """list prompts on all servers"""
+            if (
+                cache
+                and self.resource_cache is not None
+                and isinstance(session, SubscribableResourcesCompatible)
+                and session.supports_subscriptions
+            ):
+                return await self._read_cached_resource(
+                    server_name, session, new_uri, timeout
+                )
 
-        result: list[types.Prompt] = []
+            return await asyncio.wait_for(
+                session.read_resource(new_uri), self._timeout(timeout)
+            )
 
-        for name, session in self.sessions.items():
-            if not isinstance(session, PromptsCompatible):
-                continue
+    async def _read_cached_resource(
+        self,
+        name: str,
+        session: SubscribableResourcesCompatible,
+        uri: str,
+        timeout: float | None,
+    ) -> types.ReadResourceResult:
+        """serve a resource from the cache, subscribing to it on first read"""
+
+        assert self.resource_cache is not None
+
+        cached = self.resource_cache.get(name, uri)
+        if cached is not None:
+            return cached
+
+        subscribed = self._subscriptions.setdefault(name, set())
+        if uri not in subscribed:
+            try:
+                await asyncio.wait_for(
+                    session.subscribe_resource(uri), self._timeout(timeout)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to subscribe to {uri} on {name}: {e!r}")
+                return await asyncio.wait_for(
+                    session.read_resource(uri), self._timeout(timeout)
+                )
+            subscribed.add(uri)
+
+        version = self.resource_cache.version(name, uri)
+        result = await asyncio.wait_for(
+            session.read_resource(uri), self._timeout(timeout)
+        )
 
-            prompts = await session.list_prompts()
+        # the server may have been removed or restarted meanwhile
+        if self.sessions.get(name) is session:
+            self.resource_cache.put(name, uri, result, version)
+
+        return result
+
+    async def read_resource_spooled(
+        self,
+        uri: AnyUrl | str,
+        max_memory: int = 8 * 1024 * 1024,
+        timeout: float | None = None,
+    ) -> list[SpooledBlob | types.TextResourceContents]:
+        """read a resource and spool its blobs to temporary files
+
+        the base64 text is released before returning, so only the decoded bytes
+        stay around, on disk beyond `max_memory` bytes per blob. bypasses
+        `resource_cache`.
+        """
+
+        result = await self.read_resource(uri, timeout, cache=False)
+        return spool_resource(result, max_memory)
+
+    def _timeout(self, timeout: float | None) -> float | None:
+        """resolve a per-call timeout against the manager default"""
+        return timeout if timeout is not None else self.default_request_timeout
+
+    @overload
+    async def list_prompts(
+        self,
+        force: bool = False,
+        timeout: float | None = None,
+        partial: Literal[False] = False,
+    ) -> list[types.Prompt]: ...
+
+    @overload
+    async def list_prompts(
+        self,
+        force: bool = False,
+        timeout: float | None = None,
+        *,
+        partial: Literal[True],
+    ) -> PartialResult[types.Prompt]: ...
+
+    async def list_prompts(
+        self, force: bool = False, timeout: float | None = None, partial: bool = False
+    ) -> list[types.Prompt] | PartialResult[types.Prompt]:
+        """list prompts on all servers
+
+        see `list_tools` for the meaning of `timeout` and `partial`.
+        """
+
+        responses, errors = await self._fan_out(
+            "list_prompts",
+            PromptsCompatible,
+            lambda session: session.list_prompts(force=force),
+            timeout,
+        )
+
+        if errors and not partial:
+            raise next(iter(errors.values()))
+
+        result: list[types.Prompt] = []
+
+        for name, prompts in responses.items():
             if prompts is None:
                 continue
             for prompt in prompts.prompts:
-                prompt.name = f"{name}.{prompt.name}"
-                result.append(prompt)
+                result.append(
+                    prompt.model_copy(update={"name": f"{name}.{prompt.name}"})
+                )
+
+        if partial:
+            return PartialResult[types.Prompt](items=result, errors=errors)
 
         return result
 
+    @staticmethod
+    def _namespace_resource(name: str, resource: types.Resource) -> types.Resource:
+        """prefix the uri of a resource with its server"""
+
+        # do not map known schemes to mcp
+        if resource.uri.scheme in ("http", "https"):
+            return resource
+
+        return resource.model_copy(update={"uri": AnyUrl(f"mcp-{name}+{resource.uri}")})
+
+    @staticmethod
+    async def _each[T](items: Iterable[T]) -> AsyncIterator[T]:
+        for item in items:
+            yield item
+
+    async def iter_tools(self) -> AsyncIterator[types.Tool]:
+        """stream the tools of every server, one server and page at a time
+
+        nothing is materialized or cached and the tool catalog is not updated,
+        use `list_tools` for that. sessions without pagination yield their list.
+        """
+
+        for name, session in list(self.sessions.items()):
+            if isinstance(session, IterToolsCompatible):
+                tools = session.iter_tools()
+            elif isinstance(session, ToolsCompatible):
+                tools = self._each((await session.list_tools()).tools)
+            else:
+                continue
+
+            async for tool in tools:
+                yield tool.model_copy(update={"name": f"{name}.{tool.name}"})
+
+    async def iter_resources(self) -> AsyncIterator[types.Resource]:
+        """stream the resources of every server, see `iter_tools`"""
+
+        for name, session in list(self.sessions.items()):
+            if isinstance(session, IterResourcesCompatible):
+                resources = session.iter_resources()
+            elif isinstance(session, ResourcesCompatible):
+                resources = self._each((await session.list_resources()).resources)
+            else:
+                continue
+
+            async for resource in resources:
+                yield self._namespace_resource(name, resource)
+
+    async def iter_prompts(self) -> AsyncIterator[types.Prompt]:
+        """stream the prompts of every server, see `iter_tools`"""
+
+        for name, session in list(self.sessions.items()):
+            if isinstance(session, IterPromptsCompatible):
+                prompts = session.iter_prompts()
+            elif isinstance(session, PromptsCompatible):
+                prompts = self._each((await session.list_prompts()).prompts)
+            else:
+                continue
+
+            async for prompt in prompts:
+                yield prompt.model_copy(update={"name": f"{name}.{prompt.name}"})
+
     async def read_prompt(self, name: str, args: dict):
         """read a prompt"""
         raise NotImplementedError
@@ -264,14 +1095,14 @@ class ClientManager:
         assert callable(callback), f"{callback} must be callable"
         assert iscoroutinefunction(callback), f"{callback} must be an async function"
 
+        # sessions without invalidation hooks read it from _make_tools_changed_callback
         self.default_list_tools_changed_callback = callback
 
-        sessions = filter(
-            lambda x: isinstance(x, PushingToolsCompatible), self.sessions.values()
-        )
-        for session in sessions:
-            assert isinstance(session, PushingToolsCompatible)  # makes mypy happy
-            await session.register_tools_changed_callback(callback)
+        for session in self.sessions.values():
+            if isinstance(session, InvalidatingCompatible) and isinstance(
+                session, PushingToolsCompatible
+            ):
+                await session.register_tools_changed_callback(callback)
 
     async def register_prompts_changed_callback(
         self, callback: Callable[[], Awaitable[None]]
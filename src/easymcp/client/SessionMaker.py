@@ -4,12 +4,14 @@ from easymcp.client.sessions.GenericSession import BaseSessionProtocol
 from easymcp.client.sessions.fastmcp.main import FastMCPSession
 from easymcp.client.sessions.fastmcp.parameters import FastMcpParameters
 from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.sessions.pool.main import PooledSession
+from easymcp.client.sessions.pool.parameters import PoolParameters
 from easymcp.client.transports.stdio import StdioTransport, StdioServerParameters
 from easymcp.client.transports.docker import DockerTransport, DockerServerParameters
 from easymcp.client.transports.sse import SseTransport, SseServerParameters
 
 
-transportTypes: TypeAlias = StdioServerParameters | DockerServerParameters | SseServerParameters
+transportTypes: TypeAlias = StdioServerParameters | DockerServerParameters | SseServerParameters | PoolParameters
 
 make_transport_input: TypeAlias = transportTypes | FastMcpParameters
 
@@ -23,6 +25,9 @@ def make_transport(arguments: make_transport_input) -> BaseSessionProtocol:
     
     if isinstance(arguments, SseServerParameters):
         return MCPClientSession(SseTransport(arguments))
+
+    if isinstance(arguments, PoolParameters):
+        return PooledSession(arguments)
     
     if isinstance(arguments, FastMcpParameters):
         return FastMCPSession(arguments)
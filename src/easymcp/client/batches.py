@@ -0,0 +1,12 @@
+from mcp import types
+from pydantic import RootModel
+
+BATCH_PROTOCOL_VERSION = "2025-03-26"
+"""protocol version proposed by sessions that opt in to batches"""
+
+BATCH_PROTOCOL_VERSIONS = frozenset({BATCH_PROTOCOL_VERSION})
+"""protocol versions whose json-rpc layer accepts batches"""
+
+
+class JSONRPCBatch(RootModel[list[types.JSONRPCMessage]]):
+    """json-rpc messages sent together as one array"""
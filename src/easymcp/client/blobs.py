@@ -0,0 +1,157 @@
+import base64
+import binascii
+import io
+from tempfile import SpooledTemporaryFile
+
+from mcp import types
+from pydantic import AnyUrl, BaseModel, ConfigDict
+
+# base64 text is decoded in slices of this many characters, a multiple of 4 so
+# every slice decodes on its own
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# line breaks and spaces some encoders insert, e.g. mime style 76 character lines
+_WHITESPACE = " \t\r\n\v\f"
+_STRIP_WHITESPACE = str.maketrans("", "", _WHITESPACE)
+
+BlobContents = types.BlobResourceContents | types.ImageContent | types.EmbeddedResource
+
+
+class SpooledBlob(BaseModel):
+    """decoded blob of a resource, held in a temporary file"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    uri: AnyUrl
+    mimeType: str | None = None
+    file: SpooledTemporaryFile
+    """rewound file with the decoded bytes, close it when done"""
+
+
+def _blob_text(contents: BlobContents) -> str:
+    if isinstance(contents, types.EmbeddedResource):
+        contents = contents.resource  # type: ignore[assignment]
+
+    if isinstance(contents, types.BlobResourceContents):
+        return contents.blob
+    if isinstance(contents, types.ImageContent):
+        return contents.data
+
+    raise TypeError(f"{type(contents).__name__} has no binary payload")
+
+
+class BlobStream(io.RawIOBase):
+    """file-like view decoding base64 text lazily, one chunk at a time
+
+    the encoded text is not copied, at most one decoded chunk is held in memory.
+    whitespace is removed slice by slice before decoding.
+    """
+
+    def __init__(self, text: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 4 or chunk_size % 4:
+            raise ValueError("chunk_size must be a positive multiple of 4")
+
+        self._text = text
+        self._chunk_size = chunk_size
+        self._offset = 0
+        self._carry = ""
+        self._pending = memoryview(b"")
+        self._whitespace = sum(text.count(c) for c in _WHITESPACE)
+
+    @property
+    def size(self) -> int:
+        """decoded size in bytes"""
+
+        if not self._whitespace:
+            return len(self._text) // 4 * 3 - self._text[-2:].count("=")
+
+        # padding may be followed, or even split, by a line break
+        tail = self._text[-8:].translate(_STRIP_WHITESPACE)
+        return (len(self._text) - self._whitespace) // 4 * 3 - tail[-2:].count("=")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        while not self._pending:
+            if self._offset >= len(self._text) and not self._carry:
+                return 0
+
+            chunk = self._text[self._offset : self._offset + self._chunk_size]
+            self._offset += len(chunk)
+
+            if self._whitespace:
+                # keep slices 4 aligned, the remainder goes with the next one
+                chunk = self._carry + chunk.translate(_STRIP_WHITESPACE)
+                end = (
+                    len(chunk)
+                    if self._offset >= len(self._text)
+                    else len(chunk) // 4 * 4
+                )
+                chunk, self._carry = chunk[:end], chunk[end:]
+
+            try:
+                self._pending = memoryview(base64.b64decode(chunk, validate=True))
+            except binascii.Error as e:
+                raise ValueError(f"Invalid base64 near offset {self._offset}") from e
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def open_blob(
+    contents: BlobContents, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> io.BufferedReader:
+    """stream the decoded bytes of a blob resource, image or embedded resource"""
+    return io.BufferedReader(BlobStream(_blob_text(contents), chunk_size))
+
+
+def spool_blob(
+    contents: BlobContents,
+    max_memory: int = 8 * 1024 * 1024,
+    dir: str | None = None,
+) -> SpooledTemporaryFile[bytes]:
+    """decode a blob into a temporary file, kept in memory up to `max_memory` bytes
+
+    the file is rewound. once the result holding the base64 text is dropped,
+    only the decoded bytes remain, on disk for large payloads.
+    """
+
+    spool: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(
+        max_size=max_memory, dir=dir
+    )
+    stream = BlobStream(_blob_text(contents))
+
+    buffer = bytearray(DEFAULT_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while size := stream.readinto(view):
+        spool.write(view[:size])
+
+    spool.seek(0)
+    return spool
+
+
+def spool_resource(
+    result: types.ReadResourceResult,
+    max_memory: int = 8 * 1024 * 1024,
+    dir: str | None = None,
+) -> list[SpooledBlob | types.TextResourceContents]:
+    """spool every blob of a resource, text contents are returned as they are"""
+
+    spooled: list[SpooledBlob | types.TextResourceContents] = []
+
+    for contents in result.contents:
+        if isinstance(contents, types.BlobResourceContents):
+            spooled.append(
+                SpooledBlob(
+                    uri=contents.uri,
+                    mimeType=contents.mimeType,
+                    file=spool_blob(contents, max_memory, dir),
+                )
+            )
+        else:
+            spooled.append(contents)
+
+    return spooled
@@ -0,0 +1,97 @@
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from mcp import types
+
+
+class ToolCatalog:
+    """namespaced tools of every server, keyed by `<server>.<tool>`
+
+    tools are stored once per server and handed out as shared objects, callers
+    must treat them as read-only. each server is refreshed independently: a
+    server is fresh once `update` stored its tools and becomes stale again when
+    `invalidate` is called (e.g. on a tool list changed notification).
+    """
+
+    _servers: dict[str, dict[str, types.Tool]]
+    _index: dict[str, types.Tool]
+    _stale: set[str]
+    _generations: dict[str, int]
+
+    def __init__(self):
+        self._servers = dict()
+        self._index = dict()
+        self._stale = set()
+        self._generations = dict()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, name: str) -> types.Tool | None:
+        """look up a tool by its namespaced name"""
+        return self._index.get(name)
+
+    def view(self) -> Mapping[str, types.Tool]:
+        """read-only mapping of namespaced name to tool"""
+        return MappingProxyType(self._index)
+
+    def tools(self, server: str) -> list[types.Tool]:
+        """tools of a single server"""
+        return list(self._servers.get(server, {}).values())
+
+    def is_fresh(self, server: str) -> bool:
+        """true if the tools of a server are loaded and not invalidated"""
+        return server in self._servers and server not in self._stale
+
+    def generation(self, server: str) -> int:
+        """counter bumped on every invalidation, read it before fetching tools"""
+        return self._generations.get(server, 0)
+
+    def update(
+        self, server: str, tools: Iterable[types.Tool], generation: int | None = None
+    ) -> None:
+        """replace the tools of a server
+
+        if `generation` is given and the server was invalidated since it was read,
+        the tools are stored but the server stays stale.
+        """
+
+        self._drop(server)
+
+        entries: dict[str, types.Tool] = dict()
+        for tool in tools:
+            name = f"{server}.{tool.name}"
+            entries[name] = tool.model_copy(update={"name": name})
+
+        self._servers[server] = entries
+        self._index.update(entries)
+
+        if generation is None or generation == self.generation(server):
+            self._stale.discard(server)
+        else:
+            self._stale.add(server)
+
+    def invalidate(self, server: str) -> None:
+        """drop the tools of a server and mark it stale"""
+
+        self._drop(server)
+        self._stale.add(server)
+        self._generations[server] = self.generation(server) + 1
+
+    def remove(self, server: str) -> None:
+        """forget a server entirely"""
+
+        self._drop(server)
+        self._servers.pop(server, None)
+        self._stale.discard(server)
+        self._generations.pop(server, None)
+
+    def _drop(self, server: str) -> None:
+        for name in self._servers.get(server, {}):
+            self._index.pop(name, None)
+
+        if server in self._servers:
+            self._servers[server] = dict()
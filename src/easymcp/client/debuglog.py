@@ -0,0 +1,116 @@
+import json
+from typing import Iterator
+
+from loguru import logger
+from pydantic import BaseModel, RootModel
+
+
+class PayloadLogging(BaseModel):
+    """how message payloads are logged at debug level"""
+
+    enabled: bool = True
+    """log payloads at all, checked before anything else"""
+
+    max_payload_size: int | None = 1024
+    """characters of a payload shown in a log record, None shows everything"""
+
+
+settings = PayloadLogging()
+"""process wide settings, e.g. `debuglog.settings.max_payload_size = 256`"""
+
+
+def truncate(text: str, limit: int | None = None) -> str:
+    """cut `text` to `limit` characters, `settings.max_payload_size` by default"""
+
+    if limit is None:
+        limit = settings.max_payload_size
+    if limit is None or len(text) <= limit:
+        return text
+
+    return f"{text[:limit]}... ({len(text) - limit} more characters)"
+
+
+def _json_chunks(value: object, limit: int) -> Iterator[str]:
+    """compact json of `value` piece by piece, strings and bytes cut to `limit`"""
+
+    if isinstance(value, RootModel):
+        yield from _json_chunks(value.root, limit)
+
+    elif isinstance(value, (BaseModel, dict)):
+        yield "{"
+        separator = ""
+        for key, item in value.items() if isinstance(value, dict) else value:
+            yield f"{separator}{json.dumps(str(key), ensure_ascii=False)}:"
+            yield from _json_chunks(item, limit)
+            separator = ","
+        yield "}"
+
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        separator = ""
+        for item in value:
+            yield separator
+            yield from _json_chunks(item, limit)
+            separator = ","
+        yield "]"
+
+    elif isinstance(value, str):
+        yield json.dumps(value[:limit], ensure_ascii=False)
+
+    elif isinstance(value, (bytes, bytearray)):
+        yield json.dumps(
+            bytes(value[:limit]).decode(errors="replace"), ensure_ascii=False
+        )
+
+    else:
+        yield json.dumps(value, ensure_ascii=False, default=str)
+
+
+def bounded_json(model: BaseModel | list | tuple, limit: int) -> str:
+    """json of `model` cut to `limit` characters, serializing only what is shown"""
+
+    parts: list[str] = []
+    size = 0
+    for chunk in _json_chunks(model, limit):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return f"{''.join(parts)[:limit]}... (truncated)"
+
+    return "".join(parts)
+
+
+def _format(payload: object) -> str:
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        # decode only what is shown, a multibyte character cut at the edge is replaced
+        limit = settings.max_payload_size
+        shown = payload if limit is None else payload[:limit]
+        text = bytes(shown).decode(errors="replace")
+        if len(shown) < len(payload):
+            return f"{text}... ({len(payload) - len(shown)} more bytes)"
+        return text
+
+    # a full dump of a large result (e.g. a blob) would dwarf the part that is shown
+    if isinstance(payload, (BaseModel, list, tuple)):
+        limit = settings.max_payload_size
+        if limit is None:
+            return (
+                payload.model_dump_json()
+                if isinstance(payload, BaseModel)
+                else str(payload)
+            )
+        return bounded_json(payload, limit)
+
+    return truncate(str(payload))
+
+
+def log_payload(template: str, payload: object) -> None:
+    """log `payload` at debug level, `{}` in `template` is replaced by it
+
+    the payload is formatted and truncated only if payload logging is enabled
+    and a sink accepts debug records. wrap hot call sites in `if __debug__:`,
+    running python with -O then compiles them out entirely.
+    """
+
+    if settings.enabled:
+        logger.opt(lazy=True, depth=1).debug(template, lambda: _format(payload))
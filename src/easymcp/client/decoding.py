@@ -0,0 +1,138 @@
+import json
+import typing
+from typing import Annotated, Any, Callable
+
+import pydantic
+from loguru import logger
+from mcp import types
+from pydantic import BaseModel, Discriminator, Field, Tag
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+loads: Callable[[str | bytes], Any] = orjson.loads if orjson else json.loads
+"""json parser, orjson if it is installed (`pip install easymcp[fast]`)"""
+
+
+def _method(value: Any) -> str | None:
+    if isinstance(value, dict):
+        return value.get("method")
+    return getattr(value, "method", None)
+
+
+def _by_method(union: type[BaseModel]) -> Any:
+    """members of a root model union, picked by their `method` literal"""
+
+    members = typing.get_args(union.model_fields["root"].annotation)
+    tagged = tuple(
+        Annotated[
+            member, Tag(typing.get_args(member.model_fields["method"].annotation)[0])
+        ]
+        for member in members
+    )
+
+    return Annotated[typing.Union[tagged], Discriminator(_method)]
+
+
+class _ServerRequest(types.ServerRequest):
+    root: _by_method(types.ServerRequest)  # type: ignore[valid-type]
+
+
+class _ServerNotification(types.ServerNotification):
+    root: _by_method(types.ServerNotification)  # type: ignore[valid-type]
+
+
+class DecodedRequest(types.JSONRPCRequest):
+    """json-rpc request from the server, already validated as a ServerRequest"""
+
+    request: _ServerRequest = Field(exclude=True)
+
+
+class DecodedNotification(types.JSONRPCNotification):
+    """json-rpc notification from the server, already validated as a ServerNotification"""
+
+    notification: _ServerNotification = Field(exclude=True)
+
+
+def _kind(value: Any) -> str:
+    if not isinstance(value, dict):
+        value = dict(value)
+
+    if "method" in value:
+        return "request" if "id" in value else "notification"
+    return "error" if "error" in value else "response"
+
+
+class DecodedMessage(types.JSONRPCMessage):
+    """json-rpc message validated in a single pass, keyed on its shape and method"""
+
+    root: Annotated[  # type: ignore[assignment]
+        Annotated[DecodedRequest, Tag("request")]
+        | Annotated[DecodedNotification, Tag("notification")]
+        | Annotated[types.JSONRPCResponse, Tag("response")]
+        | Annotated[types.JSONRPCError, Tag("error")],
+        Discriminator(_kind),
+    ]
+
+
+def decode_message(data: str | bytes) -> types.JSONRPCMessage:
+    """parse a json-rpc message from the server in a single pass
+
+    requests and notifications are validated straight into their ServerRequest
+    or ServerNotification member, picked by the method. responses keep their
+    result as parsed json, the caller validates it once into its result type.
+    unknown methods or invalid params fall back to a plain JSONRPCRequest or
+    JSONRPCNotification so the session can reject them.
+
+    raises ValueError if the data is not a valid json-rpc message.
+    """
+
+    return _decode(loads(data))
+
+
+def decode_messages(data: str | bytes) -> list[types.JSONRPCMessage]:
+    """parse a json-rpc message or a batch of messages from the server
+
+    see `decode_message`. invalid members of a batch are logged and skipped,
+    the others are still returned.
+
+    raises ValueError if the data is neither a valid message nor a batch.
+    """
+
+    message = loads(data)
+    if not isinstance(message, list):
+        return [_decode(message)]
+
+    if not message:
+        raise ValueError("JSON-RPC batch must not be empty")
+
+    decoded: list[types.JSONRPCMessage] = []
+    for member in message:
+        try:
+            decoded.append(_decode(member))
+        except ValueError as e:
+            logger.error(f"Dropping invalid batch member: {e}")
+
+    return decoded
+
+
+def _decode(message: Any) -> types.JSONRPCMessage:
+    if not isinstance(message, dict):
+        raise ValueError("JSON-RPC message must be an object")
+
+    method = message.get("method")
+    if method is not None:
+        typed = {"method": method, "params": message.get("params")}
+        message["request" if "id" in message else "notification"] = typed
+
+    try:
+        return DecodedMessage.model_validate(message)
+    except pydantic.ValidationError:
+        if method is None:
+            raise
+
+    message.pop("request", None)
+    message.pop("notification", None)
+    return types.JSONRPCMessage.model_validate(message)
@@ -0,0 +1,13 @@
+import asyncio
+
+
+class MessageTooLargeError(ValueError):
+    """a transport received a message larger than its configured limit"""
+
+
+class QueueFullError(asyncio.QueueFull):
+    """a message queue with the `fail` overflow policy is full"""
+
+
+class TransportClosedError(RuntimeError):
+    """the transport of a session died, its requests can no longer be answered"""
@@ -0,0 +1,137 @@
+import math
+from contextlib import AbstractContextManager
+from typing import Any, Iterable, Iterator
+
+from easymcp.client import metrics
+from easymcp.client.metrics import HistogramSample, MetricsRegistry, Sample
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    otel_metrics = None  # type: ignore[assignment]
+    otel_trace = None  # type: ignore[assignment]
+
+try:
+    from prometheus_client import core as prometheus  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus = None  # type: ignore[assignment]
+
+
+class OpenTelemetryHook:
+    """forward measurements to opentelemetry instruments and timed operations to spans
+
+    needs `pip install easymcp[otel]` and an sdk configured by the application,
+    without one the api records nothing.
+
+    ```python
+    metrics.registry.add_hook(OpenTelemetryHook())
+    ```
+    """
+
+    def __init__(self, meter: Any = None, tracer: Any = None):
+        if otel_metrics is None or otel_trace is None:
+            raise ImportError(
+                "OpenTelemetryHook needs opentelemetry-api, install easymcp[otel]"
+            )
+
+        self.meter = meter or otel_metrics.get_meter("easymcp")
+        self.tracer = tracer or otel_trace.get_tracer("easymcp")
+
+        self._counters: dict[str, Any] = dict()
+        self._histograms: dict[str, Any] = dict()
+
+    def counter(self, name: str, value: float, labels: dict[str, str]) -> None:
+        instrument = self._counters.get(name)
+        if instrument is None:
+            instrument = self._counters[name] = self.meter.create_counter(name)
+        instrument.add(value, attributes=labels)
+
+    def histogram(self, name: str, value: float, labels: dict[str, str]) -> None:
+        instrument = self._histograms.get(name)
+        if instrument is None:
+            unit = "s" if name.endswith("_seconds") else ""
+            instrument = self._histograms[name] = self.meter.create_histogram(
+                name, unit=unit
+            )
+        instrument.record(value, attributes=labels)
+
+    def span(self, name: str, labels: dict[str, str]) -> AbstractContextManager[Any]:
+        return self.tracer.start_as_current_span(name, attributes=labels)
+
+
+def _label_names(samples: Iterable[Sample | HistogramSample]) -> list[str]:
+    return sorted({key for sample in samples for key in sample.labels})
+
+
+def _grouped[S: (Sample, HistogramSample)](
+    samples: Iterable[S],
+) -> dict[str, list[S]]:
+    groups: dict[str, list[S]] = dict()
+    for sample in samples:
+        groups.setdefault(sample.name, []).append(sample)
+    return groups
+
+
+class PrometheusCollector:
+    """expose a metrics registry to prometheus_client, read on every scrape
+
+    needs `pip install easymcp[prometheus]`.
+
+    ```python
+    from prometheus_client import REGISTRY
+
+    REGISTRY.register(PrometheusCollector())
+    ```
+    """
+
+    registry: MetricsRegistry
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        if prometheus is None:
+            raise ImportError(
+                "PrometheusCollector needs prometheus-client, install easymcp[prometheus]"
+            )
+
+        self.registry = registry or metrics.registry
+
+    def describe(self) -> list[Any]:
+        # metrics appear as servers start, nothing is known up front
+        return []
+
+    def collect(self) -> Iterator[Any]:
+        snapshot = self.registry.snapshot()
+
+        for name, counters in _grouped(snapshot.counters).items():
+            names = _label_names(counters)
+            counter = prometheus.CounterMetricFamily(
+                name.removesuffix("_total"), name, labels=names
+            )
+            for sample in counters:
+                counter.add_metric(
+                    [sample.labels.get(n, "") for n in names], sample.value
+                )
+            yield counter
+
+        for name, gauges in _grouped(snapshot.gauges).items():
+            names = _label_names(gauges)
+            gauge = prometheus.GaugeMetricFamily(name, name, labels=names)
+            for sample in gauges:
+                gauge.add_metric(
+                    [sample.labels.get(n, "") for n in names], sample.value
+                )
+            yield gauge
+
+        for name, histograms in _grouped(snapshot.histograms).items():
+            names = _label_names(histograms)
+            histogram = prometheus.HistogramMetricFamily(name, name, labels=names)
+            for h in histograms:
+                histogram.add_metric(
+                    [h.labels.get(n, "") for n in names],
+                    [
+                        ("+Inf" if math.isinf(bound) else str(bound), count)
+                        for bound, count in h.buckets
+                    ],
+                    h.sum,
+                )
+            yield histogram
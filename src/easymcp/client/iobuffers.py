@@ -1,40 +1,161 @@
 from asyncio import Queue, create_task
+from typing import Callable
 
 from loguru import logger
-import pydantic
-from easymcp.client.transports.generic import TransportProtocol
+from pydantic import BaseModel, TypeAdapter
+from easymcp.client.batches import JSONRPCBatch
+from easymcp.client.decoding import decode_messages
+from easymcp.client.errors import MessageTooLargeError, QueueFullError
+from easymcp.client.transports.generic import (
+    BytesTransportProtocol,
+    MessageTransportProtocol,
+    TransportProtocol,
+)
 from mcp import types
 
+# serializes straight to bytes, without an intermediate str
+_message_adapter: TypeAdapter[types.JSONRPCMessage | JSONRPCBatch] = TypeAdapter(types.JSONRPCMessage | JSONRPCBatch)
 
-async def reader(transport: TransportProtocol, queue: Queue[types.JSONRPCMessage]):
-    """Read data from the transport and put it in the queue"""
 
-    async def _reader():
+class TransportStats(BaseModel):
+    """traffic counters of a transport"""
+
+    messages_sent: int
+    """messages written, a batch counts as one"""
+
+    messages_received: int
+    """messages read, a batch counts as one"""
+
+    bytes_sent: int
+    """size of the written messages without framing, characters for text transports, 0 for message transports"""
+
+    bytes_received: int
+    """size of the read messages without framing, characters for text transports, 0 for message transports"""
+
+
+class TransportCounters:
+    """running traffic counters, updated by `reader` and `writer`"""
+
+    __slots__ = ("messages_sent", "messages_received", "bytes_sent", "bytes_received")
+
+    def __init__(self):
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def stats(self) -> TransportStats:
+        """snapshot of the counters"""
+
+        return TransportStats(
+            messages_sent=self.messages_sent,
+            messages_received=self.messages_received,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+        )
+
+
+async def reader(
+    transport: TransportProtocol,
+    queue: Queue[types.JSONRPCMessage | JSONRPCBatch],
+    counters: TransportCounters | None = None,
+    on_overflow: Callable[[types.JSONRPCMessage], None] | None = None,
+):
+    """Read data from the transport and put it in the queue
+
+    a message refused by a full queue (the `fail` overflow policy) is dropped
+    and handed to `on_overflow`, reading goes on.
+    """
+
+    traffic = counters if counters is not None else TransportCounters()
+
+    async def _put(message: types.JSONRPCMessage):
+        try:
+            await queue.put(message)
+        except QueueFullError:
+            logger.warning(f"Incoming queue full, dropping {getattr(message.root, 'method', 'response')}")
+            if on_overflow is not None:
+                on_overflow(message)
+
+    async def _message_reader(transport: MessageTransportProtocol):
         while transport.state == "started":
-            data = await transport.receive()
+            await _put(await transport.receive_message())
+            traffic.messages_received += 1
 
+    async def _reader():
+        receive = transport.receive_bytes if isinstance(transport, BytesTransportProtocol) else transport.receive
+
+        while transport.state == "started":
             try:
-                parsed = types.JSONRPCMessage.model_validate_json(data)
-            except pydantic.ValidationError:
-                logger.error(f"Error parsing JSON: {data}")
-                parsed = None
+                data = await receive()
+            except MessageTooLargeError as e:
+                logger.error(f"Dropping message: {e}")
+                continue
+
+            traffic.messages_received += 1
+            traffic.bytes_received += len(data)
 
-            if parsed is None:
+            try:
+                parsed = decode_messages(data)
+            except ValueError:
+                logger.error(f"Error parsing JSON: {data!r}")
                 continue
 
-            queue.put_nowait(parsed)
+            # members of a batch are handled like messages that arrived one by one
+            for message in parsed:
+                await _put(message)
 
-    task = create_task(_reader())
+    if isinstance(transport, MessageTransportProtocol):
+        task = create_task(_message_reader(transport))
+    else:
+        task = create_task(_reader())
     return task
 
 
-async def writer(transport: TransportProtocol, queue: Queue[types.JSONRPCMessage]):
-    """Write data from the queue to the transport"""
+async def writer(transport: TransportProtocol, queue: Queue[types.JSONRPCMessage | JSONRPCBatch], max_batch_bytes: int = 256 * 1024, counters: TransportCounters | None = None):
+    """Write data from the queue to the transport
 
-    async def _writer():
+    bytes transports get every message already queued in a single write, up to
+    `max_batch_bytes` per write.
+    """
+
+    traffic = counters if counters is not None else TransportCounters()
+
+    async def _message_writer(transport: MessageTransportProtocol):
         while transport.state == "started":
             data = await queue.get()
-            await transport.send(data.model_dump_json())
 
-    task = create_task(_writer())
+            # message transports carry single messages, send batch members one by one
+            for message in data.root if isinstance(data, JSONRPCBatch) else [data]:
+                await transport.send_message(message)
+            traffic.messages_sent += 1
+
+    async def _writer():
+        while transport.state == "started":
+            text = (await queue.get()).model_dump_json()
+            await transport.send(text)
+            traffic.messages_sent += 1
+            traffic.bytes_sent += len(text)
+
+    async def _bytes_writer(transport: BytesTransportProtocol):
+        while transport.state == "started":
+            pending = [_message_adapter.dump_json(await queue.get())]
+            size = len(pending[0])
+
+            # coalesce what is already queued, one write and drain per burst
+            while size < max_batch_bytes and not queue.empty():
+                data = _message_adapter.dump_json(queue.get_nowait())
+                pending.append(data)
+                size += len(data)
+
+            await transport.send_bytes(*pending)
+            traffic.messages_sent += len(pending)
+            traffic.bytes_sent += size
+
+    if isinstance(transport, MessageTransportProtocol):
+        task = create_task(_message_writer(transport))
+    elif isinstance(transport, BytesTransportProtocol):
+        task = create_task(_bytes_writer(transport))
+    else:
+        task = create_task(_writer())
     return task
@@ -0,0 +1,318 @@
+from bisect import bisect_left
+from contextlib import AbstractContextManager
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Iterable, Literal, Protocol, runtime_checkable
+from weakref import WeakSet
+
+from loguru import logger
+from pydantic import BaseModel
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""upper bounds in seconds of the latency histograms"""
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class Sample(BaseModel):
+    """value of a counter or gauge for one set of labels"""
+
+    name: str
+    labels: dict[str, str] = {}
+    value: float
+    kind: Literal["counter", "gauge"] = "gauge"
+
+
+class HistogramSample(BaseModel):
+    """distribution of a histogram for one set of labels"""
+
+    name: str
+    labels: dict[str, str] = {}
+
+    buckets: list[tuple[float, int]]
+    """upper bound and cumulative count of every bucket, the last bound is inf"""
+
+    count: int
+    sum: float
+
+
+class MetricsSnapshot(BaseModel):
+    """every metric of a registry at one point in time"""
+
+    counters: list[Sample] = []
+    gauges: list[Sample] = []
+    histograms: list[HistogramSample] = []
+
+    def value(self, name: str, **labels: str) -> float | None:
+        """value of a counter or gauge, None if it was never recorded"""
+
+        for sample in (*self.counters, *self.gauges):
+            if sample.name == name and sample.labels == labels:
+                return sample.value
+        return None
+
+    def histogram(self, name: str, **labels: str) -> HistogramSample | None:
+        """distribution of a histogram, None if it was never recorded"""
+
+        for sample in self.histograms:
+            if sample.name == name and sample.labels == labels:
+                return sample
+        return None
+
+
+@runtime_checkable
+class MetricsHook(Protocol):
+    """receives every measurement as it is recorded, e.g. to forward it to an exporter"""
+
+    def counter(self, name: str, value: float, labels: dict[str, str]) -> None: ...
+    def histogram(self, name: str, value: float, labels: dict[str, str]) -> None: ...
+
+
+@runtime_checkable
+class TracingHook(MetricsHook, Protocol):
+    """metrics hook that also wraps timed operations in a span"""
+
+    def span(
+        self, name: str, labels: dict[str, str]
+    ) -> AbstractContextManager[Any]: ...
+
+
+@runtime_checkable
+class MetricsCollector(Protocol):
+    """reports gauges and counters kept elsewhere when a snapshot is taken"""
+
+    def collect_metrics(self) -> Iterable[Sample]: ...
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Timed:
+    """context manager recording the duration and failures of an operation"""
+
+    __slots__ = ("_registry", "_name", "_labels", "_spans", "_start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str, labels: dict[str, str]):
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+        self._spans: list[AbstractContextManager[Any]] | None = None
+
+    def __enter__(self) -> None:
+        if self._registry._tracers:
+            self._spans = []
+            for hook in self._registry._tracers:
+                try:
+                    span = hook.span(self._name, self._labels)
+                    span.__enter__()
+                except Exception as e:
+                    logger.warning(f"Tracing hook failed on {self._name}: {e!r}")
+                    continue
+                self._spans.append(span)
+
+        self._start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        elapsed = perf_counter() - self._start
+        registry = self._registry
+
+        registry._observe(f"{self._name}_seconds", elapsed, self._labels)
+        if exc_type is not None:
+            registry.increment(
+                f"{self._name}_errors_total", error=exc_type.__name__, **self._labels
+            )
+
+        for span in reversed(self._spans or ()):
+            try:
+                span.__exit__(exc_type, exc, traceback)
+            except Exception as e:
+                logger.warning(f"Tracing hook failed on {self._name}: {e!r}")
+
+
+class _Disabled:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+
+_disabled = _Disabled()
+
+
+class MetricsRegistry:
+    """in-process counters and histograms, forwarded to hooks as they are recorded
+
+    metrics are keyed by name and labels. gauges are not stored, collectors
+    report them when a snapshot is taken. everything runs on the event loop,
+    recording is a dictionary update.
+    """
+
+    enabled: bool
+    """record anything at all, checked before anything else"""
+
+    buckets: tuple[float, ...]
+    """upper bounds of the histogram buckets, fixed once the registry is created"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.enabled = True
+        self.buckets = tuple(sorted(buckets))
+
+        self._counters: dict[_Key, float] = dict()
+        self._histograms: dict[_Key, _Histogram] = dict()
+        self._hooks: list[MetricsHook] = []
+        self._tracers: list[TracingHook] = []
+        self._collectors: WeakSet[MetricsCollector] = WeakSet()
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """forward measurements to `hook`, spans too if it is a TracingHook"""
+
+        self._hooks.append(hook)
+        if isinstance(hook, TracingHook):
+            self._tracers.append(hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        """stop forwarding measurements to `hook`"""
+
+        self._hooks.remove(hook)
+        if hook in self._tracers:
+            self._tracers.remove(hook)
+
+    def add_collector(self, collector: MetricsCollector) -> None:
+        """ask `collector` for its samples on every snapshot, held by a weak reference"""
+        self._collectors.add(collector)
+
+    def increment(self, name: str, value: float = 1, /, **labels: str) -> None:
+        """add `value` to a counter"""
+
+        if not self.enabled:
+            return
+
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+        for hook in self._hooks:
+            self._forward(hook.counter, name, value, labels)
+
+    def observe(self, name: str, value: float, /, **labels: str) -> None:
+        """record `value` in a histogram"""
+
+        if self.enabled:
+            self._observe(name, value, labels)
+
+    def _observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(len(self.buckets) + 1)
+
+        histogram.counts[bisect_left(self.buckets, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+        for hook in self._hooks:
+            self._forward(hook.histogram, name, value, labels)
+
+    def timed(self, name: str, /, **labels: str) -> AbstractContextManager[None]:
+        """time a block into `<name>_seconds`, failures count in `<name>_errors_total`
+
+        the error counter carries the exception class as its `error` label.
+        tracing hooks wrap the block in a span named `name`.
+        """
+
+        if not self.enabled:
+            return _disabled
+        return _Timed(self, name, labels)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """copy of every metric, including the samples of the collectors"""
+
+        snapshot = MetricsSnapshot(
+            counters=[
+                Sample(name=name, labels=dict(labels), value=value, kind="counter")
+                for (name, labels), value in self._counters.items()
+            ],
+            histograms=[
+                self._histogram_sample(name, dict(labels), histogram)
+                for (name, labels), histogram in self._histograms.items()
+            ],
+        )
+
+        for collector in list(self._collectors):
+            try:
+                samples = list(collector.collect_metrics())
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector!r} failed: {e!r}")
+                continue
+
+            for sample in samples:
+                if sample.kind == "counter":
+                    snapshot.counters.append(sample)
+                else:
+                    snapshot.gauges.append(sample)
+
+        return snapshot
+
+    def reset(self) -> None:
+        """drop every recorded counter and histogram"""
+
+        self._counters.clear()
+        self._histograms.clear()
+
+    def _histogram_sample(
+        self, name: str, labels: dict[str, str], histogram: _Histogram
+    ) -> HistogramSample:
+        buckets: list[tuple[float, int]] = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), histogram.counts):
+            total += count
+            buckets.append((bound, total))
+
+        return HistogramSample(
+            name=name,
+            labels=labels,
+            buckets=buckets,
+            count=histogram.count,
+            sum=histogram.sum,
+        )
+
+    @staticmethod
+    def _forward(method: Any, name: str, value: float, labels: dict[str, str]):
+        # a broken exporter must not fail the operation it measures
+        try:
+            method(name, value, labels)
+        except Exception as e:
+            logger.warning(f"Metrics hook failed on {name}: {e!r}")
+
+
+registry = MetricsRegistry()
+"""process wide registry every client records into"""
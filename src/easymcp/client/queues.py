@@ -0,0 +1,120 @@
+import asyncio
+from typing import Literal
+
+from loguru import logger
+from mcp import types
+from pydantic import BaseModel
+
+from easymcp.client.batches import JSONRPCBatch
+from easymcp.client.errors import QueueFullError
+
+OverflowPolicy = Literal["block", "drop_oldest_notification", "fail"]
+"""what a full queue does with a new message
+
+- block: wait for space (put_nowait raises asyncio.QueueFull)
+- drop_oldest_notification: make room by dropping the oldest queued notification,
+  or the new message if it is a notification itself. other messages wait for space.
+- fail: raise QueueFullError
+"""
+
+OutgoingOverflowPolicy = Literal["block", "fail"]
+"""what a full outgoing queue does, client notifications such as cancellations are never dropped"""
+
+
+class QueueStats(BaseModel):
+    """depth and overflow counters of a message queue"""
+
+    depth: int
+    """messages currently queued"""
+
+    maxsize: int
+    """capacity, 0 means unbounded"""
+
+    high_watermark: int
+    """largest depth seen"""
+
+    dropped: int
+    """notifications dropped to make room"""
+
+    rejected: int
+    """messages refused with QueueFullError"""
+
+
+class MessageQueue(asyncio.Queue[types.JSONRPCMessage | JSONRPCBatch]):
+    """bounded queue of json-rpc messages with an overflow policy
+
+    a batch counts as a single message.
+    """
+
+    policy: OverflowPolicy
+
+    def __init__(self, maxsize: int = 0, policy: OverflowPolicy = "block"):
+        super().__init__(maxsize)
+        self.policy = policy
+
+        self.high_watermark = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    async def put(self, item: types.JSONRPCMessage | JSONRPCBatch) -> None:
+        if self.full() and self.policy != "block":
+            if self._make_room(item):
+                return
+            if self.policy == "fail":
+                self._reject()
+
+        # asyncio.Queue.put ends in put_nowait, which tracks the depth
+        await super().put(item)
+
+    def put_nowait(self, item: types.JSONRPCMessage | JSONRPCBatch) -> None:
+        if self.full():
+            if self._make_room(item):
+                return
+            if self.policy == "fail":
+                self._reject()
+
+        super().put_nowait(item)
+        self._track_depth()
+
+    def stats(self) -> QueueStats:
+        """snapshot of the queue counters"""
+
+        return QueueStats(
+            depth=self.qsize(),
+            maxsize=self.maxsize,
+            high_watermark=self.high_watermark,
+            dropped=self.dropped,
+            rejected=self.rejected,
+        )
+
+    def _make_room(self, item: types.JSONRPCMessage | JSONRPCBatch) -> bool:
+        """apply the drop policy, true if `item` itself was dropped"""
+
+        if self.policy != "drop_oldest_notification":
+            return False
+
+        # asyncio.Queue keeps its items in a deque
+        queued = self._queue  # type: ignore[attr-defined]
+        for message in queued:
+            if isinstance(message.root, types.JSONRPCNotification):
+                queued.remove(message)
+                self.task_done()
+                self._drop(message)
+                return False
+
+        if isinstance(item.root, types.JSONRPCNotification):
+            self._drop(item)
+            return True
+
+        return False
+
+    def _drop(self, message: types.JSONRPCMessage | JSONRPCBatch):
+        self.dropped += 1
+        logger.warning(f"Queue full, dropping notification {message.root.method}")  # type: ignore[union-attr]
+
+    def _reject(self):
+        self.rejected += 1
+        raise QueueFullError(f"Queue full ({self.maxsize} messages)")
+
+    def _track_depth(self):
+        self.high_watermark = max(self.high_watermark, self.qsize())
@@ -1,50 +1,250 @@
+import asyncio
 from asyncio import Future, Queue
+from itertools import count
+from typing import Sequence
 
 from mcp import types
 
 from loguru import logger
 
+from easymcp.client.batches import JSONRPCBatch
+from easymcp.client.debuglog import log_payload
+from easymcp.client.errors import TransportClosedError
+
 
 class RequestMap:
     """RequestMap class"""
 
-    requests: dict[str, Future[types.JSONRPCResponse | None]]
+    requests: dict[types.RequestId, Future[types.JSONRPCResponse | None]]
+
+    outgoing_messages: Queue[types.JSONRPCMessage | JSONRPCBatch]
+
+    default_timeout: float | None
+    """seconds to wait for a response when no timeout is given, None waits forever"""
 
-    outgoing_messages: Queue[types.JSONRPCMessage]
+    closed: BaseException | None
+    """set once the transport died, new requests fail immediately"""
 
-    def __init__(self, outgoing_messages: Queue[types.JSONRPCMessage]):
+    def __init__(
+        self,
+        outgoing_messages: Queue[types.JSONRPCMessage | JSONRPCBatch],
+        default_timeout: float | None = None,
+    ):
         self.outgoing_messages = outgoing_messages
         self.requests = {}
+        self.default_timeout = default_timeout
+        self.closed = None
+        self._ids = count(1)
 
-    def send_request(self, message: types.JSONRPCRequest):
-        """send a request"""
+    @property
+    def in_flight(self) -> int:
+        """requests waiting for a response"""
+        return len(self.requests)
 
-        logger.debug(f"Sending request: {message}")
+    def next_id(self) -> int:
+        """allocate a request id, ids increase monotonically and are unique per map"""
+        return next(self._ids)
 
-        future = Future[types.JSONRPCResponse | None]()
+    async def send_request(
+        self, message: types.JSONRPCRequest, timeout: float | None = None
+    ) -> types.JSONRPCResponse | None:
+        """send a request and wait for the response
 
-        self.requests[str(message.id)] = future
+        raises TimeoutError if no response arrives within `timeout` seconds (or
+        `default_timeout`), time spent waiting for room in a full outgoing queue
+        included. if a sent request times out or the caller is cancelled the
+        server is sent a cancellation notification.
+        """
 
-        wrapped_message = types.JSONRPCMessage(message)
-        self.outgoing_messages.put_nowait(wrapped_message)
-        return future
+        if __debug__:
+            log_payload("Sending request: {}", message)
+
+        if self.closed is not None:
+            raise TransportClosedError(f"Transport closed: {self.closed!r}") from self.closed
+
+        # registered before queueing, so fail_all also reaches a sender waiting for room
+        request_id = message.id
+        future = asyncio.get_running_loop().create_future()
+
+        self.requests[request_id] = future
+
+        if timeout is None:
+            timeout = self.default_timeout
+
+        sent = False
+        try:
+            async with asyncio.timeout(timeout):
+                sent = await self._enqueue(types.JSONRPCMessage(message), future)
+                return await future
+        except TimeoutError:
+            if sent:
+                self.cancel_request(message, f"Request timed out after {timeout}s")
+            raise
+        except asyncio.CancelledError:
+            if sent:
+                self.cancel_request(message, "Request cancelled by client")
+            raise
+        finally:
+            self.requests.pop(request_id, None)
+
+    async def send_batch(
+        self, messages: Sequence[types.JSONRPCRequest], timeout: float | None = None
+    ) -> list[types.JSONRPCResponse | None]:
+        """send requests as one json-rpc batch and wait for all responses
+
+        responses are returned in the order of `messages`, an error response is
+        None like in `send_request`. on timeout or cancellation the requests
+        still unanswered are cancelled.
+        """
+
+        if self.closed is not None:
+            raise TransportClosedError(f"Transport closed: {self.closed!r}") from self.closed
+
+        if not messages:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures: list[Future[types.JSONRPCResponse | None]] = []
+        for message in messages:
+            future = loop.create_future()
+            self.requests[message.id] = future
+            futures.append(future)
+
+        if timeout is None:
+            timeout = self.default_timeout
+
+        batch = JSONRPCBatch([types.JSONRPCMessage(message) for message in messages])
+
+        if __debug__:
+            log_payload("Sending batch: {}", batch)
+
+        sent = False
+        try:
+            async with asyncio.timeout(timeout):
+                # fail_all fails every future, watching the first one is enough
+                sent = await self._enqueue(batch, futures[0])
+                return await asyncio.gather(*futures)
+        except TimeoutError:
+            if sent:
+                self._cancel_pending(messages, futures, f"Request timed out after {timeout}s")
+            raise
+        except asyncio.CancelledError:
+            if sent:
+                self._cancel_pending(messages, futures, "Request cancelled by client")
+            raise
+        finally:
+            for message in messages:
+                self.requests.pop(message.id, None)
+
+    async def _enqueue(
+        self,
+        item: types.JSONRPCMessage | JSONRPCBatch,
+        future: Future[types.JSONRPCResponse | None],
+    ) -> bool:
+        """queue `item`, waiting for room unless `future` finishes first
+
+        `future` fails once the transport dies, a sender blocked on a full queue
+        is released then instead of waiting forever. true if `item` was queued.
+        """
+
+        queue = self.outgoing_messages
+        if not queue.full():
+            await queue.put(item)
+            return True
+
+        put = asyncio.ensure_future(queue.put(item))
+        try:
+            await asyncio.wait((put, future), return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            put.cancel()
+            raise
+
+        if not put.done():
+            put.cancel()
+            return False
+
+        put.result()
+        return True
+
+    def _cancel_pending(
+        self,
+        messages: Sequence[types.JSONRPCRequest],
+        futures: list[Future[types.JSONRPCResponse | None]],
+        reason: str,
+    ):
+        for message, future in zip(messages, futures):
+            if not future.done() or future.cancelled():
+                self.cancel_request(message, reason)
+
+    def cancel_request(self, message: types.JSONRPCRequest, reason: str | None = None):
+        """tell the server to stop working on a request"""
+
+        # the initialize request must not be cancelled
+        if message.method == "initialize":
+            return
+
+        logger.debug(f"Cancelling request {message.id}: {reason}")
+
+        notification = types.ClientNotification(
+            types.CancelledNotification(
+                method="notifications/cancelled",
+                params=types.CancelledNotificationParams(
+                    requestId=message.id, reason=reason
+                ),
+            )
+        )
+
+        try:
+            self.outgoing_messages.put_nowait(
+                types.JSONRPCMessage(
+                    types.JSONRPCNotification(
+                        jsonrpc="2.0",
+                        **notification.model_dump(
+                            by_alias=True, mode="json", exclude_none=True
+                        ),
+                    )
+                )
+            )
+        except asyncio.QueueFull:
+            logger.warning(f"Outgoing queue full, not cancelling request {message.id}")
+
+    def fail_all(self, error: BaseException):
+        """fail every pending request and refuse new ones"""
+
+        self.closed = error
+
+        requests, self.requests = self.requests, {}
+        for future in requests.values():
+            if not future.done():
+                failure = TransportClosedError(f"Transport closed: {error!r}")
+                failure.__cause__ = error
+                future.set_exception(failure)
+
+    def fail_request(self, request_id: types.RequestId, error: BaseException):
+        """fail a pending request whose response could not be delivered"""
+
+        future = self.requests.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
 
     def resolve_request(self, message: types.JSONRPCResponse):
         """resolve a request"""
 
-        logger.debug(f"Resolving request: {message}")
+        if __debug__:
+            log_payload("Resolving request: {}", message)
 
         request_id = message.id
-        future = self.requests.pop(str(request_id), None)
-        if future is not None:
+        future = self.requests.pop(request_id, None)
+        if future is not None and not future.done():
             future.set_result(message)
 
     def resolve_error(self, message: types.JSONRPCError):
         """resolve an error"""
 
-        logger.debug(f"Resolving error: {message}")
+        if __debug__:
+            log_payload("Resolving error: {}", message)
 
         request_id = message.id
-        future = self.requests.pop(str(request_id), None)
-        if future is not None:
-            future.set_result(None)
\ No newline at end of file
+        future = self.requests.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(None)
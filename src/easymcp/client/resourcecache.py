@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from typing import NamedTuple
+
+from mcp import types
+from pydantic import BaseModel
+
+
+class ResourceCacheStats(BaseModel):
+    """counters of a resource cache"""
+
+    entries: int
+    """resources currently cached"""
+
+    bytes: int
+    """approximate size of the cached contents"""
+
+    hits: int
+    """reads answered from the cache"""
+
+    misses: int
+    """reads sent to a server"""
+
+    updates: int
+    """entries dropped because the server reported an update"""
+
+    evictions: int
+    """entries dropped to stay within `max_bytes`"""
+
+
+class _Entry(NamedTuple):
+    result: types.ReadResourceResult
+    size: int
+
+
+_Key = tuple[str, str]
+
+
+class ResourceCache:
+    """contents of subscribed resources, keyed by server and uri
+
+    entries stay valid until the server reports an update for their uri, there
+    is no ttl. the least recently used entries are evicted once the contents
+    exceed `max_bytes`. cached results are shared, treat them as read-only.
+    """
+
+    max_bytes: int
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._versions: dict[_Key, int] = dict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, server: str, uri: str) -> types.ReadResourceResult | None:
+        """cached contents of a resource, counts a hit or a miss"""
+
+        entry = self._entries.get((server, uri))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end((server, uri))
+        self.hits += 1
+        return entry.result
+
+    def version(self, server: str, uri: str) -> int:
+        """counter bumped on every update, read it before reading the resource"""
+        return self._versions.get((server, uri), 0)
+
+    def put(
+        self,
+        server: str,
+        uri: str,
+        result: types.ReadResourceResult,
+        version: int | None = None,
+    ) -> None:
+        """store the contents of a resource
+
+        if `version` is given and the resource was updated since it was read,
+        the contents are not stored.
+        """
+
+        key = (server, uri)
+        if version is not None and version != self.version(server, uri):
+            return
+
+        size = len(result.model_dump_json())
+        if size > self.max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = _Entry(result, size)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    def updated(self, server: str, uri: str) -> None:
+        """drop a resource the server reported as updated"""
+
+        key = (server, uri)
+        self._versions[key] = self.version(server, uri) + 1
+
+        if key in self._entries:
+            self._discard(key)
+            self.updates += 1
+
+    def remove(self, server: str) -> None:
+        """forget every resource of a server"""
+
+        for key in [key for key in self._entries if key[0] == server]:
+            self._discard(key)
+
+        for key in [key for key in self._versions if key[0] == server]:
+            self._versions[key] += 1
+
+    def stats(self) -> ResourceCacheStats:
+        """snapshot of the cache counters"""
+
+        return ResourceCacheStats(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            hits=self.hits,
+            misses=self.misses,
+            updates=self.updates,
+            evictions=self.evictions,
+        )
+
+    def _discard(self, key: _Key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
@@ -0,0 +1,205 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, NamedTuple
+
+from mcp import types
+from pydantic import BaseModel
+
+
+class ResultCacheStats(BaseModel):
+    """counters of a tool result cache"""
+
+    entries: int
+    """results currently cached"""
+
+    bytes: int
+    """approximate size of the cached results"""
+
+    hits: int
+    """calls answered from the cache"""
+
+    misses: int
+    """calls sent to a server"""
+
+    coalesced: int
+    """calls that waited for an identical call already in flight"""
+
+    evictions: int
+    """results dropped to stay within `max_bytes`"""
+
+
+class _Entry(NamedTuple):
+    result: types.CallToolResult
+    expires: float
+    size: int
+
+
+_Key = tuple[str, str, str]
+
+
+class ToolResultCache:
+    """results of tool calls keyed by server, tool and canonical arguments
+
+    results are kept for the tool's ttl and evicted least recently used first
+    once their total size exceeds `max_bytes`. identical calls made while one
+    is in flight wait for its result instead of reaching the server. error
+    results are never cached. cached results are shared, treat them as
+    read-only.
+    """
+
+    max_bytes: int
+    default_ttl: float
+    ttls: dict[str, float]
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+    ):
+        """`ttls` maps `<server>.<tool>` to seconds, 0 disables caching for a tool"""
+
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._inflight: dict[_Key, asyncio.Future[types.CallToolResult]] = dict()
+        self._generations: dict[str, int] = dict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, server: str, tool: str) -> float:
+        """seconds a result of the tool is kept"""
+        return self.ttls.get(f"{server}.{tool}", self.default_ttl)
+
+    @staticmethod
+    def key(server: str, tool: str, args: dict) -> _Key:
+        """cache key, arguments are canonicalized so key order does not matter"""
+
+        canonical = json.dumps(args, sort_keys=True, separators=(",", ":"), default=str)
+        return server, tool, canonical
+
+    async def get_or_call(
+        self,
+        server: str,
+        tool: str,
+        args: dict,
+        call: Callable[[], Awaitable[types.CallToolResult]],
+    ) -> types.CallToolResult:
+        """return a cached result, or run `call` once for all identical callers"""
+
+        ttl = self.ttl(server, tool)
+        if ttl <= 0:
+            return await call()
+
+        key = self.key(server, tool, args)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.result
+            self._discard(key)
+
+        while (inflight := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # the caller that owned the call was cancelled, take over
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task and task.cancelling()):
+                    raise
+
+        return await self._call(key, ttl, call)
+
+    async def _call(
+        self,
+        key: _Key,
+        ttl: float,
+        call: Callable[[], Awaitable[types.CallToolResult]],
+    ) -> types.CallToolResult:
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generations.get(key[0], 0)
+        self.misses += 1
+
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # waiters get the exception, keep asyncio from reporting it as lost
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+
+        # results from before an invalidation are handed out but not stored
+        if not result.isError and generation == self._generations.get(key[0], 0):
+            self._store(key, result, ttl)
+
+        return result
+
+    def invalidate(self, server: str) -> None:
+        """drop every result of a server"""
+
+        self._generations[server] = self._generations.get(server, 0) + 1
+
+        for key in [key for key in self._entries if key[0] == server]:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """drop every result"""
+
+        for server in {key[0] for key in [*self._entries, *self._inflight]}:
+            self._generations[server] = self._generations.get(server, 0) + 1
+
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> ResultCacheStats:
+        """snapshot of the cache counters"""
+
+        return ResultCacheStats(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            evictions=self.evictions,
+        )
+
+    def _store(self, key: _Key, result: types.CallToolResult, ttl: float) -> None:
+        size = len(result.model_dump_json())
+        if size > self.max_bytes:
+            return
+
+        self._discard(key)
+        self._entries[key] = _Entry(result, time.monotonic() + ttl, size)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+    def _discard(self, key: _Key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
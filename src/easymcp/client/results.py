@@ -0,0 +1,35 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StartupReport(BaseModel):
+    """outcome of starting a group of servers"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    started: list[str] = Field(default_factory=list)
+    """servers that came up"""
+
+    failed: dict[str, BaseException] = Field(default_factory=dict)
+    """servers that failed to start, mapped to the error they raised"""
+
+    @property
+    def ok(self) -> bool:
+        """true if every server started"""
+        return not self.failed
+
+
+class PartialResult[T](BaseModel):
+    """items gathered from the servers that answered, plus errors from those that did not"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    items: list[T] = Field(default_factory=list)
+    """items returned by the servers that answered in time"""
+
+    errors: dict[str, BaseException] = Field(default_factory=dict)
+    """servers that failed or timed out, mapped to the error they raised"""
+
+    @property
+    def complete(self) -> bool:
+        """true if every server answered"""
+        return not self.errors
@@ -1,13 +1,17 @@
-from typing import Protocol, runtime_checkable, Awaitable, Callable
+from typing import AsyncIterator, Protocol, Sequence, TypeAlias, runtime_checkable, Awaitable, Callable
 
 from mcp import types
 
+ProgressCallback: TypeAlias = Callable[[types.ProgressNotificationParams], Awaitable[None]]
+
 # === Core Capability Protocols ===
 
 @runtime_checkable
 class ToolsCompatible(Protocol):
     async def list_tools(self, force: bool = False) -> types.ListToolsResult: ...
-    async def call_tool(self, tool_name: str, args: dict) -> types.CallToolResult: ...
+    async def call_tool(
+        self, tool_name: str, args: dict, *, progress_callback: ProgressCallback | None = None
+    ) -> types.CallToolResult: ...
 
 
 @runtime_checkable
@@ -22,6 +26,36 @@ class PromptsCompatible(Protocol):
     async def read_prompt(self, prompt_name: str, args: dict) -> types.GetPromptResult: ...
 
 
+# === Streaming List Protocols ===
+
+@runtime_checkable
+class IterToolsCompatible(ToolsCompatible, Protocol):
+    def iter_tools(self) -> AsyncIterator[types.Tool]: ...
+
+
+@runtime_checkable
+class IterResourcesCompatible(ResourcesCompatible, Protocol):
+    def iter_resources(self) -> AsyncIterator[types.Resource]: ...
+
+
+@runtime_checkable
+class IterPromptsCompatible(PromptsCompatible, Protocol):
+    def iter_prompts(self) -> AsyncIterator[types.Prompt]: ...
+
+
+@runtime_checkable
+class BatchCompatible(ToolsCompatible, ResourcesCompatible, Protocol):
+    batching: bool
+    @property
+    def supports_batches(self) -> bool: ...
+    async def call_tools(
+        self, calls: Sequence[tuple[str, dict]], timeout: float | None = None
+    ) -> list[types.CallToolResult | BaseException]: ...
+    async def read_resources(
+        self, resource_names: Sequence[str], timeout: float | None = None
+    ) -> list[types.ReadResourceResult | BaseException]: ...
+
+
 # === Session Lifecycle Protocols ===
 
 @runtime_checkable
@@ -35,6 +69,12 @@ class LifeSpanProtocol(InitializerProtocol, Protocol):
     async def stop(self) -> None: ...
 
 
+@runtime_checkable
+class HealthCompatible(Protocol):
+    @property
+    def healthy(self) -> bool: ...
+
+
 # === Reactive / Push-capable Protocols ===
 
 @runtime_checkable
@@ -58,6 +98,17 @@ class PushingResourcesCompatible(ResourcesCompatible, Protocol):
     ) -> None: ...
 
 
+@runtime_checkable
+class SubscribableResourcesCompatible(ResourcesCompatible, Protocol):
+    @property
+    def supports_subscriptions(self) -> bool: ...
+    async def subscribe_resource(self, resource_name: str) -> None: ...
+    async def unsubscribe_resource(self, resource_name: str) -> None: ...
+    async def register_resource_updated_callback(
+        self, callback: Callable[[str], Awaitable[None]]
+    ) -> None: ...
+
+
 @runtime_checkable
 class PushingRootsCompatible(Protocol):
     async def register_roots_callback(
@@ -71,6 +122,18 @@ class PushingSamplingCompatible(Protocol):
         self, callback: Callable[[types.CreateMessageRequest], Awaitable[types.CreateMessageResult]]
     ) -> None: ...
 
+@runtime_checkable
+class PushingHealthCompatible(HealthCompatible, Protocol):
+    async def register_transport_closed_callback(
+        self, callback: Callable[[BaseException], Awaitable[None]]
+    ) -> None: ...
+
+@runtime_checkable
+class InvalidatingCompatible(Protocol):
+    def add_invalidation_hook(
+        self, hook: Callable[[types.ServerNotification], None]
+    ) -> None: ...
+
 # === Top-Level Session Protocols ===
 
 @runtime_checkable
@@ -6,6 +6,7 @@ from mcp.server.fastmcp import FastMCP
 
 from easymcp.client.sessions.GenericSession import (
     BaseSessionProtocol,
+    ProgressCallback,
     PromptsCompatible,
     ResourcesCompatible,
     ToolsCompatible,
@@ -99,7 +100,13 @@ class FastMCPSession(
         }
         return types.ReadResourceResult.model_validate(result)
 
-    async def call_tool(self, tool_name: str, args: dict) -> types.CallToolResult:
-        """Call a tool"""
+    async def call_tool(
+        self,
+        tool_name: str,
+        args: dict,
+        *,
+        progress_callback: ProgressCallback | None = None,
+    ) -> types.CallToolResult:
+        """Call a tool, in-process calls report no progress"""
         content = await self.session.call_tool(tool_name, args)
         return types.CallToolResult(content=list(content))
@@ -1,25 +1,45 @@
 from asyncio import Queue, Task, create_task
 import asyncio
+from collections import deque
+from functools import partial
 from inspect import iscoroutinefunction
 import json
-from typing import Awaitable, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Sequence
 
 from loguru import logger
-
-from easymcp.client.iobuffers import reader, writer
+import pydantic
+
+from easymcp.client.batches import BATCH_PROTOCOL_VERSION, BATCH_PROTOCOL_VERSIONS
+from easymcp.client.debuglog import log_payload
+from easymcp.client.decoding import DecodedNotification, DecodedRequest
+from easymcp.client.errors import QueueFullError, TransportClosedError
+from easymcp.client.iobuffers import TransportCounters, TransportStats, reader, writer
+from easymcp.client.metrics import Sample
+from easymcp.client.queues import MessageQueue, OutgoingOverflowPolicy, OverflowPolicy, QueueStats
 from easymcp.client.requestmap import RequestMap
+from easymcp.client.snapshots import (
+    FrozenPrompt,
+    FrozenResource,
+    FrozenTool,
+    ListPromptsSnapshot,
+    ListResourcesSnapshot,
+    ListToolsSnapshot,
+)
 from easymcp.client.transports.generic import TransportProtocol
 
-from easymcp.client.utils import CreateJsonRPCRequest
+from easymcp.client.utils import CreateJsonRPCRequest, create_request
 from mcp import types
 
-from easymcp.client.sessions.GenericSession import BaseSessionProtocol
+from easymcp.client.sessions.GenericSession import BaseSessionProtocol, ProgressCallback
 
 class MCPClientSession(BaseSessionProtocol):
     """ClientSession class"""
 
-    incoming_messages: Queue[types.JSONRPCMessage]
-    outgoing_messages: Queue[types.JSONRPCMessage]
+    incoming_messages: MessageQueue
+    outgoing_messages: MessageQueue
+
+    transport_counters: TransportCounters
+    """messages and bytes moved by the reader and writer"""
 
     reader_task: Task[None]
     writer_task: Task[None]
@@ -34,24 +54,85 @@ class MCPClientSession(BaseSessionProtocol):
     tools_changed_callback: Callable[[], Awaitable[None]] | None = None
     prompts_changed_callback: Callable[[], Awaitable[None]] | None = None
     resources_changed_callback: Callable[[], Awaitable[None]] | None = None
+    transport_closed_callback: Callable[[BaseException], Awaitable[None]] | None = None
+    resource_updated_callback: Callable[[str], Awaitable[None]] | None = None
 
-    _tools: types.ListToolsResult | None = None
-    _prompts: types.ListPromptsResult | None = None
-    _resources: types.ListResourcesResult | None = None
+    server_capabilities: types.ServerCapabilities | None = None
+    """capabilities the server announced during initialize"""
 
-    def __init__(self, transport: TransportProtocol):
-        self.transport = transport
+    protocol_version: str | None = None
+    """protocol version agreed on during initialize"""
+
+    batching: bool = False
+    """propose a protocol version with json-rpc batches, set before start()"""
+
+    failure: BaseException | None = None
+    """error that killed the transport, None while it is alive"""
+
+    _stopping: bool = False
+    _transport_closed_task: Task[None] | None = None
+
+    _tools: ListToolsSnapshot | None = None
+    _prompts: ListPromptsSnapshot | None = None
+    _resources: ListResourcesSnapshot | None = None
+
+    request_timeout: float | None = None
+    """default seconds to wait for a response, None waits forever"""
+
+    max_concurrent_handlers: int = 16
+    """server requests and notification callbacks handled at once, the rest wait in order for a free slot"""
+
+    max_pending_handlers: int = 1024
+    """handlers waiting for a slot, beyond that requests are answered with an error and notifications dropped"""
+
+    max_batch_bytes: int = 256 * 1024
+    """queued outgoing messages are coalesced into writes of up to this many bytes"""
 
-        # define message queues
-        self.incoming_messages = Queue()
-        self.outgoing_messages = Queue()
+    _handler_tasks: set[Task[None]]
+    _pending_handlers: deque[tuple[types.RequestId | None, Coroutine[Any, Any, None]]]
+    _server_requests: dict[types.RequestId, Task[None]]
+    _progress: dict[types.ProgressToken, Queue[types.ProgressNotificationParams | None]]
+    _invalidation_hooks: list[Callable[[types.ServerNotification], None]]
+
+    def __init__(
+        self,
+        transport: TransportProtocol,
+        request_timeout: float | None = None,
+        max_concurrent_handlers: int = 16,
+        max_pending_handlers: int = 1024,
+        queue_size: int = 1024,
+        overflow: OverflowPolicy = "block",
+        outgoing_overflow: OutgoingOverflowPolicy = "block",
+        max_batch_bytes: int = 256 * 1024,
+        batching: bool = False,
+    ):
+        if max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1")
+
+        self.transport = transport
+        self.request_timeout = request_timeout
+        self.max_concurrent_handlers = max_concurrent_handlers
+        self.max_pending_handlers = max_pending_handlers
+        self.max_batch_bytes = max_batch_bytes
+        self.batching = batching
+
+        self._handler_tasks = set()
+        self._pending_handlers = deque()
+        self._server_requests = dict()
+        self._progress = dict()
+        self._invalidation_hooks = []
+
+        # define message queues, bounded so a chatty server cannot grow memory without limit
+        self.incoming_messages = MessageQueue(queue_size, overflow)
+        self.outgoing_messages = MessageQueue(queue_size, outgoing_overflow)
+        self.transport_counters = TransportCounters()
 
         self._tools = None
 
     async def init(self):
         """initialize the client session"""
         await self.transport.init()
-        self.request_map = RequestMap(self.outgoing_messages)
+        self.request_map = RequestMap(self.outgoing_messages, self.request_timeout)
 
     @staticmethod
     def _validate_async_callback(callback: Callable, name: str):
@@ -83,6 +164,276 @@ class MCPClientSession(BaseSessionProtocol):
         self._validate_async_callback(callback, "resources_changed_callback")
         self.resources_changed_callback = callback
 
+    async def register_resource_updated_callback(self, callback: Callable[[str], Awaitable[None]]):
+        """register a callback for updates of subscribed resources, called with the uri"""
+        self._validate_async_callback(callback, "resource_updated_callback")
+        self.resource_updated_callback = callback
+
+    async def register_transport_closed_callback(self, callback: Callable[[BaseException], Awaitable[None]]):
+        """register a callback for the transport dying unexpectedly"""
+        self._validate_async_callback(callback, "transport_closed_callback")
+        self.transport_closed_callback = callback
+
+    def add_invalidation_hook(self, hook: Callable[[types.ServerNotification], None]):
+        """run `hook` on every server notification but progress and cancellations
+
+        hooks run inline in the message loop, before any callback and whether
+        handler slots are free or not. they must be quick and must not block,
+        e.g. to drop cache entries the notification makes stale.
+        """
+        self._invalidation_hooks.append(hook)
+
+    def queue_stats(self) -> dict[str, QueueStats]:
+        """depth and overflow counters of the incoming and outgoing queues"""
+        return {
+            "incoming": self.incoming_messages.stats(),
+            "outgoing": self.outgoing_messages.stats(),
+        }
+
+    def transport_stats(self) -> TransportStats:
+        """messages and bytes sent and received so far"""
+        return self.transport_counters.stats()
+
+    @property
+    def in_flight(self) -> int:
+        """requests waiting for a response from the server"""
+        request_map: RequestMap | None = getattr(self, "request_map", None)
+        return request_map.in_flight if request_map is not None else 0
+
+    def collect_metrics(self) -> Iterable[Sample]:
+        """in-flight requests, queue depths and transport traffic, see `easymcp.client.metrics`"""
+
+        yield Sample(name="easymcp_requests_in_flight", value=self.in_flight)
+        yield Sample(name="easymcp_handlers_in_flight", value=len(self._handler_tasks))
+        yield Sample(name="easymcp_handlers_pending", value=len(self._pending_handlers))
+
+        for queue, stats in self.queue_stats().items():
+            labels = {"queue": queue}
+            yield Sample(name="easymcp_queue_depth", labels=labels, value=stats.depth)
+            yield Sample(name="easymcp_queue_dropped_total", labels=labels, value=stats.dropped, kind="counter")
+            yield Sample(name="easymcp_queue_rejected_total", labels=labels, value=stats.rejected, kind="counter")
+
+        traffic = self.transport_counters
+        for direction, messages, size in (
+            ("sent", traffic.messages_sent, traffic.bytes_sent),
+            ("received", traffic.messages_received, traffic.bytes_received),
+        ):
+            labels = {"direction": direction}
+            yield Sample(name="easymcp_transport_messages_total", labels=labels, value=messages, kind="counter")
+            yield Sample(name="easymcp_transport_bytes_total", labels=labels, value=size, kind="counter")
+
+    @property
+    def healthy(self) -> bool:
+        """true while the session is started and its transport is alive"""
+        return self.transport.state == "started" and self.failure is None
+
+    def _watch_io_task(self, task: Task[None]):
+        """treat the reader or writer exiting on its own as a dead transport"""
+
+        def _done(task: Task[None]):
+            if self._stopping or task.cancelled():
+                return
+
+            error = task.exception() or TransportClosedError("Transport closed")
+            self._mark_failed(error)
+
+        task.add_done_callback(_done)
+
+    def _mark_failed(self, error: BaseException):
+        """fail all in-flight requests and report the dead transport"""
+
+        if self.failure is not None:
+            return
+
+        logger.error(f"Transport closed unexpectedly: {error!r}")
+
+        self.failure = error
+        self.request_map.fail_all(error)
+
+        if self.transport_closed_callback is not None:
+            self._transport_closed_task = create_task(self._notify_transport_closed(error))
+
+    async def _notify_transport_closed(self, error: BaseException):
+        if self.transport_closed_callback is None:
+            return
+        try:
+            await self.transport_closed_callback(error)
+        except Exception as e:
+            logger.error(f"Transport closed callback failed: {e!r}")
+
+    def _dispatch(self, handler: Coroutine[Any, Any, None], request_id: types.RequestId | None = None) -> bool:
+        """run a handler as its own task or queue it until a slot is free, never waits
+
+        returns False if the pending queue is full and the handler was dropped.
+        """
+
+        if len(self._handler_tasks) < self.max_concurrent_handlers:
+            self._start_handler(handler, request_id)
+            return True
+
+        if len(self._pending_handlers) >= self.max_pending_handlers:
+            handler.close()
+            return False
+
+        self._pending_handlers.append((request_id, handler))
+        return True
+
+    def _start_handler(self, handler: Coroutine[Any, Any, None], request_id: types.RequestId | None):
+        async def _run():
+            try:
+                await handler
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Message handler failed: {e!r}")
+
+        task = create_task(_run())
+        self._handler_tasks.add(task)
+        if request_id is not None:
+            self._server_requests[request_id] = task
+
+        def _done(task: Task[None]):
+            self._handler_tasks.discard(task)
+
+            # a task cancelled before its first step never runs the handler or its cleanup
+            if task.cancelled():
+                handler.close()
+            if request_id is not None and self._server_requests.get(request_id) is task:
+                del self._server_requests[request_id]
+
+            # hand the freed slot to the oldest waiting handler
+            if self._pending_handlers and not self._stopping:
+                pending_id, pending = self._pending_handlers.popleft()
+                self._start_handler(pending, pending_id)
+
+        task.add_done_callback(_done)
+
+    def _cancel_server_request(self, request_id: types.RequestId):
+        """cancel a running or waiting handler of a server request"""
+
+        task = self._server_requests.get(request_id)
+        if task is not None:
+            task.cancel()
+            return
+
+        for entry in self._pending_handlers:
+            if entry[0] == request_id:
+                self._pending_handlers.remove(entry)
+                entry[1].close()
+                return
+
+    async def _with_progress[R](self, token: types.ProgressToken, callback: ProgressCallback, request: Awaitable[R]) -> R:
+        """route progress notifications for `token` to `callback` while `request` runs"""
+
+        events: Queue[types.ProgressNotificationParams | None] = Queue()
+        self._progress[token] = events
+
+        async def _deliver():
+            while (event := await events.get()) is not None:
+                try:
+                    await callback(event)
+                except Exception as e:
+                    logger.error(f"Progress callback failed: {e!r}")
+
+        delivery = create_task(_deliver())
+
+        try:
+            result = await request
+        except BaseException:
+            delivery.cancel()
+            raise
+        finally:
+            self._progress.pop(token, None)
+            events.put_nowait(None)
+
+        await delivery
+        return result
+
+    async def _dispatch_request(self, request_id: types.RequestId, request: types.ServerRequest):
+        """handle a server request and send the response or an error"""
+
+        try:
+            response = await self.handle_request(request)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logger.error(f"Failed to handle request {request_id}: {e!r}")
+            error = types.JSONRPCError(
+                jsonrpc="2.0",
+                id=request_id,
+                error=types.ErrorData(code=types.INTERNAL_ERROR, message=str(e)),
+            )
+            await self.outgoing_messages.put(types.JSONRPCMessage(error))
+            return
+        finally:
+            self._server_requests.pop(request_id, None)
+
+        if response is not None:
+            response_message = types.JSONRPCResponse(
+                jsonrpc="2.0",
+                id=request_id,
+                result=response,
+            )
+            await self.outgoing_messages.put(types.JSONRPCMessage(response_message))
+
+    def _send_nowait(self, message: types.JSONRPCMessage):
+        """queue a message without waiting, it is dropped if the outgoing queue is full"""
+
+        try:
+            self.outgoing_messages.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(f"Outgoing queue full, dropping {message.root}")
+
+    def _reject_request(self, request_id: types.RequestId):
+        """answer a server request the client has no room for with an error"""
+
+        error = types.JSONRPCError(
+            jsonrpc="2.0",
+            id=request_id,
+            error=types.ErrorData(code=types.INTERNAL_ERROR, message="Client busy, request dropped"),
+        )
+        self._send_nowait(types.JSONRPCMessage(error))
+
+    def _reject_overflow(self, message: types.JSONRPCMessage):
+        """settle a message the full incoming queue refused
+
+        server requests are answered with an error, the caller waiting for a
+        dropped response fails with QueueFullError instead of hanging.
+        """
+
+        if isinstance(message.root, types.JSONRPCRequest):
+            self._reject_request(message.root.id)
+
+        elif isinstance(message.root, (types.JSONRPCResponse, types.JSONRPCError)) and message.root.id is not None:
+            self.request_map.fail_request(message.root.id, QueueFullError(f"Incoming queue full, response to request {message.root.id} dropped"))
+
+    def _route_request(self, request_id: types.RequestId, request: types.ServerRequest):
+        # callbacks may take long (e.g. sampling), keep resolving responses meanwhile
+        if not self._dispatch(self._dispatch_request(request_id, request), request_id):
+            logger.warning(f"Handlers busy, rejecting request {request_id}")
+            self._reject_request(request_id)
+
+    def _route_notification(self, notification: types.ServerNotification):
+        # progress is routed inline to keep the events of a call in order
+        if isinstance(notification.root, types.ProgressNotification):
+            events = self._progress.get(notification.root.params.progressToken)
+            if events is not None:
+                events.put_nowait(notification.root.params)
+            return
+
+        # the server gave up on one of its requests
+        if isinstance(notification.root, types.CancelledNotification):
+            self._cancel_server_request(notification.root.params.requestId)
+            return
+
+        if __debug__:
+            log_payload("Handling notification: {}", notification)
+
+        # caches are cleared inline, only registered callbacks need a task
+        callback = self._notification_callback(notification)
+        if callback is not None and not self._dispatch(self._run_callback(callback)):
+            logger.warning(f"Handlers busy, dropping {notification.root.method}")
+
     def _start_reading_messages(self):
         async def __start_reading_messages():
             while self.transport.state == "started":
@@ -94,15 +445,29 @@ class MCPClientSession(BaseSessionProtocol):
                 if isinstance(message.root, types.JSONRPCResponse):
                     self.request_map.resolve_request(message.root)
 
+                # notifications decoded by the reader are already typed
+                elif isinstance(message.root, DecodedNotification):
+                    self._route_notification(message.root.notification)
+
                 # handle notifications
                 elif isinstance(message.root, types.JSONRPCNotification):
                     if message.root.params is None:
                         logger.error(f"Received notification with no params: {message}")
                         continue
 
-                    notification = types.ServerNotification.model_validate(message.root)
+                    try:
+                        notification = types.ServerNotification.model_validate(
+                            message.root.model_dump(by_alias=True, exclude_none=True)
+                        )
+                    except pydantic.ValidationError:
+                        logger.error(f"Received unknown notification: {message}")
+                        continue
+
+                    self._route_notification(notification)
 
-                    await self.handle_notification(notification)
+                # requests decoded by the reader are already typed
+                elif isinstance(message.root, DecodedRequest):
+                    self._route_request(message.root.id, message.root.request)
 
                 # handle requests
                 elif isinstance(message.root, types.JSONRPCRequest):
@@ -110,16 +475,22 @@ class MCPClientSession(BaseSessionProtocol):
                         logger.error(f"Received request with no params: {message}")
                         continue
 
-                    request = types.ServerRequest.model_validate(message.root)
-
-                    response = await self.handle_request(request)
-                    if response is not None:
-                        response_message = types.JSONRPCResponse(
+                    try:
+                        request = types.ServerRequest.model_validate(
+                            message.root.model_dump(by_alias=True, exclude_none=True)
+                        )
+                    except pydantic.ValidationError:
+                        logger.error(f"Received unknown request: {message}")
+                        error = types.JSONRPCError(
                             jsonrpc="2.0",
                             id=message.root.id,
-                            result=response,
+                            error=types.ErrorData(code=types.METHOD_NOT_FOUND, message="Method not found"),
                         )
-                        await self.transport.send(response_message.model_dump_json())
+                        # never wait on the outgoing queue here, responses must keep flowing
+                        self._send_nowait(types.JSONRPCMessage(error))
+                        continue
+
+                    self._route_request(message.root.id, request)
 
                 # handle errors
                 elif isinstance(message.root, types.JSONRPCError):
@@ -144,8 +515,11 @@ class MCPClientSession(BaseSessionProtocol):
     async def start(self) -> types.InitializeResult:
         """start the client session"""
         await self.transport.start()
-        self.reader_task = await reader(self.transport, self.incoming_messages)
-        self.writer_task = await writer(self.transport, self.outgoing_messages)
+        self.reader_task = await reader(self.transport, self.incoming_messages, self.transport_counters, self._reject_overflow)
+        self.writer_task = await writer(self.transport, self.outgoing_messages, self.max_batch_bytes, self.transport_counters)
+
+        self._watch_io_task(self.reader_task)
+        self._watch_io_task(self.writer_task)
 
         self._start_reading_messages()
 
@@ -157,7 +531,7 @@ class MCPClientSession(BaseSessionProtocol):
             types.InitializeRequest(
                 method="initialize",
                 params=types.InitializeRequestParams(
-                    protocolVersion=types.LATEST_PROTOCOL_VERSION,
+                    protocolVersion=BATCH_PROTOCOL_VERSION if self.batching else types.LATEST_PROTOCOL_VERSION,
                     capabilities=types.ClientCapabilities(
                         sampling=sampling,
                         experimental={},
@@ -168,7 +542,7 @@ class MCPClientSession(BaseSessionProtocol):
             )
         )
 
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))  # type: ignore
+        response = await self.request_map.send_request(CreateJsonRPCRequest(request, self.request_map.next_id()))  # type: ignore
         if response is None:
             raise RuntimeError("Failed to initialize client session")
 
@@ -177,77 +551,181 @@ class MCPClientSession(BaseSessionProtocol):
             types.InitializedNotification(method="notifications/initialized")
         )
 
-        self.outgoing_messages.put_nowait(
-            types.JSONRPCNotification(
-                jsonrpc="2.0",
-                **notification.model_dump(
-                    by_alias=True, mode="json", exclude_none=True
-                ),
-            )  # type: ignore
+        await self.outgoing_messages.put(
+            types.JSONRPCMessage(
+                types.JSONRPCNotification(
+                    jsonrpc="2.0",
+                    **notification.model_dump(
+                        by_alias=True, mode="json", exclude_none=True
+                    ),
+                )
+            )
         )
 
         result = types.InitializeResult.model_validate(response.result)
+        self.server_capabilities = result.capabilities
+        self.protocol_version = str(result.protocolVersion)
         return result
 
     async def stop(self):
         """stop the client session"""
-        self.reader_task.cancel()
-        self.writer_task.cancel()
-        try:
-            await self.reader_task
-        except asyncio.CancelledError:
-            pass
 
-        try:
-            self.writer_task
-        except asyncio.CancelledError:
-            pass
+        self._stopping = True
 
-        self._start_reading_messages_task.cancel()
-        try:
-            await self._start_reading_messages_task
-        except asyncio.CancelledError:
-            pass
+        while self._pending_handlers:
+            self._pending_handlers.popleft()[1].close()
+
+        for handler in list(self._handler_tasks):
+            handler.cancel()
+        await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
+        # tasks may be missing if the session failed part way through start()
+        for name in ("reader_task", "writer_task", "_start_reading_messages_task"):
+            task: Task[None] | None = getattr(self, name, None)
+            if task is None:
+                continue
+
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.debug(f"{name} exited with error: {e!r}")
 
         await self.transport.stop()
         await asyncio.sleep(0)
 
-    async def list_tools(self, force: bool = False):
-        """list available tools"""
+    async def _send(self, method: str, params: dict[str, Any] | None = None, timeout: float | None = None) -> types.JSONRPCResponse | None:
+        """send a request with the next id of the session"""
+        request = create_request(self.request_map.next_id(), method, params)
+        return await self.request_map.send_request(request, timeout)
 
-        if not force and self._tools is not None:
-            return self._tools.model_copy(deep=True)
+    @property
+    def supports_batches(self) -> bool:
+        """true if batching was requested and the server agreed on a protocol version with batches"""
+        return self.batching and self.protocol_version in BATCH_PROTOCOL_VERSIONS
 
-        request = types.ClientRequest(
-            types.ListToolsRequest(
-                method="tools/list",
+    async def _send_many(self, requests: Sequence[tuple[str, dict[str, Any] | None]], timeout: float | None = None) -> list[types.JSONRPCResponse | None | BaseException]:
+        """send requests as one batch if the server supports it, concurrently otherwise
+
+        a failure is returned in place of the response it affects.
+        """
+
+        if not requests:
+            return []
+
+        if not self.supports_batches:
+            return await asyncio.gather(
+                *(self._send(method, params, timeout) for method, params in requests),
+                return_exceptions=True,
             )
-        )
 
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))
+        messages = [create_request(self.request_map.next_id(), method, params) for method, params in requests]
+
+        try:
+            return list(await self.request_map.send_batch(messages, timeout))
+        except Exception as e:
+            return [e] * len(messages)
 
+    @staticmethod
+    def _parse_result[R: pydantic.BaseModel](model: type[R], response: types.JSONRPCResponse | None | BaseException, error: str) -> R | BaseException:
+        if isinstance(response, BaseException):
+            return response
         if response is None:
-            result = types.ListToolsResult(tools=[])
-        else:
-            result = types.ListToolsResult.model_validate(response.result)
+            return RuntimeError(error)
 
-        self._tools = result.model_copy(deep=True)
+        try:
+            return model.model_validate(response.result)
+        except pydantic.ValidationError as e:
+            return e
+
+    @staticmethod
+    def _resource_params(resource_name: str) -> dict[str, Any]:
+        """params of a resource request"""
+        # TODO: validate uri
+        params = types.ReadResourceRequestParams(uri=resource_name)  # type: ignore
+        return params.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+    async def _iter_pages(self, method: str) -> AsyncIterator[dict[str, Any]]:
+        """send a list request and follow `nextCursor` until the last page"""
+
+        cursor: str | None = None
+        seen: set[str] = set()
+
+        while True:
+            # built by hand, the list request models of mcp do not carry a cursor in params
+            response = await self._send(method, {"cursor": cursor} if cursor is not None else None)
+            if response is None:
+                # a server without the capability has nothing to list
+                capability = getattr(self.server_capabilities, method.split("/")[0], None)
+                if cursor is None and self.server_capabilities is not None and capability is None:
+                    return
+
+                # a missing page must not pass for the end of the list
+                raise RuntimeError(f"Failed to list {method}" + (f" at cursor {cursor!r}" if cursor is not None else ""))
+
+            yield response.result
+
+            cursor = response.result.get("nextCursor")
+            if cursor is None:
+                return
+
+            if cursor in seen:
+                logger.warning(f"Server repeated cursor {cursor!r} for {method}, stopping")
+                return
+            seen.add(cursor)
+
+    async def list_tools(self, force: bool = False):
+        """list available tools
+
+        the result is an immutable snapshot shared with the cache, use
+        `model_copy(update=...)` to derive a modified copy.
+        """
+
+        if not force and self._tools is not None:
+            return self._tools
+
+        result = ListToolsSnapshot(tools=tuple([tool async for tool in self.iter_tools()]))
+
+        self._tools = result
 
         return result
 
-    async def call_tool(self, tool_name: str, args: dict):
-        """call a tool"""
-        request = types.ClientRequest(
-            types.CallToolRequest(
-                method="tools/call",
-                params=types.CallToolRequestParams(
-                    name=tool_name,
-                    arguments=args,
-                ),
-            )
-        )
+    async def iter_tools(self) -> AsyncIterator[FrozenTool]:
+        """stream tools page by page, bypassing the cache"""
+
+        async for page in self._iter_pages("tools/list"):
+            for tool in page.get("tools", []):
+                yield FrozenTool.model_validate(tool)
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        args: dict,
+        timeout: float | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ):
+        """call a tool
 
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))
+        `progress_callback` receives the progress notifications of this call in
+        order, all of them have been delivered when call_tool returns.
+        """
+
+        request_id = self.request_map.next_id()
+        params: dict[str, Any] = {"name": tool_name, "arguments": args}
+
+        if progress_callback is not None:
+            self._validate_async_callback(progress_callback, "progress_callback")
+            # request ids are unique within the session, reuse it as progress token
+            params["_meta"] = {"progressToken": request_id}
+
+        send = self.request_map.send_request(create_request(request_id, "tools/call", params), timeout)
+
+        if progress_callback is None:
+            response = await send
+        else:
+            response = await self._with_progress(request_id, progress_callback, send)
         
         if response is None:
             raise RuntimeError("Failed to call tool")
@@ -256,43 +734,39 @@ class MCPClientSession(BaseSessionProtocol):
 
         return result
 
+    async def call_tools(self, calls: Sequence[tuple[str, dict]], timeout: float | None = None) -> list[types.CallToolResult | BaseException]:
+        """call many tools, as one json-rpc batch if the server supports it
+
+        calls are `(tool_name, args)` pairs. results are returned in the order of
+        `calls`, a failed call is returned as its exception.
+        """
+
+        responses = await self._send_many([("tools/call", {"name": name, "arguments": args}) for name, args in calls], timeout)
+        return [self._parse_result(types.CallToolResult, response, "Failed to call tool") for response in responses]
+
     async def list_resources(self, force: bool = False):
         """list available resources"""
 
         if not force and self._resources is not None:
-            return self._resources.model_copy(deep=True)
+            return self._resources
 
-        request = types.ClientRequest(
-            types.ListResourcesRequest(
-                method="resources/list",
-            )
-        )
+        result = ListResourcesSnapshot(resources=tuple([resource async for resource in self.iter_resources()]))
 
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))
+        self._resources = result
 
-        if response is None:
-            result = types.ListResourcesResult(resources=[])
-        else:
-            result = types.ListResourcesResult.model_validate(response.result)
+        return result
 
-        self._resources = result.model_copy(deep=True)
+    async def iter_resources(self) -> AsyncIterator[FrozenResource]:
+        """stream resources page by page, bypassing the cache"""
 
-        return result
+        async for page in self._iter_pages("resources/list"):
+            for resource in page.get("resources", []):
+                yield FrozenResource.model_validate(resource)
 
-    async def read_resource(self, resource_name: str):
+    async def read_resource(self, resource_name: str, timeout: float | None = None):
         """read a resource"""
 
-        request = types.ClientRequest(
-            types.ReadResourceRequest(
-                method="resources/read",
-                params=types.ReadResourceRequestParams(
-                    # TODO: validate uri
-                    uri=resource_name,  # type: ignore
-                ),
-            )
-        )
-
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))
+        response = await self._send("resources/read", self._resource_params(resource_name), timeout)
         
         if response is None:
             raise RuntimeError("Failed to read resource")
@@ -301,43 +775,65 @@ class MCPClientSession(BaseSessionProtocol):
 
         return result
 
+    async def read_resources(self, resource_names: Sequence[str], timeout: float | None = None) -> list[types.ReadResourceResult | BaseException]:
+        """read many resources, as one json-rpc batch if the server supports it
+
+        results are returned in the order of `resource_names`, a failed read is
+        returned as its exception.
+        """
+
+        responses = await self._send_many([("resources/read", self._resource_params(name)) for name in resource_names], timeout)
+        return [self._parse_result(types.ReadResourceResult, response, "Failed to read resource") for response in responses]
+
+    @property
+    def supports_subscriptions(self) -> bool:
+        """true if the server announced resource subscriptions"""
+        resources = self.server_capabilities and self.server_capabilities.resources
+        return bool(resources and resources.subscribe)
+
+    async def subscribe_resource(self, resource_name: str, timeout: float | None = None):
+        """ask the server to send updates for a resource"""
+
+        response = await self._send("resources/subscribe", self._resource_params(resource_name), timeout)
+
+        if response is None:
+            raise RuntimeError("Failed to subscribe to resource")
+
+    async def unsubscribe_resource(self, resource_name: str, timeout: float | None = None):
+        """stop receiving updates for a resource"""
+
+        response = await self._send("resources/unsubscribe", self._resource_params(resource_name), timeout)
+
+        if response is None:
+            raise RuntimeError("Failed to unsubscribe from resource")
+
     async def list_prompts(self, force: bool = False):
         """list available prompts"""
 
         if not force and self._prompts is not None:
-            return self._prompts.model_copy(deep=True)
+            return self._prompts
 
-        request = types.ClientRequest(
-            types.ListPromptsRequest(
-                method="prompts/list",
-            )
-        )
+        result = ListPromptsSnapshot(prompts=tuple([prompt async for prompt in self.iter_prompts()]))
 
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))
+        self._prompts = result
 
-        if response is None:
-            result = types.ListPromptsResult(prompts=[])
-        else:
-            result = types.ListPromptsResult.model_validate(response.result)
+        return result
 
-        self._prompts = result.model_copy(deep=True)
+    async def iter_prompts(self) -> AsyncIterator[FrozenPrompt]:
+        """stream prompts page by page, bypassing the cache"""
 
-        return result
+        async for page in self._iter_pages("prompts/list"):
+            for prompt in page.get("prompts", []):
+                yield FrozenPrompt.model_validate(prompt)
     
-    async def read_prompt(self, prompt_name: str, args: dict):
+    async def read_prompt(self, prompt_name: str, args: dict, timeout: float | None = None):
         """read a prompt"""
 
-        request = types.ClientRequest(
-            types.GetPromptRequest(
-                method="prompts/get",
-                params=types.GetPromptRequestParams(
-                    name=prompt_name,
-                    arguments=args,
-                ),
-            )
-        )
+        response = await self._send("prompts/get", {"name": prompt_name, "arguments": args}, timeout)
+
+        if response is None:
+            raise RuntimeError("Failed to read prompt")
 
-        response = await self.request_map.send_request(CreateJsonRPCRequest(request))
         result = types.GetPromptResult.model_validate(response.result)
 
         return result
@@ -345,30 +841,55 @@ class MCPClientSession(BaseSessionProtocol):
     async def handle_notification(self, notification: types.ServerNotification):
         """handle a notification"""
 
-        logger.debug(f"Handling notification: {notification}")
+        if __debug__:
+            log_payload("Handling notification: {}", notification)
+
+        callback = self._notification_callback(notification)
+        if callback is not None:
+            await callback()
+
+    @staticmethod
+    async def _run_callback(callback: Callable[[], Awaitable[None]]):
+        await callback()
+
+    def _notification_callback(self, notification: types.ServerNotification) -> Callable[[], Awaitable[None]] | None:
+        """clear the caches a notification invalidates, returns the registered callback to run if any"""
+
+        for hook in self._invalidation_hooks:
+            try:
+                hook(notification)
+            except Exception as e:
+                logger.error(f"Invalidation hook failed: {e!r}")
 
         if isinstance(notification.root, types.ToolListChangedNotification):
             self._tools = None
             logger.debug("cleared tools cache")
             if self.tools_changed_callback is not None:
-                await self.tools_changed_callback()
+                return self.tools_changed_callback
 
         elif isinstance(notification.root, types.PromptListChangedNotification):
             self._prompts = None
             logger.debug("cleared prompts cache")
             if self.prompts_changed_callback is not None:
-                await self.prompts_changed_callback()
+                return self.prompts_changed_callback
+
+        elif isinstance(notification.root, types.ResourceUpdatedNotification):
+            if self.resource_updated_callback is not None:
+                return partial(self.resource_updated_callback, str(notification.root.params.uri))
 
         elif isinstance(notification.root, types.ResourceListChangedNotification):
             self._resources = None
             logger.debug("cleared resources cache")
             if self.resources_changed_callback is not None:
-                await self.resources_changed_callback()
+                return self.resources_changed_callback
+
+        return None
 
     async def handle_request(self, request: types.ServerRequest):
         """handle a request"""
         
-        logger.debug(f"Handling request: {request}")
+        if __debug__:
+            log_payload("Handling request: {}", request)
 
         # handle ping
         if isinstance(request.root, types.PingRequest):
@@ -0,0 +1,457 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+
+from loguru import logger
+from mcp import types
+
+from easymcp.client.errors import TransportClosedError
+from easymcp.client.metrics import Sample
+from easymcp.client.sessions.GenericSession import (
+    BaseSessionProtocol,
+    BatchCompatible,
+    IterPromptsCompatible,
+    IterResourcesCompatible,
+    InvalidatingCompatible,
+    IterToolsCompatible,
+    LifeSpanProtocol,
+    ProgressCallback,
+    PushingHealthCompatible,
+    PushingPromptsCompatible,
+    PushingResourcesCompatible,
+    PushingRootsCompatible,
+    PushingSamplingCompatible,
+    PushingToolsCompatible,
+    SubscribableResourcesCompatible,
+)
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.sessions.pool.parameters import PoolParameters
+from easymcp.client.snapshots import FrozenPrompt, FrozenResource, FrozenTool
+from easymcp.client.transports.docker import DockerServerParameters, DockerTransport
+from easymcp.client.transports.stdio import StdioTransport
+
+
+class PooledSession(
+    BaseSessionProtocol,
+    LifeSpanProtocol,
+    PushingToolsCompatible,
+    PushingResourcesCompatible,
+    PushingPromptsCompatible,
+    PushingRootsCompatible,
+    PushingSamplingCompatible,
+    PushingHealthCompatible,
+    SubscribableResourcesCompatible,
+    IterToolsCompatible,
+    IterResourcesCompatible,
+    IterPromptsCompatible,
+    BatchCompatible,
+    InvalidatingCompatible,
+):
+    """replicas of one server, requests go to the replica with the fewest in flight
+
+    list results are cached once for the whole pool and dropped, inline, when any
+    replica reports a list change. a dead replica stops receiving requests, the pool
+    reports its transport closed once no healthy replica is left.
+    """
+
+    params: PoolParameters
+    replicas: list[MCPClientSession]
+
+    batching: bool = False
+    """replicas propose a protocol version with json-rpc batches"""
+
+    def __init__(self, params: PoolParameters):
+        self.params = params.model_copy(deep=True)
+        self.replicas = []
+
+        self._outstanding: dict[MCPClientSession, int] = dict()
+        self._idle = asyncio.Condition()
+        self._callbacks: dict[str, Callable] = dict()
+        self._invalidation_hooks: list[Callable[[types.ServerNotification], None]] = []
+        self._subscriptions: set[str] = set()
+        self._stopping = False
+        self._closed = False
+
+        self._tools: types.ListToolsResult | None = None
+        self._resources: types.ListResourcesResult | None = None
+        self._prompts: types.ListPromptsResult | None = None
+
+    @property
+    def size(self) -> int:
+        """number of replicas"""
+        return len(self.replicas)
+
+    @property
+    def healthy(self) -> bool:
+        """true while at least one replica is alive"""
+        return any(replica.healthy for replica in self.replicas)
+
+    def outstanding(self) -> list[int]:
+        """requests in flight per replica"""
+        return [self._outstanding[replica] for replica in self.replicas]
+
+    def collect_metrics(self) -> Iterable[Sample]:
+        """metrics of every replica, labelled with its position in the pool"""
+
+        for index, replica in enumerate(self.replicas):
+            for sample in replica.collect_metrics():
+                sample.labels["replica"] = str(index)
+                yield sample
+
+    async def init(self) -> None:
+        """initialize the pool"""
+        self.replicas = [await self._make_replica() for _ in range(self.params.size)]
+
+    async def start(self) -> types.InitializeResult:
+        """start every replica"""
+
+        self._stopping = False
+        self._closed = False
+
+        results = await asyncio.gather(*(replica.start() for replica in self.replicas))
+        return results[0]
+
+    async def stop(self) -> None:
+        """stop every replica"""
+
+        self._stopping = True
+        await asyncio.gather(
+            *(self._stop_replica(replica) for replica in self.replicas)
+        )
+
+    async def resize(self, size: int) -> None:
+        """grow or shrink the pool, dead replicas are replaced
+
+        removed replicas stop receiving requests at once and are stopped after
+        their in-flight requests finished.
+        """
+
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.params.size = size
+
+        dead = [replica for replica in self.replicas if not replica.healthy]
+        self.replicas = [replica for replica in self.replicas if replica.healthy]
+
+        removed = sorted(self.replicas, key=lambda r: self._outstanding[r])
+        removed = removed[: max(0, len(self.replicas) - size)]
+        self.replicas = [replica for replica in self.replicas if replica not in removed]
+
+        added = [await self._make_replica() for _ in range(size - len(self.replicas))]
+        try:
+            await asyncio.gather(*(replica.start() for replica in added))
+        except Exception:
+            await asyncio.gather(*(self._stop_replica(replica) for replica in added))
+            raise
+
+        for uri in self._subscriptions:
+            await asyncio.gather(*(r.subscribe_resource(uri) for r in added))
+
+        self.replicas.extend(added)
+        self._closed = False
+
+        await asyncio.gather(
+            *(self._stop_replica(replica) for replica in dead),
+            *(self._drain(replica) for replica in removed),
+        )
+
+    async def _make_replica(self) -> MCPClientSession:
+        server = self.params.server
+        if isinstance(server, DockerServerParameters):
+            replica = MCPClientSession(DockerTransport(server), batching=self.batching)
+        else:
+            replica = MCPClientSession(StdioTransport(server), batching=self.batching)
+
+        await replica.init()
+        self._outstanding[replica] = 0
+
+        replica.add_invalidation_hook(self._invalidate)
+        for hook in self._invalidation_hooks:
+            replica.add_invalidation_hook(hook)
+
+        await replica.register_transport_closed_callback(self._replica_closed)
+
+        # only user callbacks run as handler tasks, the caches are dropped by _invalidate
+        if "roots" in self._callbacks:
+            await replica.register_roots_callback(self._callbacks["roots"])
+        if "sampling" in self._callbacks:
+            await replica.register_sampling_callback(self._callbacks["sampling"])
+        if "tools_changed" in self._callbacks:
+            await replica.register_tools_changed_callback(
+                self._callbacks["tools_changed"]
+            )
+        if "prompts_changed" in self._callbacks:
+            await replica.register_prompts_changed_callback(
+                self._callbacks["prompts_changed"]
+            )
+        if "resources_changed" in self._callbacks:
+            await replica.register_resources_changed_callback(
+                self._callbacks["resources_changed"]
+            )
+        if "resource_updated" in self._callbacks:
+            await replica.register_resource_updated_callback(
+                self._callbacks["resource_updated"]
+            )
+
+        return replica
+
+    async def _stop_replica(self, replica: MCPClientSession):
+        try:
+            await replica.stop()
+        except Exception as e:
+            logger.debug(f"Error while stopping replica: {e!r}")
+        self._outstanding.pop(replica, None)
+
+    async def _drain(self, replica: MCPClientSession):
+        """stop a replica once it has no requests in flight"""
+
+        async with self._idle:
+            await self._idle.wait_for(lambda: self._outstanding[replica] == 0)
+        await self._stop_replica(replica)
+
+    def _pick(self) -> MCPClientSession:
+        """healthy replica with the fewest requests in flight"""
+
+        replicas = [replica for replica in self.replicas if replica.healthy]
+        if not replicas:
+            raise TransportClosedError("No healthy replica in pool")
+
+        return min(replicas, key=lambda replica: self._outstanding[replica])
+
+    async def _route[R](self, call: Callable[[MCPClientSession], Awaitable[R]]) -> R:
+        replica = self._pick()
+        self._outstanding[replica] += 1
+        try:
+            return await call(replica)
+        finally:
+            if replica in self._outstanding:
+                self._outstanding[replica] -= 1
+            async with self._idle:
+                self._idle.notify_all()
+
+    async def _stream[T](
+        self, iterate: Callable[[MCPClientSession], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        replica = self._pick()
+        self._outstanding[replica] += 1
+        try:
+            async for item in iterate(replica):
+                yield item
+        finally:
+            if replica in self._outstanding:
+                self._outstanding[replica] -= 1
+            async with self._idle:
+                self._idle.notify_all()
+
+    # callbacks
+
+    async def _emit(self, name: str, *args):
+        callback = self._callbacks.get(name)
+        if callback is not None:
+            await callback(*args)
+
+    def _invalidate(self, notification: types.ServerNotification):
+        if isinstance(notification.root, types.ToolListChangedNotification):
+            self._tools = None
+        elif isinstance(notification.root, types.PromptListChangedNotification):
+            self._prompts = None
+        elif isinstance(notification.root, types.ResourceListChangedNotification):
+            self._resources = None
+
+    def add_invalidation_hook(self, hook: Callable[[types.ServerNotification], None]):
+        """run `hook` inline on the notifications of every replica, see MCPClientSession"""
+
+        self._invalidation_hooks.append(hook)
+        for replica in self.replicas:
+            replica.add_invalidation_hook(hook)
+
+    async def _replica_closed(self, error: BaseException):
+        logger.warning(f"Pool replica died: {error!r}")
+
+        if self._stopping or self._closed or self.healthy:
+            return
+
+        self._closed = True
+        await self._emit("transport_closed", error)
+
+    async def _register(self, name: str, callback: Callable):
+        MCPClientSession._validate_async_callback(callback, f"{name}_callback")
+        self._callbacks[name] = callback
+
+    async def register_roots_callback(
+        self,
+        callback: Callable[[types.ListRootsRequest], Awaitable[types.ListRootsResult]],
+    ):
+        """register a callback for roots on every replica"""
+        await self._register("roots", callback)
+        for replica in self.replicas:
+            await replica.register_roots_callback(callback)
+
+    async def register_sampling_callback(
+        self,
+        callback: Callable[
+            [types.CreateMessageRequest], Awaitable[types.CreateMessageResult]
+        ],
+    ):
+        """register a callback for sampling on every replica"""
+        await self._register("sampling", callback)
+        for replica in self.replicas:
+            await replica.register_sampling_callback(callback)
+
+    async def register_tools_changed_callback(
+        self, callback: Callable[[], Awaitable[None]]
+    ):
+        """register a callback for tools changed on every replica"""
+        await self._register("tools_changed", callback)
+        for replica in self.replicas:
+            await replica.register_tools_changed_callback(callback)
+
+    async def register_prompts_changed_callback(
+        self, callback: Callable[[], Awaitable[None]]
+    ):
+        """register a callback for prompts changed on every replica"""
+        await self._register("prompts_changed", callback)
+        for replica in self.replicas:
+            await replica.register_prompts_changed_callback(callback)
+
+    async def register_resources_changed_callback(
+        self, callback: Callable[[], Awaitable[None]]
+    ):
+        """register a callback for resources changed on every replica"""
+        await self._register("resources_changed", callback)
+        for replica in self.replicas:
+            await replica.register_resources_changed_callback(callback)
+
+    async def register_resource_updated_callback(
+        self, callback: Callable[[str], Awaitable[None]]
+    ):
+        """register a callback for updates of subscribed resources on every replica"""
+        await self._register("resource_updated", callback)
+        for replica in self.replicas:
+            await replica.register_resource_updated_callback(callback)
+
+    async def register_transport_closed_callback(
+        self, callback: Callable[[BaseException], Awaitable[None]]
+    ):
+        """register a callback for the last healthy replica dying"""
+        await self._register("transport_closed", callback)
+
+    # requests
+
+    async def list_tools(self, force: bool = False) -> types.ListToolsResult:
+        """list available tools, cached for the whole pool"""
+
+        if force or self._tools is None:
+            self._tools = result = await self._route(lambda r: r.list_tools(force=True))
+            return result
+        return self._tools
+
+    def iter_tools(self) -> AsyncIterator[FrozenTool]:
+        """stream tools page by page from the least busy replica"""
+        return self._stream(lambda r: r.iter_tools())
+
+    def iter_resources(self) -> AsyncIterator[FrozenResource]:
+        """stream resources page by page from the least busy replica"""
+        return self._stream(lambda r: r.iter_resources())
+
+    def iter_prompts(self) -> AsyncIterator[FrozenPrompt]:
+        """stream prompts page by page from the least busy replica"""
+        return self._stream(lambda r: r.iter_prompts())
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        args: dict,
+        timeout: float | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ) -> types.CallToolResult:
+        """call a tool on the least busy replica"""
+        return await self._route(
+            lambda r: r.call_tool(tool_name, args, timeout, progress_callback)
+        )
+
+    @property
+    def supports_batches(self) -> bool:
+        """true if every replica negotiated json-rpc batches"""
+        return bool(self.replicas) and all(
+            replica.supports_batches for replica in self.replicas
+        )
+
+    async def call_tools(
+        self, calls: Sequence[tuple[str, dict]], timeout: float | None = None
+    ) -> list[types.CallToolResult | BaseException]:
+        """call many tools on the least busy replica"""
+        return await self._route(lambda r: r.call_tools(calls, timeout))
+
+    async def list_resources(self, force: bool = False) -> types.ListResourcesResult:
+        """list available resources, cached for the whole pool"""
+
+        if force or self._resources is None:
+            self._resources = result = await self._route(
+                lambda r: r.list_resources(force=True)
+            )
+            return result
+        return self._resources
+
+    async def read_resource(
+        self, resource_name: str, timeout: float | None = None
+    ) -> types.ReadResourceResult:
+        """read a resource from the least busy replica"""
+        return await self._route(lambda r: r.read_resource(resource_name, timeout))
+
+    async def read_resources(
+        self, resource_names: Sequence[str], timeout: float | None = None
+    ) -> list[types.ReadResourceResult | BaseException]:
+        """read many resources from the least busy replica"""
+        return await self._route(lambda r: r.read_resources(resource_names, timeout))
+
+    @property
+    def supports_subscriptions(self) -> bool:
+        """true if every replica announced resource subscriptions"""
+        return bool(self.replicas) and all(
+            replica.supports_subscriptions for replica in self.replicas
+        )
+
+    async def subscribe_resource(
+        self, resource_name: str, timeout: float | None = None
+    ):
+        """subscribe every replica, any of them may change the resource"""
+
+        self._subscriptions.add(resource_name)
+        await asyncio.gather(
+            *(
+                replica.subscribe_resource(resource_name, timeout)
+                for replica in self.replicas
+                if replica.healthy
+            )
+        )
+
+    async def unsubscribe_resource(
+        self, resource_name: str, timeout: float | None = None
+    ):
+        """unsubscribe every replica"""
+
+        self._subscriptions.discard(resource_name)
+        await asyncio.gather(
+            *(
+                replica.unsubscribe_resource(resource_name, timeout)
+                for replica in self.replicas
+                if replica.healthy
+            )
+        )
+
+    async def list_prompts(self, force: bool = False) -> types.ListPromptsResult:
+        """list available prompts, cached for the whole pool"""
+
+        if force or self._prompts is None:
+            self._prompts = result = await self._route(
+                lambda r: r.list_prompts(force=True)
+            )
+            return result
+        return self._prompts
+
+    async def read_prompt(
+        self, prompt_name: str, args: dict, timeout: float | None = None
+    ) -> types.GetPromptResult:
+        """read a prompt from the least busy replica"""
+        return await self._route(lambda r: r.read_prompt(prompt_name, args, timeout))
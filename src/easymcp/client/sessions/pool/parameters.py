@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+from easymcp.client.transports.docker import DockerServerParameters
+from easymcp.client.transports.stdio import StdioServerParameters
+
+
+class PoolParameters(BaseModel):
+    """run several replicas of the same server behind one name"""
+
+    server: StdioServerParameters | DockerServerParameters
+    """parameters every replica is started with"""
+
+    size: int = Field(default=2, ge=1)
+    """number of replicas"""
@@ -0,0 +1,57 @@
+from mcp import types
+from pydantic import ConfigDict
+
+# sessions cache list results as snapshots and hand the same object to every
+# caller. models are frozen and lists are tuples, free-form payloads such as
+# `inputSchema` and `meta` are plain dicts shared by all callers and must not be
+# mutated. use `model_copy(update=...)` to derive a modified copy.
+
+
+class FrozenTool(types.Tool):
+    """read-only Tool"""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenResource(types.Resource):
+    """read-only Resource"""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenPromptArgument(types.PromptArgument):
+    """read-only PromptArgument"""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenPrompt(types.Prompt):
+    """read-only Prompt"""
+
+    model_config = ConfigDict(frozen=True)
+
+    arguments: tuple[FrozenPromptArgument, ...] | None = None  # type: ignore[assignment]
+
+
+class ListToolsSnapshot(types.ListToolsResult):
+    """read-only ListToolsResult"""
+
+    model_config = ConfigDict(frozen=True)
+
+    tools: tuple[FrozenTool, ...]  # type: ignore[assignment]
+
+
+class ListResourcesSnapshot(types.ListResourcesResult):
+    """read-only ListResourcesResult"""
+
+    model_config = ConfigDict(frozen=True)
+
+    resources: tuple[FrozenResource, ...]  # type: ignore[assignment]
+
+
+class ListPromptsSnapshot(types.ListPromptsResult):
+    """read-only ListPromptsResult"""
+
+    model_config = ConfigDict(frozen=True)
+
+    prompts: tuple[FrozenPrompt, ...]  # type: ignore[assignment]
@@ -0,0 +1,47 @@
+import random
+
+from pydantic import BaseModel, Field
+
+
+class SupervisorParameters(BaseModel):
+    """respawn policy for servers whose transport died"""
+
+    initial_delay: float = Field(default=0.5, gt=0)
+    """seconds to wait before the first restart attempt"""
+
+    max_delay: float = Field(default=30.0, gt=0)
+    """upper bound for the delay between attempts"""
+
+    multiplier: float = Field(default=2.0, ge=1)
+    """factor applied to the delay after every failed attempt"""
+
+    jitter: float = Field(default=0.1, ge=0, le=1)
+    """fraction of the delay randomized in both directions"""
+
+    max_attempts: int | None = None
+    """consecutive failed attempts before giving up on a server, None retries forever"""
+
+    def delay(self, attempt: int) -> float:
+        """seconds to wait before restart attempt `attempt` (starting at 0)"""
+
+        delay = min(self.max_delay, self.initial_delay * self.multiplier**attempt)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class SupervisorStats(BaseModel):
+    """restart counters of a single server"""
+
+    restarts: int = 0
+    """successful restarts"""
+
+    failed_attempts: int = 0
+    """restart attempts that failed"""
+
+    consecutive_failures: int = 0
+    """failed attempts since the last successful restart"""
+
+    last_error: str | None = None
+    """error that caused the last restart or failed attempt"""
+
+    gave_up: bool = False
+    """true once `max_attempts` was exceeded and the server is left dead"""
@@ -8,7 +8,9 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from easymcp.client.transports.generic import TransportProtocol
+from easymcp.client.errors import TransportClosedError
+from easymcp.client.transports.generic import BytesTransportProtocol
+from easymcp.client.transports.stdio import ReadBuffer
 
 
 class DockerServerParameters(BaseModel):
@@ -23,9 +25,14 @@ class DockerServerParameters(BaseModel):
         default_factory=dict,
         description="Environment variables for the docker container",
     )
+    buffer_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Messages buffered between the container streams and the session",
+    )
 
 
-class DockerTransport(TransportProtocol):
+class DockerTransport(BytesTransportProtocol):
     state: Literal["constructed", "initialized", "started", "stopped"] = "constructed"
 
     def __init__(self, config: DockerServerParameters) -> None:
@@ -34,11 +41,11 @@ class DockerTransport(TransportProtocol):
         self.container: containers.DockerContainer | None = None
         self.attach_result: Any = None
 
-        self._reader_send: MemoryObjectSendStream[str]
-        self._reader_recv: MemoryObjectReceiveStream[str]
+        self._reader_send: MemoryObjectSendStream[bytes]
+        self._reader_recv: MemoryObjectReceiveStream[bytes]
 
-        self._writer_send: MemoryObjectSendStream[str]
-        self._writer_recv: MemoryObjectReceiveStream[str]
+        self._writer_send: MemoryObjectSendStream[bytes]
+        self._writer_recv: MemoryObjectReceiveStream[bytes]
 
         self._task_group: anyio.abc.TaskGroup | None = None
 
@@ -46,8 +53,12 @@ class DockerTransport(TransportProtocol):
         self.docker = Docker()
         await self.docker.images.pull(self.config.image)
 
-        self._reader_send, self._reader_recv = anyio.create_memory_object_stream()
-        self._writer_send, self._writer_recv = anyio.create_memory_object_stream()
+        self._reader_send, self._reader_recv = anyio.create_memory_object_stream(
+            self.config.buffer_size
+        )
+        self._writer_send, self._writer_recv = anyio.create_memory_object_stream(
+            self.config.buffer_size
+        )
 
         self.state = "initialized"
         logger.debug("DockerTransport initialized")
@@ -78,7 +89,7 @@ class DockerTransport(TransportProtocol):
         async def read_stdout():
             assert self.attach_result is not None
 
-            buffer = ""
+            buffer = ReadBuffer()
             async with self._reader_send:
                 while True:
                     try:
@@ -89,15 +100,14 @@ class DockerTransport(TransportProtocol):
                         if msg.data is None:
                             continue
 
-                        if isinstance(msg.data, (bytes, bytearray)):
-                            chunk = msg.data.decode("utf-8", errors="replace")
+                        if isinstance(msg.data, str):
+                            buffer.append(msg.data.encode())
                         else:
-                            chunk = str(msg.data)
+                            buffer.append(msg.data)
 
-                        buffer += chunk
-                        while "\n" in buffer:
-                            line, buffer = buffer.split("\n", 1)
-                            await self._reader_send.send(line)
+                        while (line := buffer.read_message_bytes()) is not None:
+                            if line and not line.isspace():
+                                await self._reader_send.send(line)
                     except Exception as e:
                         logger.error(f"Error reading container output: {e}")
                         break
@@ -108,7 +118,7 @@ class DockerTransport(TransportProtocol):
             async with self._writer_recv:
                 async for msg in self._writer_recv:
                     try:
-                        await self.attach_result.write_in(msg.encode("utf-8") + b"\n")
+                        await self.attach_result.write_in(msg)
                     except Exception as e:
                         logger.warning(f"Failed to write to container stdin: {e}")
             logger.debug("write_stdin task exited")
@@ -159,13 +169,24 @@ class DockerTransport(TransportProtocol):
         self.state = "stopped"
         logger.debug("DockerTransport stopped and cleaned up")
 
-
     async def send(self, message: str) -> None:
+        await self.send_bytes(message.encode())
+
+    async def send_bytes(self, *messages: bytes) -> None:
         if self.state != "started":
             raise RuntimeError("Transport not started")
-        await self._writer_send.send(message)
+        # the attach stream has no writelines, frame everything in one write
+        await self._writer_send.send(
+            b"".join(part for message in messages for part in (message, b"\n"))
+        )
 
     async def receive(self) -> str:
+        return (await self.receive_bytes()).decode()
+
+    async def receive_bytes(self) -> bytes:
         if self.state != "started":
             raise RuntimeError("Transport not started")
-        return await self._reader_recv.receive()
+        try:
+            return await self._reader_recv.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError) as e:
+            raise TransportClosedError("Container stdout closed") from e
@@ -1,4 +1,5 @@
 from typing import Protocol, runtime_checkable, Literal
+from mcp import types
 from pydantic import BaseModel
 
 
@@ -29,3 +30,37 @@ class TransportProtocol(Protocol):
     async def receive(self) -> str:
         """receive data from the transport"""
         ...
+
+
+@runtime_checkable
+class BytesTransportProtocol(TransportProtocol, Protocol):
+    """transport that natively exchanges newline framed bytes
+
+    sessions prefer these methods over send/receive, skipping the encode, decode
+    and strip copies of every message.
+    """
+
+    async def send_bytes(self, *messages: bytes) -> None:
+        """send serialized messages, each framed on its own line"""
+        ...
+
+    async def receive_bytes(self) -> bytes:
+        """receive the next message, without its line ending"""
+        ...
+
+
+@runtime_checkable
+class MessageTransportProtocol(TransportProtocol, Protocol):
+    """transport that natively exchanges parsed JSON-RPC messages
+
+    sessions prefer these methods over send/receive, skipping a serialize and
+    parse cycle per message.
+    """
+
+    async def send_message(self, message: types.JSONRPCMessage) -> None:
+        """send a message to the transport"""
+        ...
+
+    async def receive_message(self) -> types.JSONRPCMessage:
+        """receive a message from the transport"""
+        ...
@@ -1,5 +1,7 @@
+import anyio
 from pydantic import BaseModel
-from easymcp.client.transports.generic import TransportProtocol
+from easymcp.client.errors import TransportClosedError
+from easymcp.client.transports.generic import MessageTransportProtocol
 from mcp.client.sse import sse_client
 from mcp import types
 
@@ -16,7 +18,7 @@ class SseServerParameters(BaseModel):
     """timeout in seconds"""
 
 
-class SseTransport(TransportProtocol):
+class SseTransport(MessageTransportProtocol):
     """SseTransport class"""
 
     args: SseServerParameters
@@ -43,22 +45,33 @@ class SseTransport(TransportProtocol):
 
     async def send(self, message: str):
         """Send data to the transport"""
-        assert self.writestream, "Transport not started"
-
-        msg = types.JSONRPCMessage.model_validate_json(message)
-        await self.writestream.send(msg)
+        await self.send_message(types.JSONRPCMessage.model_validate_json(message))
 
     async def receive(self) -> str:
         """Receive data from the transport"""
+        msg = await self.receive_message()
+        return msg.model_dump_json()
+
+    async def send_message(self, message: types.JSONRPCMessage):
+        """Send a message to the transport"""
+        assert self.writestream, "Transport not started"
+
+        await self.writestream.send(message)
+
+    async def receive_message(self) -> types.JSONRPCMessage:
+        """Receive a message from the transport"""
         assert self.readstream, "Transport not started"
 
-        msg = await self.readstream.receive()
+        try:
+            msg = await self.readstream.receive()
+        except (anyio.EndOfStream, anyio.ClosedResourceError) as e:
+            raise TransportClosedError("SSE stream closed") from e
         
         if isinstance(msg, Exception):
             await self.stop()
             raise msg
         
-        return msg.model_dump_json()
+        return msg
 
     async def stop(self):
         """Stop the transport"""
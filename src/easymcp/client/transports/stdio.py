@@ -1,5 +1,4 @@
 import asyncio
-import io
 import os
 import shutil
 import sys
@@ -9,7 +8,9 @@ from typing import Literal
 from loguru import logger
 from pydantic import BaseModel
 
-from easymcp.client.transports.generic import TransportProtocol
+from easymcp.client.debuglog import log_payload
+from easymcp.client.errors import MessageTooLargeError, TransportClosedError
+from easymcp.client.transports.generic import BytesTransportProtocol
 
 
 class StdioServerParameters(BaseModel):
@@ -29,30 +30,115 @@ class StdioServerParameters(BaseModel):
 
     log_stderr: bool = True
 
+    read_size: int = 64 * 1024
+    """maximum number of bytes to read from stdout at once"""
+
+    max_message_size: int | None = None
+    """reject messages larger than this many bytes, unlimited if None"""
+
 
 class ReadBuffer:
-    """Buffered reader using BytesIO to handle chunked stdio input."""
+    """Newline framer over a bytearray.
+
+    Every byte is scanned for a newline at most once and consumed bytes are
+    compacted lazily, so framing is linear in the size of the input.
+    """
+
+    # compact the buffer once this many consumed bytes have piled up
+    compact_threshold = 64 * 1024
+
+    def __init__(self, max_message_size: int | None = None):
+        self.buffer = bytearray()
+        self.max_message_size = max_message_size
 
-    def __init__(self):
-        self.buffer = io.BytesIO()
+        self._start = 0  # first byte of the next message
+        self._scan = 0  # first byte not yet searched for a newline
+        self._discarding = False  # skipping the rest of an oversized message
 
     def append(self, data: bytes):
-        self.buffer.seek(0, io.SEEK_END)
-        self.buffer.write(data)
+        self.buffer += data
 
     def read_message(self) -> str | None:
-        self.buffer.seek(0)
-        data = self.buffer.getvalue()
+        """pop the next complete line, or None if no full line is buffered"""
+
+        message = self.read_message_bytes()
+        if message is None:
+            return None
+        return message.decode()
+
+    def read_message_bytes(self) -> bytes | None:
+        """pop the next complete line as bytes, or None if no full line is buffered"""
+
+        while True:
+            index = self.buffer.find(b"\n", self._scan)
+
+            if index == -1:
+                self._scan = len(self.buffer)
+                self._check_pending()
+                return None
+
+            start, end = self._start, index
+            self._start = self._scan = index + 1
+
+            if self._discarding:
+                self._discarding = False
+                self._compact()
+                continue
+
+            if self.max_message_size is not None and end - start > self.max_message_size:
+                self._compact()
+                raise MessageTooLargeError(
+                    f"Message of {end - start} bytes exceeds limit of {self.max_message_size} bytes"
+                )
+
+            if end > start and self.buffer[end - 1] == 0x0D:  # \r
+                end -= 1
+
+            # a single copy out of the buffer, no intermediate bytearray slice
+            with memoryview(self.buffer) as view:
+                message = bytes(view[start:end])
+
+            self._compact()
+            return message
+
+    def read_messages(self) -> list[str]:
+        """pop every complete line already buffered"""
+
+        messages: list[str] = []
+        while (message := self.read_message()) is not None:
+            messages.append(message)
+        return messages
+
+    def _compact(self):
+        if self._start == len(self.buffer):
+            self.buffer.clear()
+        elif self._start >= self.compact_threshold and self._start * 2 >= len(self.buffer):
+            del self.buffer[: self._start]
+        else:
+            return
 
-        if b"\n" in data:
-            message, rest = data.split(b"\n", 1)
-            self.buffer = io.BytesIO(rest)
-            return message.decode().strip()
+        self._scan -= self._start
+        self._start = 0
 
-        return None
+    def _check_pending(self):
+        if self._discarding:
+            self.buffer.clear()
+            self._start = self._scan = 0
+            return
+
+        pending = len(self.buffer) - self._start
+        if self.max_message_size is None or pending <= self.max_message_size:
+            return
 
+        # drop what we have and skip ahead to the next newline
+        self.buffer.clear()
+        self._start = self._scan = 0
+        self._discarding = True
 
-class StdioTransport(TransportProtocol):
+        raise MessageTooLargeError(
+            f"Message exceeds limit of {self.max_message_size} bytes"
+        )
+class StdioTransport(BytesTransportProtocol):
     """Asynchronous stdio transport."""
 
     state: Literal["constructed", "initialized", "started", "stopped"]
@@ -64,7 +150,7 @@ class StdioTransport(TransportProtocol):
     def __init__(self, arguments: StdioServerParameters):
         self.state = "constructed"
         self.arguments = arguments.model_copy(deep=True)
-        self.read_buffer = ReadBuffer()
+        self.read_buffer = ReadBuffer(self.arguments.max_message_size)
         self.subprocess = None
         self.stderr_task: asyncio.Task | None = None
 
@@ -96,28 +182,45 @@ class StdioTransport(TransportProtocol):
             self.stderr_task = asyncio.create_task(self.read_stderr())
 
     async def send(self, message: str) -> None:
+        await self.send_bytes(message.strip().encode())
+
+    async def send_bytes(self, *messages: bytes) -> None:
         assert self.subprocess and self.subprocess.stdin, "subprocess stdin not open"
-        formatted_message = message.strip() + "\n"
-        logger.debug(f"Sending message: {formatted_message}")
-        self.subprocess.stdin.write(formatted_message.encode())
+
+        if __debug__:
+            for message in messages:
+                log_payload("Sending message: {}", message)
+
+        # writelines hands the buffers over without joining them first
+        self.subprocess.stdin.writelines(
+            [part for message in messages for part in (message, b"\n")]
+        )
         await self.subprocess.stdin.drain()
 
     async def receive(self) -> str:
+        return (await self.receive_bytes()).decode()
+
+    async def receive_bytes(self) -> bytes:
         assert self.subprocess and self.subprocess.stdout, "subprocess stdout not open"
 
         while True:
-            chunk = await self.subprocess.stdout.read(1024)
-            if not chunk:
-                break
+            # drain lines that are already buffered before reading more
+            message = self.read_buffer.read_message_bytes()
+
+            if message is None:
+                chunk = await self.subprocess.stdout.read(self.arguments.read_size)
+                if not chunk:
+                    break
 
-            self.read_buffer.append(chunk)
+                self.read_buffer.append(chunk)
+                continue
 
-            message = self.read_buffer.read_message()
-            if message:
-                logger.debug(f"Received message: {message}")
+            if message and not message.isspace():
+                if __debug__:
+                    log_payload("Received message: {}", message)
                 return message
 
-        raise RuntimeError("Subprocess stdout closed before complete message")
+        raise TransportClosedError("Subprocess stdout closed before complete message")
 
     async def read_stderr(self) -> None:
         if self.subprocess is None or self.subprocess.stderr is None:
@@ -1,12 +1,21 @@
+from typing import Any
 from uuid import uuid4
 from re import sub
 
-from mcp.types import ClientRequest, JSONRPCRequest
+from mcp.types import ClientRequest, JSONRPCRequest, RequestId
 
 
-def CreateJsonRPCRequest(request: ClientRequest) -> JSONRPCRequest:
-    """Create a JSON RPC request"""
-    return JSONRPCRequest(jsonrpc="2.0", id=str(uuid4()), **request.model_dump())
+def CreateJsonRPCRequest(request: ClientRequest, request_id: RequestId | None = None) -> JSONRPCRequest:
+    """Create a JSON RPC request from a typed client request, with a random id if none is given"""
+    return JSONRPCRequest(
+        jsonrpc="2.0",
+        id=str(uuid4()) if request_id is None else request_id,
+        **request.model_dump(by_alias=True, mode="json", exclude_none=True),
+    )
+
+def create_request(request_id: RequestId, method: str, params: dict[str, Any] | None = None) -> JSONRPCRequest:
+    """Create a JSON RPC request directly from its method and params, skipping the ClientRequest round trip"""
+    return JSONRPCRequest(jsonrpc="2.0", id=request_id, method=method, params=params)
 
 def format_server_name(server_name: str) -> str:
     """Format a server name to be namespacing friendly"""
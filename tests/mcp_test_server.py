@@ -0,0 +1,95 @@
+"""stdio MCP server used by the tests, run with `python tests/mcp_test_server.py`"""
+
+import asyncio
+
+from mcp import types
+from pydantic import AnyUrl
+from mcp.server.fastmcp import Context, FastMCP
+
+mcp = FastMCP(name="easymcp-test")
+
+notes = {"memo://note": "first"}
+subscriptions: set[str] = set()
+
+
+@mcp.tool()
+async def sleep(seconds: float) -> str:
+    await asyncio.sleep(seconds)
+    return "done"
+
+
+@mcp.tool()
+def echo(text: str) -> str:
+    return text
+
+
+@mcp.tool()
+async def count(steps: int, ctx: Context) -> str:
+    for step in range(1, steps + 1):
+        await ctx.report_progress(step, steps)
+    return "counted"
+
+
+@mcp.tool()
+async def sample(prompt: str, ctx: Context) -> str:
+    result = await ctx.session.create_message(
+        messages=[
+            types.SamplingMessage(
+                role="user", content=types.TextContent(type="text", text=prompt)
+            )
+        ],
+        max_tokens=16,
+    )
+    assert isinstance(result.content, types.TextContent)
+    return result.content.text
+
+
+@mcp.resource("memo://note")
+def note() -> str:
+    return notes["memo://note"]
+
+
+@mcp.resource("blob://data", mime_type="application/octet-stream")
+def data() -> bytes:
+    return bytes(range(256)) * 4096
+
+
+@mcp.tool()
+async def set_note(text: str, ctx: Context) -> str:
+    notes["memo://note"] = text
+    if "memo://note" in subscriptions:
+        await ctx.session.send_resource_updated(AnyUrl("memo://note"))
+    return text
+
+
+@mcp.tool()
+def subscribed() -> list[str]:
+    return sorted(subscriptions)
+
+
+@mcp._mcp_server.subscribe_resource()
+async def subscribe(uri: AnyUrl) -> None:
+    subscriptions.add(str(uri))
+
+
+@mcp._mcp_server.unsubscribe_resource()
+async def unsubscribe(uri: AnyUrl) -> None:
+    subscriptions.discard(str(uri))
+
+
+# FastMCP always reports subscribe=False
+_get_capabilities = mcp._mcp_server.get_capabilities
+
+
+def get_capabilities(*args, **kwargs) -> types.ServerCapabilities:
+    capabilities = _get_capabilities(*args, **kwargs)
+    assert capabilities.resources is not None
+    capabilities.resources.subscribe = True
+    return capabilities
+
+
+mcp._mcp_server.get_capabilities = get_capabilities  # type: ignore[method-assign]
+
+
+if __name__ == "__main__":
+    mcp.run()
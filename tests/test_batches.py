@@ -0,0 +1,213 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.batches import BATCH_PROTOCOL_VERSION, JSONRPCBatch
+from easymcp.client.decoding import decode_messages
+from easymcp.client.iobuffers import writer
+from easymcp.client.queues import MessageQueue
+from easymcp.client.requestmap import RequestMap
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+from easymcp.client.utils import create_request
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+class BatchTransport:
+    """bytes transport answering like a server that speaks json-rpc batches"""
+
+    def __init__(self):
+        self.state = "constructed"
+        self.responses: asyncio.Queue[bytes] = asyncio.Queue()
+        self.batches: list[list[dict]] = []
+
+    async def init(self) -> None:
+        self.state = "initialized"
+
+    async def start(self) -> None:
+        self.state = "started"
+
+    async def stop(self) -> None:
+        self.state = "stopped"
+
+    async def send(self, message: str) -> None:
+        await self.send_bytes(message.encode())
+
+    async def receive(self) -> str:
+        return (await self.receive_bytes()).decode()
+
+    async def receive_bytes(self) -> bytes:
+        return await self.responses.get()
+
+    async def send_bytes(self, *messages: bytes) -> None:
+        for data in messages:
+            message = json.loads(data)
+            if isinstance(message, list):
+                self.batches.append(message)
+                answers = [self.answer(m) for m in message if "id" in m]
+                await self.responses.put(json.dumps(answers).encode())
+            elif "id" in message:
+                await self.responses.put(json.dumps(self.answer(message)).encode())
+
+    def answer(self, request: dict) -> dict:
+        params = request.get("params") or {}
+
+        if request["method"] == "initialize":
+            result = types.InitializeResult(
+                protocolVersion=params["protocolVersion"],
+                capabilities=types.ServerCapabilities(),
+                serverInfo=types.Implementation(name="batching", version="1"),
+            ).model_dump(exclude_none=True)
+        elif request["method"] == "tools/call":
+            if params["name"] == "fail":
+                error = {"code": -32602, "message": "Unknown tool"}
+                return {"jsonrpc": "2.0", "id": request["id"], "error": error}
+            text = f"{params['name']} {params['arguments']['n']}"
+            result = {"content": [{"type": "text", "text": text}]}
+        else:
+            contents = [{"uri": params["uri"], "text": params["uri"]}]
+            result = {"contents": contents}
+
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+
+def test_decode_messages_splits_batches():
+    data = json.dumps(
+        [
+            {"jsonrpc": "2.0", "id": 1, "result": {}},
+            {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"},
+            {"jsonrpc": "2.0"},
+        ]
+    )
+
+    response, notification = decode_messages(data)
+    assert isinstance(response.root, types.JSONRPCResponse)
+    assert isinstance(notification.root, types.JSONRPCNotification)
+
+    assert (
+        len(decode_messages(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}))) == 1
+    )
+
+    with pytest.raises(ValueError):
+        decode_messages("[]")
+
+
+@pytest.mark.asyncio
+async def test_writer_sends_batch_as_array():
+    transport = BatchTransport()
+    transport.state = "started"
+    queue = MessageQueue()
+    queue.put_nowait(
+        JSONRPCBatch([types.JSONRPCMessage(create_request(i, "ping")) for i in (1, 2)])
+    )
+
+    task = await writer(transport, queue)  # type: ignore[arg-type]
+    while not transport.batches:
+        await asyncio.sleep(0)
+    task.cancel()
+
+    assert [m["id"] for m in transport.batches[0]] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_send_batch_resolves_in_order_and_cancels_on_timeout():
+    queue: asyncio.Queue = asyncio.Queue()
+    request_map = RequestMap(queue)
+    messages = [create_request(request_map.next_id(), "ping") for _ in range(3)]
+
+    task = asyncio.create_task(request_map.send_batch(messages))
+    batch = await queue.get()
+    assert isinstance(batch, JSONRPCBatch) and len(batch.root) == 3
+
+    for message in reversed(messages):
+        request_map.resolve_request(
+            types.JSONRPCResponse(
+                jsonrpc="2.0", id=message.id, result={"n": message.id}
+            )
+        )
+    responses = await task
+    assert [r.result["n"] for r in responses if r] == [m.id for m in messages]
+    assert not request_map.requests
+
+    messages = [create_request(request_map.next_id(), "ping") for _ in range(2)]
+    task = asyncio.create_task(request_map.send_batch(messages, timeout=0.1))
+    await queue.get()
+    request_map.resolve_request(
+        types.JSONRPCResponse(jsonrpc="2.0", id=messages[0].id, result={})
+    )
+
+    with pytest.raises(TimeoutError):
+        await task
+
+    # only the unanswered request is cancelled
+    cancelled = (await queue.get()).root
+    assert isinstance(cancelled, types.JSONRPCNotification)
+    assert cancelled.params["requestId"] == messages[1].id
+    assert queue.empty()
+    assert not request_map.requests
+
+
+@pytest.mark.asyncio
+async def test_session_batches_when_negotiated():
+    transport = BatchTransport()
+    session = MCPClientSession(transport, batching=True)  # type: ignore[arg-type]
+    await session.init()
+    await session.start()
+
+    try:
+        assert session.protocol_version == BATCH_PROTOCOL_VERSION
+        assert session.supports_batches
+
+        results = await session.call_tools(
+            [("echo", {"n": 1}), ("fail", {}), ("echo", {"n": 2})]
+        )
+        assert len(transport.batches) == 1 and len(transport.batches[0]) == 3
+
+        first, failed, last = results
+        assert isinstance(first, types.CallToolResult)
+        assert isinstance(first.content[0], types.TextContent)
+        assert first.content[0].text == "echo 1"
+        assert isinstance(failed, RuntimeError)
+        assert isinstance(last, types.CallToolResult)
+
+        a, b = await session.read_resources(["memo://a", "memo://b"])
+        assert isinstance(a, types.ReadResourceResult)
+        assert isinstance(b, types.ReadResourceResult)
+        assert [str(a.contents[0].uri), str(b.contents[0].uri)] == [
+            "memo://a",
+            "memo://b",
+        ]
+        assert len(transport.batches) == 2
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_session_falls_back_without_batch_support():
+    session = MCPClientSession(StdioTransport(test_server), batching=True)
+    await session.init()
+    await session.start()
+
+    try:
+        # the test server only speaks 2024-11-05, which has no batches
+        assert session.protocol_version == types.LATEST_PROTOCOL_VERSION
+        assert not session.supports_batches
+
+        echo, failed = await session.call_tools(
+            [("echo", {"text": "hi"}), ("echo", {})]
+        )
+        assert isinstance(echo, types.CallToolResult) and not echo.isError
+        assert not isinstance(failed, types.CallToolResult) or failed.isError
+
+        (note,) = await session.read_resources(["memo://note"])
+        assert isinstance(note, types.ReadResourceResult)
+        assert await session.read_resources([]) == []
+    finally:
+        await session.stop()
@@ -0,0 +1,105 @@
+import base64
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+from pydantic import AnyUrl
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.blobs import BlobStream, SpooledBlob, open_blob, spool_blob
+from easymcp.client.transports.stdio import StdioServerParameters
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+def blob(data: bytes) -> types.BlobResourceContents:
+    return types.BlobResourceContents(
+        uri=AnyUrl("blob://x"), blob=base64.b64encode(data).decode()
+    )
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 100, 4097])
+@pytest.mark.parametrize("chunk_size", [4, 8, 1024])
+def test_blob_stream_decodes_in_chunks(size: int, chunk_size: int):
+    data = os.urandom(size)
+    stream = BlobStream(base64.b64encode(data).decode(), chunk_size)
+
+    assert stream.size == size
+    assert stream.read() == data
+
+
+def test_open_blob_reads_incrementally():
+    data = os.urandom(10_000)
+    reader = open_blob(blob(data), chunk_size=1024)
+
+    assert reader.read(10) == data[:10]
+    assert reader.read() == data[10:]
+
+    image = types.ImageContent(
+        type="image", data=base64.b64encode(b"png").decode(), mimeType="image/png"
+    )
+    assert open_blob(image).read() == b"png"
+
+    with pytest.raises(TypeError):
+        open_blob(types.TextContent(type="text", text="x"))  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        BlobStream("", chunk_size=6)
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 100, 4097])
+@pytest.mark.parametrize("chunk_size", [4, 8, 1024])
+def test_blob_stream_skips_line_breaks(size: int, chunk_size: int):
+    data = os.urandom(size)
+    # mime style, 76 characters per line
+    text = base64.encodebytes(data).decode().replace("\n", "\r\n")
+    assert size < 100 or "\r\n" in text.rstrip()
+
+    stream = BlobStream(text, chunk_size)
+
+    assert stream.size == size
+    assert stream.read() == data
+
+    spooled = spool_blob(types.BlobResourceContents(uri=AnyUrl("blob://x"), blob=text))
+    assert spooled.read() == data
+
+
+def test_invalid_base64():
+    with pytest.raises(ValueError):
+        BlobStream("not base64!").read()
+
+
+def test_spool_blob_rolls_over_to_disk():
+    data = os.urandom(64 * 1024)
+
+    with spool_blob(blob(data), max_memory=1024) as spool:
+        assert spool._rolled  # type: ignore[attr-defined]
+        assert spool.read() == data
+
+    with spool_blob(blob(data[:100]), max_memory=1024) as spool:
+        assert not spool._rolled  # type: ignore[attr-defined]
+        assert spool.read() == data[:100]
+
+
+@pytest.mark.asyncio
+async def test_manager_read_resource_spooled():
+    manager = ClientManager()
+    await manager.add_server("test", test_server)
+
+    try:
+        spooled = await manager.read_resource_spooled(
+            "mcp-test+blob://data", max_memory=1024
+        )
+    finally:
+        await manager.remove_server("test")
+
+    assert len(spooled) == 1
+    assert isinstance(spooled[0], SpooledBlob)
+    assert spooled[0].mimeType == "application/octet-stream"
+
+    with spooled[0].file as file:
+        assert file.read() == bytes(range(256)) * 4096
@@ -0,0 +1,39 @@
+import pytest
+
+from easymcp.client.transports.generic import BytesTransportProtocol
+from easymcp.client.transports.stdio import (
+    ReadBuffer,
+    StdioServerParameters,
+    StdioTransport,
+)
+
+
+def test_read_buffer_returns_bytes():
+    buffer = ReadBuffer()
+    buffer.append('{"a": 1}\r\n{"text": "héllo"}\n{"c"'.encode())
+
+    assert buffer.read_message_bytes() == b'{"a": 1}'
+    assert buffer.read_message_bytes() == '{"text": "héllo"}'.encode()
+    assert buffer.read_message_bytes() is None
+
+    buffer.append(b": 3}\n")
+    assert buffer.read_message_bytes() == b'{"c": 3}'
+
+
+@pytest.mark.asyncio
+async def test_stdio_bytes_round_trip():
+    transport = StdioTransport(StdioServerParameters(command="cat"))
+    assert isinstance(transport, BytesTransportProtocol)
+
+    await transport.init()
+    await transport.start()
+
+    try:
+        await transport.send_bytes(b'{"a": 1}', b'{"b": 2}')
+        await transport.send('  {"c": 3}  ')
+
+        assert await transport.receive_bytes() == b'{"a": 1}'
+        assert await transport.receive_bytes() == b'{"b": 2}'
+        assert await transport.receive() == '{"c": 3}'
+    finally:
+        await transport.stop()
@@ -0,0 +1,63 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.transports.stdio import StdioServerParameters
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+@pytest.mark.asyncio
+async def test_call_tools_keeps_order_and_errors():
+    manager = ClientManager()
+    await manager.init({"a": test_server, "b": test_server}, parallel=True)
+
+    try:
+        results = await manager.call_tools(
+            [
+                ("a.echo", {"text": "first"}),
+                ("missing.echo", {"text": "nope"}),
+                ("b.echo", {"text": "second"}),
+                ("a.sleep", {"seconds": 0}),
+            ]
+        )
+
+        assert len(results) == 4
+        assert isinstance(results[0], types.CallToolResult)
+        assert results[0].content[0].text == "first"  # type: ignore[union-attr]
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], types.CallToolResult)
+        assert results[2].content[0].text == "second"  # type: ignore[union-attr]
+        assert isinstance(results[3], types.CallToolResult)
+    finally:
+        await manager.remove_server("a")
+        await manager.remove_server("b")
+
+
+@pytest.mark.asyncio
+async def test_call_tools_caps_concurrency_per_server():
+    manager = ClientManager()
+    await manager.init({"a": test_server, "b": test_server}, parallel=True)
+
+    try:
+        calls = [("a.sleep", {"seconds": 0.3})] * 4 + [("b.sleep", {"seconds": 0.3})]
+
+        start = time.monotonic()
+        results = await manager.call_tools(calls, max_concurrency_per_server=2)
+        elapsed = time.monotonic() - start
+
+        assert all(isinstance(result, types.CallToolResult) for result in results)
+        # server a runs two rounds of two calls, server b runs alongside
+        assert 0.6 <= elapsed < 1.2
+
+        with pytest.raises(ValueError):
+            await manager.call_tools(calls, max_concurrency_per_server=0)
+    finally:
+        await manager.remove_server("a")
+        await manager.remove_server("b")
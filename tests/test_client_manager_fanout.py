@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.sessions.fastmcp.parameters import FastMcpParameters
+
+
+class HangingSession:
+    """session that never answers list requests"""
+
+    async def init(self):
+        pass
+
+    async def list_tools(self, force: bool = False) -> types.ListToolsResult:
+        await asyncio.sleep(30)
+        raise AssertionError("unreachable")
+
+    async def call_tool(self, tool_name: str, args: dict) -> types.CallToolResult:
+        raise NotImplementedError
+
+
+@pytest.mark.asyncio
+async def test_list_tools_partial_result():
+    mgr = ClientManager()
+    await mgr.add_server("fastmcp", FastMcpParameters(module="fastmcp_test:mcp"))
+    mgr.sessions["hanging"] = HangingSession()
+
+    result = await mgr.list_tools(timeout=0.5, partial=True)
+
+    assert not result.complete
+    assert list(result.errors) == ["hanging"]
+    assert isinstance(result.errors["hanging"], TimeoutError)
+    assert "fastmcp.get_random_bool" in [tool.name for tool in result.items]
+
+    with pytest.raises(TimeoutError):
+        await mgr.list_tools(timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_list_resources_and_prompts_fan_out():
+    mgr = ClientManager()
+    await mgr.add_server("fastmcp", FastMcpParameters(module="fastmcp_test:mcp"))
+
+    resources = await mgr.list_resources(timeout=5)
+    assert "mcp-fastmcp+demo://lorem-ipsum" in [str(r.uri) for r in resources]
+
+    prompts = await mgr.list_prompts(timeout=5, partial=True)
+    assert prompts.complete
@@ -0,0 +1,65 @@
+import sys
+
+import pytest
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.transports.stdio import StdioServerParameters
+
+fastmcp_server = StdioServerParameters(
+    command=sys.executable, args=["-c", "from fastmcp_test import main; main()"]
+)
+broken_server = StdioServerParameters(command="easymcp-missing-server-binary")
+hanging_server = StdioServerParameters(
+    command=sys.executable, args=["-c", "import time; time.sleep(30)"]
+)
+
+
+@pytest.mark.asyncio
+async def test_parallel_startup_reports_failures():
+    mgr = ClientManager()
+
+    report = await mgr.init(
+        servers={
+            "first": fastmcp_server,
+            "second": fastmcp_server,
+            "broken": broken_server,
+            "hanging": hanging_server,
+        },
+        parallel=True,
+        max_concurrency=2,
+        startup_timeout=5,
+    )
+
+    assert report.started == ["first", "second"]
+    assert set(report.failed) == {"broken", "hanging"}
+    assert isinstance(report.failed["hanging"], TimeoutError)
+    assert not report.ok
+
+    assert mgr.list_servers() == ["first", "second"]
+
+    tools = await mgr.list_tools()
+    assert "first.get_random_bool" in [tool.name for tool in tools]
+
+    await mgr.remove_server("first")
+    await mgr.remove_server("second")
+
+
+@pytest.mark.asyncio
+async def test_sequential_startup_raises():
+    mgr = ClientManager()
+
+    with pytest.raises(FileNotFoundError):
+        await mgr.init(servers={"broken": broken_server})
+
+
+@pytest.mark.asyncio
+async def test_sequential_startup_timeout_cleans_up():
+    mgr = ClientManager()
+
+    for _ in range(2):
+        # a retry must not trip over the session of the failed attempt
+        with pytest.raises(TimeoutError):
+            await mgr.init(servers={"h": hanging_server}, startup_timeout=0.5)
+
+        assert mgr.list_servers() == []
+        assert mgr.server_health() == {}
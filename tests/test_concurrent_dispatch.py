@@ -0,0 +1,183 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+@pytest.mark.asyncio
+async def test_slow_sampling_callback_does_not_block_responses():
+    session = MCPClientSession(StdioTransport(test_server))
+    release = asyncio.Event()
+    sampling_started = asyncio.Event()
+
+    async def sampling(
+        request: types.CreateMessageRequest,
+    ) -> types.CreateMessageResult:
+        sampling_started.set()
+        await release.wait()
+        return types.CreateMessageResult(
+            role="assistant",
+            content=types.TextContent(type="text", text="sampled"),
+            model="test",
+        )
+
+    await session.init()
+    await session.register_sampling_callback(sampling)
+    await session.start()
+
+    try:
+        sample = asyncio.create_task(session.call_tool("sample", {"prompt": "hi"}))
+        await asyncio.wait_for(sampling_started.wait(), 5)
+
+        # the sampling callback is still running
+        result = await asyncio.wait_for(session.call_tool("echo", {"text": "hi"}), 5)
+        assert result.content[0].text == "hi"  # type: ignore[union-attr]
+        assert len(session._handler_tasks) == 1
+
+        release.set()
+        result = await asyncio.wait_for(sample, 5)
+        assert result.content[0].text == "sampled"  # type: ignore[union-attr]
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_answers_with_error():
+    session = MCPClientSession(StdioTransport(test_server))
+
+    async def sampling(
+        request: types.CreateMessageRequest,
+    ) -> types.CreateMessageResult:
+        raise RuntimeError("no model available")
+
+    await session.init()
+    await session.register_sampling_callback(sampling)
+    await session.start()
+
+    try:
+        result = await asyncio.wait_for(
+            session.call_tool("sample", {"prompt": "hi"}), 5
+        )
+        assert result.isError
+        assert "no model available" in result.content[0].text  # type: ignore[union-attr]
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_handler_concurrency_is_bounded():
+    session = MCPClientSession(
+        StdioTransport(test_server), max_concurrent_handlers=2, max_pending_handlers=1
+    )
+    release = asyncio.Event()
+    finished: list[int] = []
+
+    async def block(n: int):
+        await release.wait()
+        finished.append(n)
+
+    assert all(session._dispatch(block(n)) for n in range(3))
+    assert not session._dispatch(block(3))
+    assert len(session._handler_tasks) == 2
+    assert len(session._pending_handlers) == 1
+
+    release.set()
+    async with asyncio.timeout(1):
+        while session._handler_tasks:
+            await asyncio.sleep(0)
+
+    assert sorted(finished) == [0, 1, 2]
+    assert not session._pending_handlers
+
+    with pytest.raises(ValueError):
+        MCPClientSession(StdioTransport(test_server), max_concurrent_handlers=0)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_server_requests_are_forgotten():
+    session = MCPClientSession(StdioTransport(test_server), max_concurrent_handlers=1)
+    release = asyncio.Event()
+
+    async def block():
+        await release.wait()
+
+    def cancel(request_id: int) -> types.ServerNotification:
+        return types.ServerNotification(
+            types.CancelledNotification(
+                method="notifications/cancelled",
+                params=types.CancelledNotificationParams(requestId=request_id),
+            )
+        )
+
+    session._dispatch(block(), request_id=1)
+    session._dispatch(block(), request_id=2)
+    assert list(session._server_requests) == [1]
+
+    # the waiting handler is dropped without ever running
+    session._route_notification(cancel(2))
+    assert not session._pending_handlers
+
+    # the running one is cancelled before its first step
+    session._route_notification(cancel(1))
+    async with asyncio.timeout(1):
+        while session._handler_tasks:
+            await asyncio.sleep(0)
+
+    assert not session._server_requests
+
+
+@pytest.mark.asyncio
+async def test_busy_handlers_do_not_stop_responses():
+    session = MCPClientSession(StdioTransport(test_server), max_concurrent_handlers=1)
+    release = asyncio.Event()
+    sampling_started = asyncio.Event()
+    updates: list[str] = []
+
+    async def sampling(
+        request: types.CreateMessageRequest,
+    ) -> types.CreateMessageResult:
+        sampling_started.set()
+        await release.wait()
+        return types.CreateMessageResult(
+            role="assistant",
+            content=types.TextContent(type="text", text="sampled"),
+            model="test",
+        )
+
+    async def updated(uri: str):
+        updates.append(uri)
+
+    await session.init()
+    await session.register_sampling_callback(sampling)
+    await session.register_resource_updated_callback(updated)
+    await session.start()
+
+    try:
+        await session.subscribe_resource("memo://note")
+        sample = asyncio.create_task(session.call_tool("sample", {"prompt": "hi"}))
+        await asyncio.wait_for(sampling_started.wait(), 5)
+
+        # the update waits for the only slot, the response behind it still resolves
+        result = await asyncio.wait_for(
+            session.call_tool("set_note", {"text": "busy"}), 5
+        )
+        assert not result.isError
+        assert not updates and len(session._pending_handlers) == 1
+
+        release.set()
+        await asyncio.wait_for(sample, 5)
+        async with asyncio.timeout(5):
+            while not updates:
+                await asyncio.sleep(0.01)
+        assert updates == ["memo://note"]
+    finally:
+        await session.stop()
@@ -0,0 +1,119 @@
+import sys
+from typing import Iterator
+
+import pytest
+from loguru import logger
+from mcp import types
+from pydantic import BaseModel
+
+from easymcp.client import debuglog
+from easymcp.client.debuglog import bounded_json, log_payload, truncate
+
+
+class Payload:
+    """counts how often it is formatted"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return self.text
+
+
+@pytest.fixture
+def records() -> Iterator[list[str]]:
+    records: list[str] = []
+    logger.remove()
+    logger.add(records.append, level="DEBUG", format="{message}")
+    yield records
+    logger.remove()
+    logger.add(sys.stderr)
+
+    debuglog.settings = debuglog.PayloadLogging()
+
+
+def test_truncate():
+    assert truncate("abc", 5) == "abc"
+    assert truncate("abcdef", 2) == "ab... (4 more characters)"
+    assert truncate("abcdef", None) == "abcdef"
+
+
+def test_payloads_are_truncated(records: list[str]):
+    debuglog.settings.max_payload_size = 4
+
+    log_payload("text {}", "abcdef")
+    log_payload("bytes {}", b"abcdef")
+    log_payload("short {}", b"ab")
+
+    assert records == [
+        "text abcd... (2 more characters)\n",
+        "bytes abcd... (2 more bytes)\n",
+        "short ab\n",
+    ]
+
+
+def test_payloads_are_formatted_lazily(records: list[str]):
+    payload = Payload("hello")
+
+    logger.remove()
+    logger.add(records.append, level="INFO")
+    log_payload("payload {}", payload)
+    assert payload.formatted == 0
+
+    debuglog.settings.enabled = False
+    logger.add(records.append, level="DEBUG")
+    log_payload("payload {}", payload)
+    assert payload.formatted == 0
+    assert records == []
+
+
+def test_call_sites_compile_out():
+    source = (
+        "def log(payload):\n    if __debug__:\n        log_payload('{}', payload)\n"
+    )
+    calls: list[object] = []
+    namespace = {"log_payload": lambda template, payload: calls.append(payload)}
+
+    exec(compile(source, "<test>", "exec", optimize=0), namespace)
+    namespace["log"]("kept")  # type: ignore[operator]
+
+    exec(compile(source, "<test>", "exec", optimize=1), namespace)
+    namespace["log"]("removed")  # type: ignore[operator]
+
+    assert calls == ["kept"]
+
+
+def test_models_are_serialized_only_as_far_as_shown(records: list[str]):
+    class Bag(BaseModel):
+        blob: str
+        items: list[object]
+
+    message = types.JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")
+    assert bounded_json(message, 1024) == message.model_dump_json()
+
+    items = [Payload(str(n)) for n in range(1000)]
+    bag = Bag(blob="x" * 10_000_000, items=items)
+
+    debuglog.settings.max_payload_size = 32
+    log_payload("bag {}", bag)
+
+    assert records == ['bag {"blob":"' + "x" * 23 + "... (truncated)\n"]
+    assert not any(item.formatted for item in items)
+
+    debuglog.settings.max_payload_size = 64
+    assert bounded_json(Bag(blob="", items=items), 64).startswith(
+        '{"blob":"","items":["0","1","2"'
+    )
+    assert sum(item.formatted for item in items) < 30
+
+
+def test_sequences_are_serialized_only_as_far_as_shown(records: list[str]):
+    items = [Payload(str(n)) for n in range(1000)]
+
+    debuglog.settings.max_payload_size = 16
+    log_payload("list {}", items)
+
+    assert records == ['list ["0","1","2","3"... (truncated)\n']
+    assert sum(item.formatted for item in items) < 10
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from mcp import types
+
+from easymcp.client.decoding import (
+    DecodedNotification,
+    DecodedRequest,
+    decode_message,
+)
+
+
+def encode(**message) -> str:
+    return json.dumps({"jsonrpc": "2.0", **message})
+
+
+def test_notification_is_typed_in_one_pass():
+    message = decode_message(
+        encode(
+            method="notifications/progress",
+            params={"progressToken": "token", "progress": 1, "total": 2},
+        )
+    )
+
+    assert isinstance(message.root, DecodedNotification)
+    assert isinstance(message.root.notification, types.ServerNotification)
+    assert isinstance(message.root.notification.root, types.ProgressNotification)
+    assert message.root.notification.root.params.total == 2
+
+
+def test_request_is_typed_in_one_pass():
+    message = decode_message(
+        encode(
+            id=7,
+            method="sampling/createMessage",
+            params={
+                "messages": [
+                    {"role": "user", "content": {"type": "text", "text": "hi"}}
+                ],
+                "maxTokens": 10,
+            },
+        )
+    )
+
+    assert isinstance(message.root, DecodedRequest)
+    assert message.root.id == 7
+    assert isinstance(message.root.request.root, types.CreateMessageRequest)
+
+    # requests without params are typed as well
+    ping = decode_message(encode(id=8, method="ping"))
+    assert isinstance(ping.root, DecodedRequest)
+    assert isinstance(ping.root.request.root, types.PingRequest)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        encode(id=1, method="unknown/method", params={}),
+        encode(id=1, method="sampling/createMessage", params={}),
+        encode(method="notifications/unknown", params={}),
+    ],
+)
+def test_unknown_or_invalid_methods_fall_back(message: str):
+    decoded = decode_message(message)
+
+    assert isinstance(decoded.root, (types.JSONRPCRequest, types.JSONRPCNotification))
+    assert not isinstance(decoded.root, (DecodedRequest, DecodedNotification))
+
+
+def test_responses_and_errors():
+    response = decode_message(encode(id="a", result={"content": [], "isError": False}))
+    assert isinstance(response.root, types.JSONRPCResponse)
+    assert types.CallToolResult.model_validate(response.root.result).isError is False
+
+    error = decode_message(encode(id="a", error={"code": -1, "message": "boom"}))
+    assert isinstance(error.root, types.JSONRPCError)
+    assert error.root.error.message == "boom"
+
+
+def test_typed_fields_are_not_serialized():
+    message = decode_message(encode(id=8, method="ping"))
+    assert json.loads(message.model_dump_json(exclude_none=True)) == {
+        "jsonrpc": "2.0",
+        "id": 8,
+        "method": "ping",
+    }
+
+
+@pytest.mark.parametrize(
+    "data", ["not json", "[1, 2]", encode(id=1), encode(id=[1], result={})]
+)
+def test_invalid_messages_raise_value_error(data: str):
+    with pytest.raises(ValueError):
+        decode_message(data)
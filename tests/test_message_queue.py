@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+from mcp import types
+
+from easymcp.client.errors import QueueFullError
+from easymcp.client.iobuffers import reader
+from easymcp.client.requestmap import RequestMap
+from easymcp.client.queues import MessageQueue
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+
+def notification(method: str = "notifications/progress") -> types.JSONRPCMessage:
+    return types.JSONRPCMessage(types.JSONRPCNotification(jsonrpc="2.0", method=method))
+
+
+def response(request_id: int) -> types.JSONRPCMessage:
+    return types.JSONRPCMessage(
+        types.JSONRPCResponse(jsonrpc="2.0", id=request_id, result={})
+    )
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_space():
+    queue = MessageQueue(1)
+    await queue.put(response(1))
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(response(2))
+
+    put = asyncio.create_task(queue.put(response(2)))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    assert queue.get_nowait().root.id == 1  # type: ignore[union-attr]
+    await asyncio.wait_for(put, 1)
+
+    stats = queue.stats()
+    assert stats.depth == 1
+    assert stats.maxsize == 1
+    assert stats.high_watermark == 1
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_notification():
+    queue = MessageQueue(3, "drop_oldest_notification")
+
+    await queue.put(notification("notifications/first"))
+    await queue.put(response(1))
+    await queue.put(notification("notifications/second"))
+
+    # room is made by dropping the oldest notification
+    await queue.put(response(2))
+
+    methods = []
+    while not queue.empty():
+        root = queue.get_nowait().root
+        methods.append(getattr(root, "method", None) or root.id)  # type: ignore[union-attr]
+
+    assert methods == [1, "notifications/second", 2]
+    assert queue.stats().dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_drops_new_notification_and_blocks_responses():
+    queue = MessageQueue(1, "drop_oldest_notification")
+    await queue.put(response(1))
+
+    await queue.put(notification())
+    assert queue.qsize() == 1
+    assert queue.stats().dropped == 1
+
+    put = asyncio.create_task(queue.put(response(2)))
+    await asyncio.sleep(0)
+    assert not put.done()
+
+    queue.get_nowait()
+    await asyncio.wait_for(put, 1)
+
+
+@pytest.mark.asyncio
+async def test_fail_policy():
+    queue = MessageQueue(1, "fail")
+    await queue.put(response(1))
+
+    with pytest.raises(QueueFullError):
+        await queue.put(response(2))
+
+    with pytest.raises(QueueFullError):
+        queue.put_nowait(notification())
+
+    assert queue.stats().rejected == 2
+    assert queue.qsize() == 1
+
+
+def test_session_queue_stats():
+    transport = StdioTransport(StdioServerParameters(command="true"))
+    session = MCPClientSession(transport, queue_size=8, overflow="fail")
+
+    stats = session.queue_stats()
+    assert stats["incoming"].maxsize == 8
+    assert stats["outgoing"].depth == 0
+    assert session.incoming_messages.policy == "fail"
+
+    # client notifications such as cancellations are never dropped
+    assert session.outgoing_messages.policy == "block"
+
+
+class BurstTransport:
+    """bytes transport replaying a fixed burst of messages"""
+
+    def __init__(self, messages: list[types.JSONRPCMessage]):
+        self.state = "started"
+        self.pending: asyncio.Queue[bytes] = asyncio.Queue()
+        for message in messages:
+            self.push(message)
+
+    def push(self, message: types.JSONRPCMessage):
+        self.pending.put_nowait(message.model_dump_json().encode())
+
+    async def init(self) -> None: ...
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send(self, message: str) -> None: ...
+
+    async def receive(self) -> str:
+        return (await self.receive_bytes()).decode()
+
+    async def send_bytes(self, *messages: bytes) -> None: ...
+
+    async def receive_bytes(self) -> bytes:
+        return await self.pending.get()
+
+
+@pytest.mark.asyncio
+async def test_reader_survives_full_queue():
+    request = types.JSONRPCMessage(
+        types.JSONRPCRequest(jsonrpc="2.0", id=7, method="roots/list")
+    )
+    transport = BurstTransport(
+        [notification("notifications/message"), notification(), request, response(1)]
+    )
+    queue = MessageQueue(1, "fail")
+    overflowed: list[types.JSONRPCMessage] = []
+
+    task = await reader(transport, queue, on_overflow=overflowed.append)  # type: ignore[arg-type]
+    try:
+        while not transport.pending.empty():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+        assert not task.done()
+        assert queue.stats().rejected == 3
+        assert overflowed[1].root.id == 7  # type: ignore[union-attr]
+
+        # once there is room again, messages are queued as usual
+        queue.get_nowait()
+        transport.push(response(2))
+        assert (await asyncio.wait_for(queue.get(), 1)).root.id == 2  # type: ignore[union-attr]
+    finally:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_session_rejects_overflowed_requests():
+    transport = StdioTransport(StdioServerParameters(command="true"))
+    session = MCPClientSession(transport, queue_size=1, overflow="fail")
+
+    request = types.JSONRPCRequest(jsonrpc="2.0", id=3, method="sampling/createMessage")
+    session._reject_overflow(types.JSONRPCMessage(request))
+    session._reject_overflow(notification())
+
+    error = session.outgoing_messages.get_nowait().root
+    assert isinstance(error, types.JSONRPCError) and error.id == 3
+    assert session.outgoing_messages.empty()
+
+
+@pytest.mark.asyncio
+async def test_dropped_response_fails_the_caller():
+    transport = BurstTransport([notification()])
+    session = MCPClientSession(transport, queue_size=1, overflow="fail")  # type: ignore[arg-type]
+    session.request_map = RequestMap(session.outgoing_messages)
+
+    # nothing drains the incoming queue, the notification fills it
+    task = await reader(transport, session.incoming_messages, on_overflow=session._reject_overflow)  # type: ignore[arg-type]
+    try:
+        call = asyncio.create_task(session._send("ping"))
+        request = (await asyncio.wait_for(session.outgoing_messages.get(), 1)).root
+        assert session.in_flight == 1
+
+        transport.push(response(request.id))  # type: ignore[union-attr]
+        with pytest.raises(QueueFullError):
+            await asyncio.wait_for(call, 1)
+        assert session.in_flight == 0
+    finally:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_unknown_request_reply_does_not_stall_the_loop():
+    transport = StdioTransport(StdioServerParameters(command="true"))
+    transport.state = "started"
+    session = MCPClientSession(transport, queue_size=1, outgoing_overflow="fail")
+    session.request_map = RequestMap(session.outgoing_messages)
+
+    # no room for the error reply
+    session.outgoing_messages.put_nowait(notification())
+
+    future = asyncio.get_running_loop().create_future()
+    session.request_map.requests[1] = future
+    session._start_reading_messages()
+
+    try:
+        unknown = types.JSONRPCRequest(
+            jsonrpc="2.0", id=5, method="unknown/method", params={"a": 1}
+        )
+        await session.incoming_messages.put(types.JSONRPCMessage(unknown))
+        await session.incoming_messages.put(response(1))
+
+        resolved = await asyncio.wait_for(future, 1)
+        assert resolved.id == 1
+        assert not session._start_reading_messages_task.done()
+    finally:
+        session._start_reading_messages_task.cancel()
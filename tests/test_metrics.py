@@ -0,0 +1,189 @@
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from easymcp.client import metrics
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.exporters import OpenTelemetryHook, PrometheusCollector
+from easymcp.client.metrics import MetricsRegistry
+from easymcp.client.transports.stdio import StdioServerParameters
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+class RecordingHook:
+    """metrics and tracing hook remembering every call"""
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def counter(self, name: str, value: float, labels: dict[str, str]) -> None:
+        self.calls.append(("counter", name, value, labels))
+
+    def histogram(self, name: str, value: float, labels: dict[str, str]) -> None:
+        self.calls.append(("histogram", name, labels))
+
+    @contextmanager
+    def span(self, name: str, labels: dict[str, str]):
+        self.calls.append(("span", name, labels))
+        yield
+
+
+class BrokenHook:
+    def counter(self, name: str, value: float, labels: dict[str, str]) -> None:
+        raise RuntimeError("exporter down")
+
+    def histogram(self, name: str, value: float, labels: dict[str, str]) -> None:
+        raise RuntimeError("exporter down")
+
+
+def test_registry_counters_and_histograms():
+    registry = MetricsRegistry(buckets=[0.1, 1])
+
+    registry.increment("requests_total", server="a")
+    registry.increment("requests_total", 2, server="a")
+    for value in (0.05, 0.5, 5):
+        registry.observe("latency_seconds", value, server="a")
+
+    snapshot = registry.snapshot()
+    assert snapshot.value("requests_total", server="a") == 3
+    assert snapshot.value("requests_total", server="b") is None
+
+    histogram = snapshot.histogram("latency_seconds", server="a")
+    assert histogram is not None
+    assert histogram.buckets == [(0.1, 1), (1, 2), (float("inf"), 3)]
+    assert histogram.count == 3 and histogram.sum == pytest.approx(5.55)
+
+    registry.enabled = False
+    registry.increment("requests_total", server="a")
+    with registry.timed("op"):
+        pass
+    assert registry.snapshot().value("requests_total", server="a") == 3
+    assert registry.snapshot().histogram("op_seconds") is None
+
+
+def test_timed_records_errors_and_spans():
+    registry = MetricsRegistry()
+    hook = RecordingHook()
+    registry.add_hook(hook)
+    registry.add_hook(BrokenHook())
+
+    with pytest.raises(KeyError):
+        with registry.timed("easymcp_op", server="a"):
+            raise KeyError("x")
+
+    snapshot = registry.snapshot()
+    assert snapshot.histogram("easymcp_op_seconds", server="a") is not None
+    assert snapshot.value("easymcp_op_errors_total", server="a", error="KeyError") == 1
+
+    assert hook.calls == [
+        ("span", "easymcp_op", {"server": "a"}),
+        ("histogram", "easymcp_op_seconds", {"server": "a"}),
+        ("counter", "easymcp_op_errors_total", 1, {"error": "KeyError", "server": "a"}),
+    ]
+
+
+def test_opentelemetry_hook_creates_instruments_once():
+    pytest.importorskip("opentelemetry")
+
+    class Instrument:
+        def __init__(self):
+            self.values: list[float] = []
+
+        def add(self, value, attributes):
+            self.values.append(value)
+
+        record = add
+
+    class Meter:
+        def __init__(self):
+            self.created: list[str] = []
+
+        def create_counter(self, name):
+            self.created.append(name)
+            return Instrument()
+
+        def create_histogram(self, name, unit=""):
+            self.created.append(name)
+            return Instrument()
+
+    meter = Meter()
+    registry = MetricsRegistry()
+    registry.add_hook(OpenTelemetryHook(meter=meter))
+
+    for _ in range(3):
+        with registry.timed("easymcp_op"):
+            pass
+
+    assert meter.created == ["easymcp_op_seconds"]
+
+
+@pytest.mark.asyncio
+async def test_client_manager_is_instrumented():
+    metrics.registry.reset()
+    manager = ClientManager()
+    await manager.init({"test": test_server})
+
+    try:
+        await manager.list_tools()
+        await manager.call_tool("test.echo", {"text": "hi"})
+        await manager.read_resource("mcp-test+memo://note")
+
+        with pytest.raises(ValueError):
+            await manager.call_tool("test.missing", {})
+
+        snapshot = metrics.registry.snapshot()
+
+        for name, labels in [
+            ("easymcp_handshake_seconds", {"server": "test"}),
+            ("easymcp_list_tools_seconds", {"server": "test"}),
+            ("easymcp_call_tool_seconds", {"server": "test", "tool": "echo"}),
+            ("easymcp_read_resource_seconds", {"server": "test"}),
+        ]:
+            histogram = snapshot.histogram(name, **labels)
+            assert histogram is not None and histogram.count == 1, name
+
+        errors = snapshot.value(
+            "easymcp_call_tool_errors_total",
+            server="test",
+            tool="missing",
+            error="ValueError",
+        )
+        assert errors == 1
+
+        assert snapshot.value("easymcp_server_up", server="test") == 1
+        assert snapshot.value("easymcp_requests_in_flight", server="test") == 0
+        assert (
+            snapshot.value("easymcp_queue_depth", server="test", queue="incoming") == 0
+        )
+
+        sent = snapshot.value(
+            "easymcp_transport_bytes_total", server="test", direction="sent"
+        )
+        received = snapshot.value(
+            "easymcp_transport_messages_total", server="test", direction="received"
+        )
+        assert sent and sent > 0
+        assert received and received >= 4
+    finally:
+        await manager.remove_server("test")
+
+
+def test_prometheus_collector_exposes_registry():
+    prometheus_client = pytest.importorskip("prometheus_client")
+
+    registry = MetricsRegistry()
+    registry.increment("easymcp_restarts_total", server="a")
+    registry.observe("easymcp_call_tool_seconds", 0.2, server="a", tool="t")
+
+    collectors = prometheus_client.CollectorRegistry()
+    collectors.register(PrometheusCollector(registry))
+    text = prometheus_client.generate_latest(collectors).decode()
+
+    assert 'easymcp_restarts_total{server="a"} 1.0' in text
+    assert 'easymcp_call_tool_seconds_bucket{le="0.25",server="a",tool="t"} 1.0' in text
+    assert 'easymcp_call_tool_seconds_count{server="a",tool="t"} 1.0' in text
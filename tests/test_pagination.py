@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.generic import MessageTransportProtocol
+
+PAGES = {
+    None: (["a", "b"], "page-2"),
+    "page-2": (["c", "d"], "page-3"),
+    "page-3": (["e"], None),
+}
+
+
+class PagingTransport(MessageTransportProtocol):
+    """answers initialize and serves resources and tools in pages"""
+
+    def __init__(self):
+        self.state = "constructed"
+        self.responses: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+        self.cursors: list[str | None] = []
+        self.failing: list[str | None] = []
+
+    async def init(self):
+        self.state = "initialized"
+
+    async def start(self):
+        self.state = "started"
+
+    async def stop(self):
+        self.state = "stopped"
+
+    async def send(self, message: str):
+        await self.send_message(types.JSONRPCMessage.model_validate_json(message))
+
+    async def receive(self) -> str:
+        return (await self.receive_message()).model_dump_json()
+
+    async def receive_message(self) -> types.JSONRPCMessage:
+        return await self.responses.get()
+
+    async def send_message(self, message: types.JSONRPCMessage):
+        request = message.root
+        if not isinstance(request, types.JSONRPCRequest):
+            return
+
+        if request.method == "initialize":
+            result = types.InitializeResult(
+                protocolVersion=types.LATEST_PROTOCOL_VERSION,
+                capabilities=types.ServerCapabilities(),
+                serverInfo=types.Implementation(name="paging", version="1"),
+            ).model_dump(exclude_none=True)
+        else:
+            cursor = (request.params or {}).get("cursor")
+            self.cursors.append(cursor)
+
+            if cursor in self.failing:
+                error = types.ErrorData(code=types.INTERNAL_ERROR, message="boom")
+                await self.responses.put(
+                    types.JSONRPCMessage(
+                        types.JSONRPCError(jsonrpc="2.0", id=request.id, error=error)
+                    )
+                )
+                return
+
+            names, next_cursor = PAGES[cursor]
+
+            if request.method == "resources/list":
+                items = [{"uri": f"memo://{n}", "name": n} for n in names]
+                result = {"resources": items}
+            else:
+                items = [{"name": n, "inputSchema": {"type": "object"}} for n in names]
+                result = {"tools": items}
+
+            if next_cursor is not None:
+                result["nextCursor"] = next_cursor
+
+        await self.responses.put(
+            types.JSONRPCMessage(
+                types.JSONRPCResponse(jsonrpc="2.0", id=request.id, result=result)
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_follows_cursors():
+    transport = PagingTransport()
+    session = MCPClientSession(transport)
+    await session.init()
+    await session.start()
+
+    try:
+        resources = await session.list_resources()
+        assert [r.name for r in resources.resources] == ["a", "b", "c", "d", "e"]
+        assert transport.cursors == [None, "page-2", "page-3"]
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_iter_is_lazy():
+    transport = PagingTransport()
+    session = MCPClientSession(transport)
+    await session.init()
+    await session.start()
+
+    try:
+        names = []
+        async for resource in session.iter_resources():
+            names.append(resource.name)
+            if resource.name == "b":
+                break
+
+        assert names == ["a", "b"]
+        assert transport.cursors == [None]
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_manager_iter_namespaces():
+    manager = ClientManager()
+    session = MCPClientSession(PagingTransport())
+    await session.init()
+    await session.start()
+    manager.sessions["paging"] = session
+
+    try:
+        tools = [tool.name async for tool in manager.iter_tools()]
+        assert tools == [f"paging.{n}" for n in "abcde"]
+
+        uris = [str(r.uri) async for r in manager.iter_resources()]
+        assert uris[0] == "mcp-paging+memo://a"
+        assert len(uris) == 5
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_page_is_not_cached():
+    transport = PagingTransport()
+    transport.failing = ["page-3"]
+    session = MCPClientSession(transport)
+    await session.init()
+    await session.start()
+    manager = ClientManager()
+    manager.sessions["paging"] = session
+
+    try:
+        with pytest.raises(RuntimeError, match="page-3"):
+            await session.list_tools()
+        assert session._tools is None
+
+        result = await manager.list_tools(partial=True)
+        assert list(result.errors) == ["paging"]
+        assert not manager.tool_catalog.is_fresh("paging")
+
+        transport.failing = []
+        tools = await manager.list_tools()
+        assert [tool.name for tool in tools] == [f"paging.{n}" for n in "abcde"]
+
+        # the server never advertised resources, an error means there are none
+        transport.failing = [None]
+        assert len((await session.list_resources()).resources) == 0
+    finally:
+        await session.stop()
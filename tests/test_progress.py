@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+@pytest.mark.asyncio
+async def test_session_call_tool_progress():
+    session = MCPClientSession(StdioTransport(test_server))
+    events: list[types.ProgressNotificationParams] = []
+
+    async def on_progress(event: types.ProgressNotificationParams):
+        events.append(event)
+
+    await session.init()
+    await session.start()
+
+    try:
+        result = await session.call_tool(
+            "count", {"steps": 5}, progress_callback=on_progress
+        )
+        assert result.content[0].text == "counted"  # type: ignore[union-attr]
+
+        assert [event.progress for event in events] == [1, 2, 3, 4, 5]
+        assert all(event.total == 5 for event in events)
+        assert len({event.progressToken for event in events}) == 1
+        assert session._progress == {}
+
+        # without a callback no token is sent and progress is ignored
+        await session.call_tool("count", {"steps": 2})
+        assert len(events) == 5
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_manager_call_tool_progress():
+    manager = ClientManager()
+    await manager.add_server("test", test_server)
+
+    progress: list[float] = []
+
+    async def on_progress(event: types.ProgressNotificationParams):
+        progress.append(event.progress)
+
+    try:
+        await manager.call_tool(
+            "test.count", {"steps": 3}, progress_callback=on_progress
+        )
+        assert progress == [1, 2, 3]
+    finally:
+        await manager.remove_server("test")
@@ -0,0 +1,61 @@
+import pytest
+
+from easymcp.client.errors import MessageTooLargeError
+from easymcp.client.transports.stdio import ReadBuffer
+
+
+def test_read_buffer_returns_every_buffered_line():
+    buffer = ReadBuffer()
+    buffer.append(b'{"a": 1}\n{"b": 2}\r\n{"c"')
+
+    assert buffer.read_messages() == ['{"a": 1}', '{"b": 2}']
+    assert buffer.read_message() is None
+
+    buffer.append(b": 3}\n")
+    assert buffer.read_message() == '{"c": 3}'
+    assert buffer.read_message() is None
+
+
+def test_read_buffer_handles_split_chunks():
+    payload = b'{"data": "' + b"x" * 200_000 + b'"}\n'
+    buffer = ReadBuffer()
+    buffer.compact_threshold = 1024
+
+    messages = []
+    for i in range(0, len(payload) * 3, 1000):
+        buffer.append((payload * 3)[i : i + 1000])
+        messages.extend(buffer.read_messages())
+
+    assert messages == [payload[:-1].decode()] * 3
+    assert len(buffer.buffer) == 0
+
+
+def test_read_buffer_decodes_multibyte_characters_across_chunks():
+    encoded = '{"text": "héllo 🚀"}\n'.encode()
+    buffer = ReadBuffer()
+    for byte in encoded:
+        buffer.append(bytes([byte]))
+
+    assert buffer.read_messages() == ['{"text": "héllo 🚀"}']
+
+
+def test_read_buffer_rejects_oversized_messages_and_resyncs():
+    buffer = ReadBuffer(max_message_size=16)
+
+    buffer.append(b"x" * 10)
+    assert buffer.read_message() is None
+
+    buffer.append(b"x" * 10)
+    with pytest.raises(MessageTooLargeError):
+        buffer.read_message()
+
+    # the rest of the oversized message is skipped
+    buffer.append(b"x" * 100)
+    assert buffer.read_message() is None
+    buffer.append(b'xxx\n{"ok": true}\n')
+    assert buffer.read_messages() == ['{"ok": true}']
+
+    buffer.append(b"y" * 20 + b"\n" + b"{}\n")
+    with pytest.raises(MessageTooLargeError):
+        buffer.read_message()
+    assert buffer.read_message() == "{}"
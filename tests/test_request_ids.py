@@ -0,0 +1,69 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.requestmap import RequestMap
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+from easymcp.client.utils import CreateJsonRPCRequest, create_request
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+def test_create_request_matches_typed_request():
+    typed = CreateJsonRPCRequest(
+        types.ClientRequest(
+            types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(name="echo", arguments={"a": 1}),
+            )
+        ),
+        request_id=7,
+    )
+    direct = create_request(7, "tools/call", {"name": "echo", "arguments": {"a": 1}})
+
+    assert direct == typed
+
+
+@pytest.mark.asyncio
+async def test_request_map_allocates_increasing_ids():
+    queue: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+    request_map = RequestMap(queue)
+
+    assert [request_map.next_id() for _ in range(3)] == [1, 2, 3]
+
+    task = asyncio.create_task(
+        request_map.send_request(create_request(request_map.next_id(), "ping"))
+    )
+    sent = (await queue.get()).root
+    assert isinstance(sent, types.JSONRPCRequest) and sent.id == 4
+
+    # responses are matched on the id as sent, not on its string form
+    request_map.resolve_request(types.JSONRPCResponse(jsonrpc="2.0", id="4", result={}))
+    assert not task.done()
+
+    request_map.resolve_request(types.JSONRPCResponse(jsonrpc="2.0", id=4, result={}))
+    assert await task is not None
+    assert request_map.requests == {}
+
+
+@pytest.mark.asyncio
+async def test_session_uses_integer_ids():
+    session = MCPClientSession(StdioTransport(test_server))
+    await session.init()
+    await session.start()
+
+    try:
+        before = session.request_map.next_id()
+
+        result = await session.call_tool("echo", {"text": "hi"})
+        assert result.content[0].text == "hi"  # type: ignore[union-attr]
+
+        assert session.request_map.next_id() == before + 2
+    finally:
+        await session.stop()
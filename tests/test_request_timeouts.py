@@ -0,0 +1,92 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.requestmap import RequestMap
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+def make_request(request_id: int, method: str = "tools/call") -> types.JSONRPCRequest:
+    return types.JSONRPCRequest(jsonrpc="2.0", id=request_id, method=method)
+
+
+@pytest.mark.asyncio
+async def test_request_map_timeout_cleans_up_and_cancels():
+    queue: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+    request_map = RequestMap(queue, default_timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        await request_map.send_request(make_request(1))
+
+    assert request_map.requests == {}
+
+    sent = queue.get_nowait().root
+    assert isinstance(sent, types.JSONRPCRequest)
+
+    cancelled = queue.get_nowait().root
+    assert isinstance(cancelled, types.JSONRPCNotification)
+    assert cancelled.method == "notifications/cancelled"
+    assert cancelled.params is not None
+    assert cancelled.params["requestId"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_map_caller_cancellation():
+    queue: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+    request_map = RequestMap(queue)
+
+    task = asyncio.create_task(request_map.send_request(make_request(2)))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert request_map.requests == {}
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_request_map_never_cancels_initialize():
+    queue: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+    request_map = RequestMap(queue)
+
+    with pytest.raises(TimeoutError):
+        await request_map.send_request(make_request(3, "initialize"), timeout=0.01)
+
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_session_and_manager_timeouts():
+    session = MCPClientSession(StdioTransport(test_server), request_timeout=5)
+    await session.init()
+    await session.start()
+
+    with pytest.raises(TimeoutError):
+        await session.call_tool("sleep", {"seconds": 10}, timeout=0.2)
+
+    assert session.request_map.requests == {}
+
+    await session.stop()
+
+    mgr = ClientManager()
+    mgr.default_request_timeout = 0.2
+    await mgr.add_server("test", test_server)
+
+    result = await mgr.call_tool("test.sleep", {"seconds": 0.5}, timeout=5)
+    assert result.content[0].text == "done"  # type: ignore
+
+    with pytest.raises(TimeoutError):
+        await mgr.call_tool("test.sleep", {"seconds": 10})
+
+    await mgr.remove_server("test")
@@ -0,0 +1,134 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+from pydantic import AnyUrl
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.resourcecache import ResourceCache
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+def contents(text: str) -> types.ReadResourceResult:
+    return types.ReadResourceResult(
+        contents=[types.TextResourceContents(uri=AnyUrl("memo://x"), text=text)]
+    )
+
+
+def test_updates_and_versions():
+    cache = ResourceCache()
+
+    version = cache.version("s", "memo://x")
+    cache.put("s", "memo://x", contents("a"), version)
+    assert cache.get("s", "memo://x") is not None
+
+    cache.updated("s", "memo://x")
+    assert cache.get("s", "memo://x") is None
+
+    # a read that started before the update is not stored
+    cache.put("s", "memo://x", contents("a"), version)
+    assert ("s", "memo://x") not in cache
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.updates) == (1, 1, 1)
+
+
+def test_eviction_by_size():
+    size = len(contents("a").model_dump_json())
+    cache = ResourceCache(max_bytes=size * 2)
+
+    cache.put("s", "1", contents("a"))
+    cache.put("s", "2", contents("a"))
+    cache.get("s", "1")
+    cache.put("s", "3", contents("a"))
+
+    assert ("s", "1") in cache
+    assert ("s", "2") not in cache
+    assert cache.stats().evictions == 1
+
+    cache.put("s", "big", contents("a" * size * 2))
+    assert ("s", "big") not in cache
+
+    cache.remove("s")
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_resource_cache_follows_updates():
+    manager = ClientManager()
+    manager.resource_cache = ResourceCache()
+    await manager.add_server("test", test_server)
+
+    uri = "mcp-test+memo://note"
+
+    try:
+        first = await manager.read_resource(uri)
+        assert first.contents[0].text == "first"  # type: ignore[union-attr]
+        assert await manager.read_resource(uri) is first
+
+        subscribed = await manager.call_tool("test.subscribed", {})
+        assert "memo://note" in subscribed.content[0].text  # type: ignore[union-attr]
+
+        await manager.call_tool("test.set_note", {"text": "second"})
+
+        async with asyncio.timeout(5):
+            while ("test", "memo://note") in manager.resource_cache:
+                await asyncio.sleep(0.01)
+
+        second = await manager.read_resource(uri)
+        assert second.contents[0].text == "second"  # type: ignore[union-attr]
+
+        stats = manager.resource_cache.stats()
+        assert (stats.hits, stats.misses, stats.updates) == (1, 2, 1)
+    finally:
+        await manager.remove_server("test")
+
+    assert len(manager.resource_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_caches_are_invalidated_while_handlers_are_busy():
+    manager = ClientManager()
+    manager.resource_cache = ResourceCache()
+    await manager.add_server("test", test_server)
+
+    session = manager.sessions["test"]
+    assert isinstance(session, MCPClientSession)
+
+    uri = "mcp-test+memo://note"
+    release = asyncio.Event()
+
+    try:
+        await manager.read_resource(uri)
+        await manager.list_tools()
+
+        # every slot is taken and nothing may wait, callbacks are dropped
+        for _ in range(session.max_concurrent_handlers):
+            session._dispatch(release.wait())
+        session.max_pending_handlers = 0
+
+        # the update arrives before the response of the call
+        await manager.call_tool("test.set_note", {"text": "second"})
+        assert ("test", "memo://note") not in manager.resource_cache
+
+        second = await manager.read_resource(uri)
+        assert second.contents[0].text == "second"  # type: ignore[union-attr]
+
+        session._route_notification(
+            types.ServerNotification(
+                types.ToolListChangedNotification(
+                    method="notifications/tools/list_changed"
+                )
+            )
+        )
+        assert not manager.tool_catalog.is_fresh("test")
+    finally:
+        release.set()
+        await manager.remove_server("test")
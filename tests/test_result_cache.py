@@ -0,0 +1,159 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.resultcache import ToolResultCache
+from easymcp.client.transports.stdio import StdioServerParameters
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+class Server:
+    """counts calls and answers with the call number"""
+
+    def __init__(self, delay: float = 0, error: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self) -> types.CallToolResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return types.CallToolResult(
+            content=[types.TextContent(type="text", text=str(self.calls))],
+            isError=self.error,
+        )
+
+
+@pytest.mark.asyncio
+async def test_hits_with_canonical_arguments():
+    cache = ToolResultCache()
+    server = Server()
+
+    first = await cache.get_or_call("s", "t", {"a": 1, "b": 2}, server)
+    second = await cache.get_or_call("s", "t", {"b": 2, "a": 1}, server)
+    other = await cache.get_or_call("s", "t", {"a": 2, "b": 2}, server)
+
+    assert second is first
+    assert other is not first
+    assert server.calls == 2
+    assert cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_per_tool_override():
+    cache = ToolResultCache(default_ttl=0.05, ttls={"s.never": 0})
+    server = Server()
+
+    await cache.get_or_call("s", "t", {}, server)
+    await cache.get_or_call("s", "t", {}, server)
+    assert server.calls == 1
+
+    await asyncio.sleep(0.1)
+    await cache.get_or_call("s", "t", {}, server)
+    assert server.calls == 2
+
+    await cache.get_or_call("s", "never", {}, server)
+    await cache.get_or_call("s", "never", {}, server)
+    assert server.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_size():
+    server = Server()
+    size = len((await server()).model_dump_json())
+    cache = ToolResultCache(max_bytes=size * 2)
+
+    await cache.get_or_call("s", "t", {"n": 1}, server)
+    await cache.get_or_call("s", "t", {"n": 2}, server)
+    await cache.get_or_call("s", "t", {"n": 1}, server)  # touch 1
+    await cache.get_or_call("s", "t", {"n": 3}, server)  # evicts 2
+
+    assert len(cache) == 2
+    assert cache.stats().evictions == 1
+    assert cache.stats().bytes <= size * 2
+
+    calls = server.calls
+    await cache.get_or_call("s", "t", {"n": 1}, server)
+    assert server.calls == calls
+    await cache.get_or_call("s", "t", {"n": 2}, server)
+    assert server.calls == calls + 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    cache = ToolResultCache()
+    server = Server(delay=0.05)
+
+    results = await asyncio.gather(
+        *(cache.get_or_call("s", "t", {}, server) for _ in range(5))
+    )
+
+    assert server.calls == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats().coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_hands_over():
+    cache = ToolResultCache()
+    server = Server(delay=0.05)
+
+    owner = asyncio.create_task(cache.get_or_call("s", "t", {}, server))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_call("s", "t", {}, server))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    result = await waiter
+
+    assert result.content[0].text == "2"  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_errors_and_invalidated_results_are_not_stored():
+    cache = ToolResultCache()
+
+    await cache.get_or_call("s", "t", {}, Server(error=True))
+    assert len(cache) == 0
+
+    server = Server(delay=0.05)
+    call = asyncio.create_task(cache.get_or_call("s", "t", {}, server))
+    await asyncio.sleep(0)
+    cache.invalidate("s")
+    await call
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_result_cache():
+    manager = ClientManager()
+    manager.result_cache = ToolResultCache()
+    await manager.add_server("test", test_server)
+
+    try:
+        first = await manager.call_tool("test.echo", {"text": "hi"})
+        second = await manager.call_tool("test.echo", {"text": "hi"})
+        assert second is first
+
+        stats = manager.result_cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+        # a tools changed notification drops the results of the server
+        await manager.sessions["test"].handle_notification(  # type: ignore[attr-defined]
+            types.ServerNotification(
+                types.ToolListChangedNotification(
+                    method="notifications/tools/list_changed"
+                )
+            )
+        )
+        assert len(manager.result_cache) == 0
+    finally:
+        await manager.remove_server("test")
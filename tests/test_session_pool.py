@@ -0,0 +1,91 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.sessions.pool.main import PooledSession
+from easymcp.client.sessions.pool.parameters import PoolParameters
+from easymcp.client.transports.stdio import StdioServerParameters
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+@pytest.mark.asyncio
+async def test_pool_routes_to_least_busy_replica():
+    pool = PooledSession(PoolParameters(server=test_server, size=2))
+    await pool.init()
+    await pool.start()
+
+    try:
+        assert pool.size == 2
+        assert pool.healthy
+
+        start = time.monotonic()
+        calls = [
+            asyncio.create_task(pool.call_tool("sleep", {"seconds": 1}))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.2)
+
+        assert pool.outstanding() == [1, 1]
+
+        await asyncio.gather(*calls)
+        assert time.monotonic() - start < 1.8
+        assert pool.outstanding() == [0, 0]
+
+        tools = await pool.list_tools()
+        assert await pool.list_tools() is tools
+        assert await pool.list_tools(force=True) is not tools
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_pool_resize_drains_removed_replicas():
+    pool = PooledSession(PoolParameters(server=test_server, size=1))
+    await pool.init()
+    await pool.start()
+
+    try:
+        await pool.resize(3)
+        assert pool.size == 3
+        assert all(replica.healthy for replica in pool.replicas)
+
+        call = asyncio.create_task(pool.call_tool("sleep", {"seconds": 0.5}))
+        await asyncio.sleep(0.2)
+        busy = pool.replicas[pool.outstanding().index(1)]
+
+        await pool.resize(1)
+        assert pool.replicas == [busy]
+
+        result = await call
+        assert not result.isError
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_manager_pooled_server():
+    manager = ClientManager()
+    await manager.add_server("pool", PoolParameters(server=test_server, size=2))
+
+    try:
+        result = await manager.call_tool("pool.echo", {"text": "hi"})
+        assert result.content[0].text == "hi"  # type: ignore[union-attr]
+
+        await manager.resize_pool("pool", 3)
+
+        session = manager.sessions["pool"]
+        assert isinstance(session, PooledSession)
+        assert session.size == 3
+        assert manager.server_parameters["pool"].size == 3  # type: ignore[union-attr]
+
+        with pytest.raises(ValueError):
+            await manager.resize_pool("pool", 0)
+    finally:
+        await manager.remove_server("pool")
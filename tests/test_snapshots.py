@@ -0,0 +1,49 @@
+import sys
+
+import pydantic
+import pytest
+from mcp import types
+
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.snapshots import ListPromptsSnapshot, ListToolsSnapshot
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+
+def test_snapshots_are_read_only():
+    snapshot = ListToolsSnapshot.model_validate(
+        {"tools": [{"name": "echo", "inputSchema": {"type": "object"}}]}
+    )
+
+    assert isinstance(snapshot, types.ListToolsResult)
+    assert isinstance(snapshot.tools, tuple)
+
+    with pytest.raises(pydantic.ValidationError):
+        snapshot.tools[0].name = "changed"
+
+    renamed = snapshot.tools[0].model_copy(update={"name": "server.echo"})
+    assert renamed.name == "server.echo"
+    assert snapshot.tools[0].name == "echo"
+
+    prompts = ListPromptsSnapshot.model_validate(
+        {"prompts": [{"name": "wa", "arguments": [{"name": "query"}]}]}
+    )
+    assert isinstance(prompts.prompts[0].arguments, tuple)
+
+
+@pytest.mark.asyncio
+async def test_session_cache_hits_are_zero_copy():
+    args = StdioServerParameters(
+        command=sys.executable, args=["-c", "from fastmcp_test import main; main()"]
+    )
+    session = MCPClientSession(StdioTransport(args))
+    await session.init()
+    await session.start()
+
+    tools = await session.list_tools()
+    assert await session.list_tools() is tools
+    assert await session.list_tools(force=True) is not tools
+
+    resources = await session.list_resources()
+    assert await session.list_resources() is resources
+
+    await session.stop()
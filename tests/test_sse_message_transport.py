@@ -0,0 +1,71 @@
+import asyncio
+import socket
+import sys
+
+import httpx
+import pytest
+from mcp.types import CallToolResult, InitializeResult
+
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.generic import MessageTransportProtocol
+from easymcp.client.transports.sse import SseServerParameters, SseTransport
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_server(url: str):
+    async with httpx.AsyncClient() as client:
+        for _ in range(100):
+            try:
+                async with client.stream("GET", url) as response:
+                    if response.status_code == 200:
+                        return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"{url} did not come up")
+
+
+class StringPathDisabled(SseTransport):
+    async def send(self, message: str):
+        raise AssertionError("string path used")
+
+    async def receive(self) -> str:
+        raise AssertionError("string path used")
+
+
+@pytest.mark.asyncio
+async def test_sse_transport_uses_message_path():
+    port = free_port()
+    server = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        f"from fastmcp_test import mcp; mcp.settings.port = {port}; mcp.run('sse')",
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+
+    try:
+        url = f"http://127.0.0.1:{port}/sse"
+        await wait_for_server(url)
+
+        transport = StringPathDisabled(SseServerParameters(url=url))
+        assert isinstance(transport, MessageTransportProtocol)
+
+        session = MCPClientSession(transport)
+        await session.init()
+
+        result = await session.start()
+        assert isinstance(result, InitializeResult)
+
+        call = await session.call_tool("get_random_bool", {})
+        assert isinstance(call, CallToolResult)
+
+        await session.stop()
+    finally:
+        server.kill()
+        await server.wait()
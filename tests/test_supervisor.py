@@ -0,0 +1,125 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.supervisor import SupervisorParameters
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+broken_server = StdioServerParameters(
+    command=sys.executable, args=["-c", "import sys; sys.exit(1)"]
+)
+
+hanging_server = StdioServerParameters(
+    command=sys.executable, args=["-c", "import time; time.sleep(30)"]
+)
+
+
+def kill(manager: ClientManager, name: str) -> MCPClientSession:
+    session = manager.sessions[name]
+    assert isinstance(session, MCPClientSession)
+    assert isinstance(session.transport, StdioTransport)
+    assert session.transport.subprocess is not None
+    session.transport.subprocess.kill()
+    return session
+
+
+async def wait_for(condition, timeout: float = 10):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.05)
+
+
+def test_backoff_delay():
+    policy = SupervisorParameters(initial_delay=1, multiplier=2, max_delay=5, jitter=0)
+
+    assert [policy.delay(i) for i in range(5)] == [1, 2, 4, 5, 5]
+
+    jittered = SupervisorParameters(initial_delay=1, jitter=0.5)
+    assert all(0.5 <= jittered.delay(0) <= 1.5 for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_supervisor_respawns_dead_server():
+    manager = ClientManager()
+    manager.supervisor = SupervisorParameters(initial_delay=0.05, jitter=0)
+
+    await manager.init({"test": test_server})
+
+    try:
+        await manager.list_tools()
+        dead = kill(manager, "test")
+
+        await wait_for(lambda: manager.sessions["test"] is not dead)
+
+        assert manager.supervisor_stats["test"].restarts == 1
+        assert manager.server_health() == {"test": True}
+
+        result = await manager.call_tool("test.echo", {"text": "back"})
+        assert result.content[0].text == "back"  # type: ignore[union-attr]
+
+        tools = await manager.list_tools()
+        assert "test.echo" in [tool.name for tool in tools]
+    finally:
+        await manager.remove_server("test")
+
+
+@pytest.mark.asyncio
+async def test_supervisor_gives_up():
+    manager = ClientManager()
+    manager.supervisor = SupervisorParameters(
+        initial_delay=0.01, jitter=0, max_attempts=2
+    )
+
+    await manager.init({"test": test_server})
+
+    try:
+        manager.server_parameters["test"] = broken_server
+        dead = kill(manager, "test")
+
+        await wait_for(
+            lambda: "test" in manager.supervisor_stats
+            and manager.supervisor_stats["test"].gave_up
+        )
+
+        stats = manager.supervisor_stats["test"]
+        assert stats.restarts == 0
+        assert stats.failed_attempts == 2
+        assert manager.sessions["test"] is dead
+        assert manager.unhealthy_servers() == ["test"]
+    finally:
+        await manager.remove_server("test")
+
+
+@pytest.mark.asyncio
+async def test_supervisor_times_out_hanging_restarts():
+    manager = ClientManager()
+    manager.supervisor = SupervisorParameters(
+        initial_delay=0.01, jitter=0, max_attempts=2
+    )
+
+    await manager.init({"test": test_server}, startup_timeout=10)
+    assert manager.startup_timeout == 10
+
+    try:
+        manager.startup_timeout = 0.5
+        manager.server_parameters["test"] = hanging_server
+        kill(manager, "test")
+
+        await wait_for(
+            lambda: "test" in manager.supervisor_stats
+            and manager.supervisor_stats["test"].gave_up
+        )
+
+        stats = manager.supervisor_stats["test"]
+        assert stats.failed_attempts == 2
+        assert "TimeoutError" in (stats.last_error or "")
+    finally:
+        await manager.remove_server("test")
@@ -0,0 +1,139 @@
+import sys
+from typing import Awaitable, Callable
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.catalog import ToolCatalog
+from easymcp.client.transports.stdio import StdioServerParameters
+
+
+def make_tool(name: str) -> types.Tool:
+    return types.Tool(name=name, inputSchema={"type": "object"})
+
+
+class CachingSession:
+    """session caching its tools until forced, and pushing change notifications"""
+
+    def __init__(self, *names: str):
+        self.tools = [make_tool(name) for name in names]
+        self.cached: types.ListToolsResult | None = None
+        self.callback: Callable[[], Awaitable[None]] | None = None
+
+    async def list_tools(self, force: bool = False) -> types.ListToolsResult:
+        if force or self.cached is None:
+            self.cached = types.ListToolsResult(tools=list(self.tools))
+        return self.cached
+
+    async def call_tool(self, tool_name: str, args: dict) -> types.CallToolResult:
+        raise NotImplementedError
+
+    async def register_tools_changed_callback(
+        self, callback: Callable[[], Awaitable[None]]
+    ) -> None:
+        self.callback = callback
+
+    async def change_tools(self, *names: str):
+        self.tools = [make_tool(name) for name in names]
+        assert self.callback is not None
+        await self.callback()
+
+
+def test_catalog_update_and_invalidate():
+    catalog = ToolCatalog()
+    catalog.update("a", [make_tool("one"), make_tool("two")])
+    catalog.update("b", [make_tool("one")])
+
+    assert catalog.is_fresh("a")
+    assert "a.one" in catalog
+    assert catalog.get("b.one").name == "b.one"
+    assert [tool.name for tool in catalog.tools("a")] == ["a.one", "a.two"]
+    assert len(catalog) == 3
+
+    catalog.invalidate("a")
+    assert not catalog.is_fresh("a")
+    assert "a.one" not in catalog
+    assert catalog.is_fresh("b")
+
+    view = catalog.view()
+    with pytest.raises(TypeError):
+        view["b.two"] = make_tool("two")  # type: ignore
+
+    catalog.remove("b")
+    assert len(catalog) == 0
+
+
+def test_catalog_update_racing_invalidation_stays_stale():
+    catalog = ToolCatalog()
+    generation = catalog.generation("a")
+    catalog.invalidate("a")
+    catalog.update("a", [make_tool("one")], generation)
+
+    assert "a.one" in catalog
+    assert not catalog.is_fresh("a")
+
+
+@pytest.mark.asyncio
+async def test_manager_catalog_incremental_refresh():
+    mgr = ClientManager()
+    await mgr.add_server(
+        "fastmcp",
+        StdioServerParameters(
+            command=sys.executable,
+            args=["-c", "from fastmcp_test import main; main()"],
+        ),
+    )
+
+    tools = await mgr.list_tools()
+    assert "fastmcp.get_random_bool" in mgr.tool_catalog
+    assert tools == list(mgr.tool_catalog.view().values())
+    assert (await mgr.list_tools())[0] is tools[0]
+
+    with pytest.raises(ValueError, match="not found"):
+        await mgr.call_tool("fastmcp.missing_tool", {})
+
+    notified = []
+
+    async def on_change():
+        notified.append(True)
+
+    await mgr.register_tools_changed_callback(on_change)
+
+    session = mgr.sessions["fastmcp"]
+    await session.handle_notification(  # type: ignore
+        types.ServerNotification(
+            types.ToolListChangedNotification(
+                method="notifications/tools/list_changed"
+            )
+        )
+    )
+
+    assert notified == [True]
+    assert not mgr.tool_catalog.is_fresh("fastmcp")
+
+    tools = await mgr.list_tools()
+    assert "fastmcp.get_random_bool" in [tool.name for tool in tools]
+
+    await mgr.remove_server("fastmcp")
+    assert len(mgr.tool_catalog) == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_refresh_bypasses_session_cache():
+    mgr = ClientManager()
+    session = CachingSession("one")
+    mgr.sessions["caching"] = session  # type: ignore[assignment]
+    await session.register_tools_changed_callback(
+        mgr._make_tools_changed_callback("caching")
+    )
+
+    assert [tool.name for tool in await mgr.list_tools()] == ["caching.one"]
+
+    # list_changed arrives while the session still holds its old snapshot
+    await session.change_tools("one", "two")
+    assert not mgr.tool_catalog.is_fresh("caching")
+
+    tools = await mgr.list_tools()
+    assert [tool.name for tool in tools] == ["caching.one", "caching.two"]
+    assert mgr.tool_catalog.is_fresh("caching")
@@ -0,0 +1,149 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from mcp import types
+
+from easymcp.client.ClientManager import ClientManager
+from easymcp.client.errors import TransportClosedError
+from easymcp.client.queues import MessageQueue
+from easymcp.client.requestmap import RequestMap
+from easymcp.client.sessions.mcp import MCPClientSession
+from easymcp.client.transports.stdio import StdioServerParameters, StdioTransport
+
+test_server = StdioServerParameters(
+    command=sys.executable, args=[str(Path(__file__).parent / "mcp_test_server.py")]
+)
+
+
+def make_request(request_id: int) -> types.JSONRPCRequest:
+    return types.JSONRPCRequest(jsonrpc="2.0", id=request_id, method="tools/call")
+
+
+@pytest.mark.asyncio
+async def test_request_map_fail_all():
+    queue: asyncio.Queue[types.JSONRPCMessage] = asyncio.Queue()
+    request_map = RequestMap(queue)
+
+    tasks = [asyncio.create_task(request_map.send_request(make_request(i))) for i in range(3)]
+    await asyncio.sleep(0)
+
+    request_map.fail_all(EOFError("gone"))
+
+    for task in tasks:
+        with pytest.raises(TransportClosedError):
+            await task
+
+    assert request_map.requests == {}
+
+    with pytest.raises(TransportClosedError):
+        await request_map.send_request(make_request(4))
+
+
+@pytest.mark.asyncio
+async def test_timeout_covers_waiting_for_a_full_queue():
+    queue = MessageQueue(1)
+    queue.put_nowait(types.JSONRPCMessage(make_request(0)))
+    request_map = RequestMap(queue)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(request_map.send_request(make_request(1), 0.2), 3)
+
+    # never sent, so neither queued nor cancelled
+    assert queue.qsize() == 1
+    assert request_map.requests == {}
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(
+            request_map.send_batch([make_request(2), make_request(3)], 0.2), 3
+        )
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_fail_all_releases_senders_blocked_on_a_full_queue():
+    queue = MessageQueue(1)
+    queue.put_nowait(types.JSONRPCMessage(make_request(0)))
+    request_map = RequestMap(queue)
+
+    single = asyncio.create_task(request_map.send_request(make_request(1)))
+    batch = asyncio.create_task(request_map.send_batch([make_request(2), make_request(3)]))
+    await asyncio.sleep(0.05)
+    assert not single.done() and not batch.done()
+
+    request_map.fail_all(EOFError("gone"))
+
+    for task in (single, batch):
+        with pytest.raises(TransportClosedError):
+            await asyncio.wait_for(task, 3)
+
+    # the blocked puts were withdrawn, nothing else got queued
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_session_fails_in_flight_requests_when_server_dies():
+    session = MCPClientSession(StdioTransport(test_server))
+    closed: list[BaseException] = []
+
+    async def on_closed(error: BaseException):
+        closed.append(error)
+
+    await session.init()
+    await session.register_transport_closed_callback(on_closed)
+    await session.start()
+
+    try:
+        assert session.healthy
+
+        call = asyncio.create_task(session.call_tool("sleep", {"seconds": 30}))
+        await asyncio.sleep(0.5)
+
+        assert isinstance(session.transport, StdioTransport)
+        assert session.transport.subprocess is not None
+        session.transport.subprocess.kill()
+
+        with pytest.raises(TransportClosedError):
+            await asyncio.wait_for(call, 5)
+
+        assert not session.healthy
+        assert session.request_map.requests == {}
+
+        await asyncio.sleep(0)
+        assert len(closed) == 1
+
+        with pytest.raises(TransportClosedError):
+            await session.list_tools(force=True)
+    finally:
+        await session.stop()
+
+
+@pytest.mark.asyncio
+async def test_manager_reports_dead_server():
+    manager = ClientManager()
+
+    await manager.init({"test": test_server})
+
+    try:
+        assert manager.server_health() == {"test": True}
+        await manager.list_tools()
+
+        session = manager.sessions["test"]
+        assert isinstance(session, MCPClientSession)
+        assert isinstance(session.transport, StdioTransport)
+        assert session.transport.subprocess is not None
+        session.transport.subprocess.kill()
+
+        for _ in range(50):
+            if manager.unhealthy_servers():
+                break
+            await asyncio.sleep(0.1)
+
+        assert manager.unhealthy_servers() == ["test"]
+        assert not manager.tool_catalog.is_fresh("test")
+
+        with pytest.raises(TransportClosedError):
+            await manager.call_tool("test.echo", {"text": "hi"})
+    finally:
+        await manager.remove_server("test")
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+from mcp import types
+
+from easymcp.client.iobuffers import writer
+from easymcp.client.queues import MessageQueue
+from easymcp.client.utils import create_request
+
+
+class RecordingTransport:
+    """bytes transport remembering every write"""
+
+    def __init__(self):
+        self.state = "started"
+        self.writes: list[tuple[bytes, ...]] = []
+
+    async def init(self) -> None: ...
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send(self, message: str) -> None:
+        raise AssertionError("bytes path expected")
+
+    async def receive(self) -> str:
+        raise NotImplementedError
+
+    async def send_bytes(self, *messages: bytes) -> None:
+        self.writes.append(messages)
+
+    async def receive_bytes(self) -> bytes:
+        raise NotImplementedError
+
+
+def message(request_id: int) -> types.JSONRPCMessage:
+    return types.JSONRPCMessage(create_request(request_id, "ping"))
+
+
+async def written(transport: RecordingTransport, count: int):
+    while sum(len(write) for write in transport.writes) < count:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_queued_messages_share_one_write():
+    transport = RecordingTransport()
+    queue = MessageQueue()
+    for i in range(10):
+        queue.put_nowait(message(i))
+
+    task = await writer(transport, queue)  # type: ignore[arg-type]
+    await asyncio.wait_for(written(transport, 10), 5)
+    task.cancel()
+
+    assert len(transport.writes) == 1
+    assert [json.loads(data)["id"] for data in transport.writes[0]] == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_max_batch_bytes():
+    transport = RecordingTransport()
+    queue = MessageQueue()
+    for i in range(10):
+        queue.put_nowait(message(i))
+
+    size = len(message(0).model_dump_json())
+
+    task = await writer(transport, queue, max_batch_bytes=size * 3)  # type: ignore[arg-type]
+    await asyncio.wait_for(written(transport, 10), 5)
+    task.cancel()
+
+    assert [len(write) for write in transport.writes] == [3, 3, 3, 1]
+    ids = [json.loads(data)["id"] for write in transport.writes for data in write]
+    assert ids == list(range(10))